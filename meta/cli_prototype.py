@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Aditi CLI prototype matching the phase-2 mockup specification."""
+
+import typer
+from typing import Optional
+from rich.console import Console
+
+app = typer.Typer(
+    name="aditi",
+    help="AsciiDoc DITA Integration - Prepare AsciiDoc files for migration to DITA",
+    add_completion=False,
+    rich_markup_mode="rich",
+    pretty_exceptions_show_locals=False,
+    context_settings={"help_option_names": ["--help"]},
+)
+
+console = Console()
+
+# Version info
+__version__ = "0.1.0"
+
+
+# Simulated command output, rendered with a single print per command
+INIT_OUTPUT = "\n".join([
+    "\n[bold green]Initializing Vale configuration...[/bold green]\n",
+    "[17:21:26] INFO     Existing .vale.ini backed up to .vale.ini.backup.20250727172126",
+    "           INFO     Created Vale configuration at .vale.ini",
+    "           INFO     Downloading AsciiDocDITA styles...",
+    "[17:21:27] INFO     Successfully downloaded AsciiDocDITA v0.2.0",
+    "           INFO     Vale configuration initialized successfully\n",
+    "[bold green]✓[/bold green] Vale initialized with AsciiDocDITA rules",
+    "\nNext steps:",
+    "  • Run [bold]aditi journey[/bold] to start an interactive migration journey",
+    "  • Run [bold]aditi check[/bold] to check files for DITA compatibility issues",
+])
+
+JOURNEY_OUTPUT = "\n".join([
+    "\n[bold blue]Welcome to the Aditi Migration Journey![/bold blue]\n",
+    "Checking Vale configuration... [green]✓ Found[/green]\n",
+    "📁 Repository: /home/sarah/docs/product-docs",
+    "🌿 Current branch: feature/dita-migration",
+    "📄 AsciiDoc files found: 52\n",
+    "[bold]Ready to start?[/bold] This journey will:",
+    "  1. Run prerequisite checks (ContentType)",
+    "  2. Check and fix Error-level issues",
+    "  3. Check and fix Warning-level issues",
+    "  4. Check and fix Suggestion-level issues",
+    "  5. Create a pull request with all changes\n",
+    "[dim]Press Enter to continue or Ctrl+C to exit[/dim]",
+])
+
+CHECK_OUTPUT = "\n".join([
+    "Running Vale with AsciiDocDITA rules...",
+    "\n[yellow]⚠[/yellow]  assemblies/assembly_configuring.adoc",
+    "   16:1  [red]error[/red]    Missing content type attribute    AsciiDocDITA.ContentType",
+    "\n[yellow]⚠[/yellow]  modules/proc_installing.adoc",
+    "   1:1   [red]error[/red]    Missing content type attribute    AsciiDocDITA.ContentType",
+    "\n[green]✓[/green]  modules/con_prerequisites.adoc",
+    "\n[bold]Summary:[/bold] 2 errors, 0 warnings in 3 files",
+])
+
+FIX_OUTPUT = "\n".join([
+    "Scanning for deterministic fixes...",
+    "\n[bold]EntityReference[/bold] (Fully deterministic)",
+    "  [green]✓[/green] modules/ref_api.adoc: Replaced &rarr; with →",
+    "  [green]✓[/green] modules/ref_api.adoc: Replaced &nbsp; with &#160;",
+    "\n[bold]ContentType[/bold] (Partially deterministic)",
+    "  [yellow]![/yellow] assemblies/assembly_configuring.adoc: Added placeholder",
+    "     [dim]// TODO: Review and set content type to one of:[/dim]",
+    "     [dim]// ASSEMBLY, CONCEPT, PROCEDURE, REFERENCE, SNIPPET[/dim]",
+    "     [dim]:_mod-docs-content-type: <PLACEHOLDER>[/dim]",
+])
+
+
+def version_callback(value: bool):
+    """Show version and exit."""
+    if value:
+        console.print(f"aditi version {__version__}")
+        raise typer.Exit()
+
+
+@app.callback()
+def main(
+    version: bool = typer.Option(
+        None,
+        "--version",
+        "-V",
+        help="Show version and exit",
+        callback=version_callback,
+        is_eager=True,
+    ),
+):
+    """
+    AsciiDoc DITA Integration - Prepare AsciiDoc files for migration to DITA
+    
+    [bold yellow]IMPORTANT:[/bold yellow]
+    - cd to the root directory of your repository before running aditi commands.
+    - Create a working branch with the latest changes in it.
+    """
+    pass
+
+
+@app.command()
+def init():
+    """Initialize Vale configuration for AsciiDocDITA rules."""
+    console.print(INIT_OUTPUT)
+
+
+@app.command()
+def journey():
+    """Start an interactive journey to migrate AsciiDoc files to DITA."""
+    console.print(JOURNEY_OUTPUT)
+
+
+@app.command()
+def check(
+    path: Optional[str] = typer.Argument(None, help="Path to check (defaults to current directory)"),
+    rule: Optional[str] = typer.Option(None, "--rule", "-r", help="Specific rule to check"),
+):
+    """Check AsciiDoc files for DITA compatibility issues."""
+    check_path = path or "."
+    
+    console.print(f"\n[bold]Checking AsciiDoc files in:[/bold] {check_path}")
+    
+    if rule:
+        console.print(f"[bold]Rule:[/bold] {rule}\n")
+    else:
+        console.print("[bold]Rules:[/bold] All AsciiDocDITA rules\n")
+    
+    # Simulate check output
+    console.print(CHECK_OUTPUT)
+
+
+@app.command()
+def fix(
+    path: Optional[str] = typer.Argument(None, help="Path to fix (defaults to current directory)"),
+    rule: Optional[str] = typer.Option(None, "--rule", "-r", help="Specific rule to fix"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be fixed without making changes"),
+):
+    """Fix deterministic DITA compatibility issues in AsciiDoc files."""
+    fix_path = path or "."
+    
+    console.print(f"\n[bold]Fixing deterministic issues in:[/bold] {fix_path}")
+    
+    if rule:
+        console.print(f"[bold]Rule:[/bold] {rule}")
+    else:
+        console.print("[bold]Rules:[/bold] All deterministic AsciiDocDITA rules")
+    
+    if dry_run:
+        console.print("[yellow]Mode: DRY RUN (no changes will be made)[/yellow]\n")
+    else:
+        console.print("\n")
+    
+    # Simulate fix output
+    console.print(FIX_OUTPUT)
+    
+    if not dry_run:
+        console.print("\n[bold green]✓[/bold green] Fixed 3 issues in 2 files")
+        console.print("\nRun [bold]git diff[/bold] to review changes")
+
+
+if __name__ == "__main__":
+    app()
\ No newline at end of file
@@ -1,6 +1,6 @@
 """Main entry point for python -m aditi."""
 
-from .cli import app
+from .cli import run
 
 if __name__ == "__main__":
-    app()
\ No newline at end of file
+    run()
@@ -1,53 +1,138 @@
 """Main CLI entry point for Aditi."""
 
+import functools
 import logging
+import os
+import re
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, List, Optional
 
 import typer
 from rich.console import Console
-from rich.logging import RichHandler
+from typer.core import TyperGroup
 
 from aditi.commands import init_command, check_command, journey_command, fix_command
 from aditi.commands.vale import vale_command, show_vale_version, list_vale_styles
 
-try:
-    import tomllib  # Python 3.11+
-except ImportError:
-    try:
-        import tomli as tomllib  # Fallback for older Python
-    except ImportError:
-        tomllib = None
-
 console = Console()
 
+# Parsed pyproject.toml versions keyed by (path, mtime_ns)
+_PYPROJECT_CACHE: dict[tuple[str, int], str] = {}
+
+
+@functools.lru_cache(maxsize=1)
 def get_version() -> str:
-    """Get version from pyproject.toml or fallback."""
-    if not tomllib:
-        return "unknown (tomllib not available)"
-    
-    # Look for pyproject.toml in the package directory and up the tree
-    current_dir = Path(__file__).parent
-    for _ in range(5):  # Search up to 5 levels up
-        pyproject_path = current_dir / "pyproject.toml"
-        if pyproject_path.exists():
-            try:
-                with open(pyproject_path, "rb") as f:
-                    data = tomllib.load(f)
-                    return data.get("project", {}).get("version", "unknown")
-            except Exception:
-                break
-        current_dir = current_dir.parent
-        if current_dir == current_dir.parent:  # Reached filesystem root
-            break
-    
-    # Fallback: try to get from package metadata
+    """Get version from package metadata, falling back to pyproject.toml."""
+    from importlib.metadata import PackageNotFoundError, version
+
     try:
-        from importlib.metadata import version
         return version("aditi")
-    except Exception:
-        return "unknown"
+    except PackageNotFoundError:
+        pass
+
+    # Development checkout without installed metadata: read pyproject.toml
+    try:
+        import tomllib  # Python 3.11+
+    except ImportError:
+        try:
+            import tomli as tomllib  # Fallback for older Python
+        except ImportError:
+            return "unknown (tomllib not available)"
+
+    # Look for pyproject.toml in the package directory and up to four of its
+    # ancestors, listing each directory once instead of stat-ing candidates
+    start = Path(__file__).resolve().parent
+    for directory in (start, *start.parents[:4]):
+        try:
+            with os.scandir(directory) as it:
+                if not any(entry.name == "pyproject.toml" and entry.is_file() for entry in it):
+                    continue
+        except OSError:
+            break
+        pyproject_path = directory / "pyproject.toml"
+        try:
+            key = (str(pyproject_path), pyproject_path.stat().st_mtime_ns)
+            cached = _PYPROJECT_CACHE.get(key)
+            if cached is not None:
+                return cached
+            with open(pyproject_path, "rb") as f:
+                data = tomllib.load(f)
+            version_str = data.get("project", {}).get("version", "unknown")
+            _PYPROJECT_CACHE[key] = version_str
+            return version_str
+        except Exception:
+            break
+
+    return "unknown"
+
+
+# The command comes from whichever Click build Typer uses, which may be
+# its vendored copy rather than the standalone package
+CompletionGetter = Callable[[Any, str, str], str]
+
+
+def _bind_completion_getter() -> Optional[CompletionGetter]:
+    """Select the completion-script generator supported by the installed Click."""
+    if hasattr(TyperGroup, "get_completion_script"):
+        # Older Click/Typer version
+        return lambda command, shell, prog: command.get_completion_script(shell, prog)
+    try:
+        from click.completion import get_completion_script as click_get_completion
+    except ImportError:
+        return None
+    return lambda command, shell, prog: click_get_completion(command, {}, shell, prog)
+
+
+_GET_COMPLETION = _bind_completion_getter()
+
+# Per-shell completion install destination, program name, write mode, and
+# the follow-up hint shown after installing
+_COMPLETION_TARGETS: dict[str, tuple[Callable[[], Path], str, str, str]] = {
+    "bash": (
+        lambda: Path.home() / ".bash_completion",
+        "aditi",
+        "append",
+        "Restart your shell or run: source ~/.bash_completion",
+    ),
+    "zsh": (
+        lambda: Path.home() / ".zsh" / "completions" / "_aditi",
+        "_aditi",
+        "write",
+        "Add this to your ~/.zshrc if not already present:\n"
+        "fpath=(~/.zsh/completions $fpath)\n"
+        "autoload -U compinit && compinit",
+    ),
+    "fish": (
+        lambda: Path.home() / ".config" / "fish" / "completions" / "aditi.fish",
+        "aditi",
+        "write",
+        "Restart your shell or run: source ~/.config/fish/completions/aditi.fish",
+    ),
+}
+
+# Delimiters for the aditi block in ~/.bash_completion
+_BASH_BLOCK_START = "# >>> aditi completion >>>"
+_BASH_BLOCK_END = "# <<< aditi completion <<<"
+_BASH_BLOCK_RE = re.compile(
+    rf"^{re.escape(_BASH_BLOCK_START)}\n.*?^{re.escape(_BASH_BLOCK_END)}\n?",
+    re.DOTALL | re.MULTILINE,
+)
+_BASH_LEGACY_MARKER = "# Aditi completion"
+
+_MANUAL_COMPLETION_HELP = "\n".join([
+    "[yellow]Shell completion generation not available in this environment.[/yellow]",
+    "\n[bold]Manual setup instructions:[/bold]",
+    "For bash, add this to your ~/.bashrc or ~/.bash_profile:",
+    "[dim]eval \"$(_ADITI_COMPLETE=bash_source aditi)\"[/dim]",
+    "\nFor zsh, add this to your ~/.zshrc:",
+    "[dim]eval \"$(_ADITI_COMPLETE=zsh_source aditi)\"[/dim]",
+    "\nFor fish, add this to your ~/.config/fish/config.fish:",
+    "[dim]eval (env _ADITI_COMPLETE=fish_source aditi)[/dim]",
+])
+
+_VALID_SHELLS = frozenset(("bash", "zsh", "fish", "powershell"))
+_VALID_SHELLS_STR = "bash, zsh, fish, powershell"
 
 app = typer.Typer(
     name="aditi",
@@ -66,28 +151,40 @@ app = typer.Typer(
 def setup_logging(verbose: bool = False) -> None:
     """Configure logging for the application.
     
+    Only the first call adds the handler; later calls just apply the
+    requested level.
+    
     Args:
         verbose: If True, set logging level to DEBUG
     """
     level = logging.DEBUG if verbose else logging.INFO
     
-    logging.basicConfig(
-        level=level,
-        format="%(message)s",
-        datefmt="[%X]",
-        handlers=[
-            RichHandler(
-                console=console,
-                rich_tracebacks=True,
-                tracebacks_show_locals=verbose,
-            )
-        ],
-    )
+    if getattr(setup_logging, "_configured", False):
+        logging.getLogger().setLevel(level)
+        handler = getattr(setup_logging, "_handler", None)
+        if handler is not None:
+            handler.tracebacks_show_locals = verbose
+    else:
+        from rich.logging import RichHandler
+        
+        handler = RichHandler(
+            console=console,
+            rich_tracebacks=True,
+            tracebacks_show_locals=verbose,
+        )
+        logging.basicConfig(
+            level=level,
+            format="%(message)s",
+            datefmt="[%X]",
+            handlers=[handler],
+        )
+        setup_logging._handler = handler  # type: ignore[attr-defined]
+        setup_logging._configured = True  # type: ignore[attr-defined]
     
     # Suppress verbose output from third-party libraries unless in verbose mode
-    if not verbose:
-        logging.getLogger("urllib3").setLevel(logging.WARNING)
-        logging.getLogger("docker").setLevel(logging.WARNING)
+    third_party_level = logging.NOTSET if verbose else logging.WARNING
+    logging.getLogger("urllib3").setLevel(third_party_level)
+    logging.getLogger("docker").setLevel(third_party_level)
 
 
 # Global verbose option
@@ -98,6 +195,30 @@ verbose_option = typer.Option(
     help="Enable verbose output",
 )
 
+# Shared options and arguments
+paths_argument = typer.Argument(
+    None,
+    help="Paths to process (files or directories). If not specified, uses configured directories.",
+    exists=True,
+    file_okay=True,
+    dir_okay=True,
+    readable=True,
+)
+
+rule_option = typer.Option(
+    None,
+    "--rule",
+    "-r",
+    help="Process only a specific rule (e.g., EntityReference)",
+)
+
+dry_run_option = typer.Option(
+    False,
+    "--dry-run",
+    "-d",
+    help="Show what would be changed without applying changes",
+)
+
 
 @app.command()
 def init(
@@ -141,20 +262,8 @@ def init(
 
 @app.command()
 def check(
-    paths: Optional[list[Path]] = typer.Argument(
-        None,
-        help="Paths to check (files or directories). If not specified, checks configured directories.",
-        exists=True,
-        file_okay=True,
-        dir_okay=True,
-        readable=True,
-    ),
-    rule: Optional[str] = typer.Option(
-        None,
-        "--rule",
-        "-r",
-        help="Check only specific rule (e.g., EntityReference)",
-    ),
+    paths: Optional[list[Path]] = paths_argument,
+    rule: Optional[str] = rule_option,
     verbose: bool = verbose_option,
     show_all: bool = typer.Option(
         False,
@@ -178,32 +287,15 @@ def check(
 
 @app.command()
 def fix(
-    paths: Optional[List[Path]] = typer.Argument(
-        None,
-        help="Paths to fix (files or directories). If not specified, uses configured directories.",
-        exists=True,
-        file_okay=True,
-        dir_okay=True,
-        readable=True,
-    ),
-    rule: Optional[str] = typer.Option(
-        None,
-        "--rule",
-        "-r",
-        help="Fix only specific rule (e.g., EntityReference)",
-    ),
+    paths: Optional[List[Path]] = paths_argument,
+    rule: Optional[str] = rule_option,
     interactive: bool = typer.Option(
         True,
         "--interactive/--non-interactive",
         "-i/-n",
         help="Run in interactive mode (prompt for confirmation)",
     ),
-    dry_run: bool = typer.Option(
-        False,
-        "--dry-run",
-        "-d",
-        help="Show what would be fixed without applying changes",
-    ),
+    dry_run: bool = dry_run_option,
     verbose: bool = verbose_option,
 ) -> None:
     """Fix deterministic DITA compatibility issues in AsciiDoc files.
@@ -226,10 +318,11 @@ def journey(
         dir_okay=True,
         readable=True,
     ),
+    # Journey's dry run also previews configuration, so it keeps its own help
     dry_run: bool = typer.Option(
         False,
         "--dry-run",
-        "-d", 
+        "-d",
         help="Show what would be configured and fixed without making changes",
     ),
     clear: bool = typer.Option(
@@ -294,6 +387,37 @@ def vale(
     vale_command(paths, output_format, pretty)
 
 
+def _write_completion_block(completion_file: Path, script: str) -> bool:
+    """Add or replace the delimited aditi block in a shared completion file.
+    
+    Returns:
+        False if the file already has a legacy, undelimited aditi entry
+    """
+    block = f"{_BASH_BLOCK_START}\n{script}\n{_BASH_BLOCK_END}\n"
+    
+    # One open: read the existing file, then rewrite or append
+    with completion_file.open('a+') as f:
+        f.seek(0)
+        content = f.read()
+        if _BASH_BLOCK_RE.search(content):
+            f.seek(0)
+            f.truncate()
+            f.write(_BASH_BLOCK_RE.sub(lambda _: block, content, count=1))
+        elif _BASH_LEGACY_MARKER in content:
+            return False
+        else:
+            f.write(f"\n{block}")
+    return True
+
+
+@functools.lru_cache(maxsize=1)
+def _click_command() -> Any:
+    """Build the Click command tree for the Typer app on first use."""
+    from typer.main import get_command
+
+    return get_command(app)
+
+
 @app.command()
 def completion(
     shell: Optional[str] = typer.Argument(
@@ -322,71 +446,28 @@ def completion(
     - aditi completion bash --show      # Show bash completion script
     - aditi completion zsh --install    # Install zsh completion
     """
-    import click
-    from typer.main import get_command
-    
-    # Get the click command from typer app
-    click_command = get_command(app)
-    
-    # Check if completion is available
-    completion_available = False
-    get_completion_func = None
-    
-    if hasattr(click_command, 'get_completion_script'):
-        # Older Click/Typer version
-        completion_available = True
-        get_completion_func = click_command.get_completion_script
-    else:
-        try:
-            from click.completion import get_completion_script as click_get_completion
-            completion_available = True
-            get_completion_func = lambda shell, prog: click_get_completion(click_command, {}, shell, prog)
-        except ImportError:
-            pass
-    
-    if not completion_available:
-        console.print("[yellow]Shell completion generation not available in this environment.[/yellow]")
-        console.print("\n[bold]Manual setup instructions:[/bold]")
-        console.print("For bash, add this to your ~/.bashrc or ~/.bash_profile:")
-        console.print(f"[dim]eval \"$(_ADITI_COMPLETE=bash_source aditi)\"[/dim]")
-        console.print("\nFor zsh, add this to your ~/.zshrc:")
-        console.print(f"[dim]eval \"$(_ADITI_COMPLETE=zsh_source aditi)\"[/dim]")
-        console.print("\nFor fish, add this to your ~/.config/fish/config.fish:")
-        console.print(f"[dim]eval (env _ADITI_COMPLETE=fish_source aditi)[/dim]")
+    if _GET_COMPLETION is None:
+        console.print(_MANUAL_COMPLETION_HELP)
         return
     
-    # Detect shell if not provided
+    # Detect shell if not provided, defaulting to bash
     if not shell:
-        import os
-        shell_env = os.environ.get('SHELL', '')
-        if 'bash' in shell_env:
-            shell = 'bash'
-        elif 'zsh' in shell_env:
-            shell = 'zsh'
-        elif 'fish' in shell_env:
-            shell = 'fish'
-        else:
-            shell = 'bash'  # Default fallback
+        shell_name = os.environ.get('SHELL', '').rpartition('/')[2]
+        shell = shell_name if shell_name in _COMPLETION_TARGETS else 'bash'
     
     # Validate shell
-    valid_shells = ['bash', 'zsh', 'fish', 'powershell']
-    if shell not in valid_shells:
-        console.print(f"[red]Error: Unsupported shell '{shell}'. Supported shells: {', '.join(valid_shells)}[/red]")
+    if shell not in _VALID_SHELLS:
+        console.print(f"[red]Error: Unsupported shell '{shell}'. Supported shells: {_VALID_SHELLS_STR}[/red]")
         raise typer.Exit(1)
     
     if show:
         # Show completion script
+        if shell not in _COMPLETION_TARGETS:
+            console.print(f"[red]Completion script generation not supported for {shell}[/red]")
+            raise typer.Exit(1)
+        _, prog_name, _, _ = _COMPLETION_TARGETS[shell]
         try:
-            if shell == 'bash':
-                script = get_completion_func('bash', 'aditi')
-            elif shell == 'zsh':
-                script = get_completion_func('zsh', '_aditi')
-            elif shell == 'fish':
-                script = get_completion_func('fish', 'aditi')
-            else:
-                console.print(f"[red]Completion script generation not supported for {shell}[/red]")
-                raise typer.Exit(1)
-            
+            script = _GET_COMPLETION(_click_command(), shell, prog_name)
             console.print(f"[dim]# Completion script for {shell}[/dim]")
             console.print(script)
         except Exception as e:
@@ -396,67 +477,27 @@ def completion(
     elif install:
         # Install completion
         console.print(f"[bold]Installing completion for {shell}...[/bold]")
+        if shell not in _COMPLETION_TARGETS:
+            console.print(f"[red]Installation not supported for {shell}[/red]")
+            raise typer.Exit(1)
+        target, prog_name, mode, hint = _COMPLETION_TARGETS[shell]
         
         try:
-            if shell == 'bash':
-                if hasattr(click_command, 'get_completion_script'):
-                    script = click_command.get_completion_script('bash', 'aditi')
-                else:
-                    script = get_completion_script(click_command, {}, 'bash', 'aditi')
-                completion_file = Path.home() / '.bash_completion'
-                marker = "# Aditi completion"
-                
-                # Read existing file or create empty
-                if completion_file.exists():
-                    content = completion_file.read_text()
-                else:
-                    content = ""
-                
-                # Check if already installed
-                if marker in content:
-                    console.print("[yellow]Completion already installed for bash[/yellow]")
-                else:
-                    # Append completion
-                    with completion_file.open('a') as f:
-                        f.write(f"\n{marker}\n{script}\n")
-                    console.print(f"[green]✓ Completion installed to {completion_file}[/green]")
-                    console.print("[dim]Restart your shell or run: source ~/.bash_completion[/dim]")
+            completion_file = target()
+            completion_file.parent.mkdir(parents=True, exist_ok=True)
+            script = _GET_COMPLETION(_click_command(), shell, prog_name)
             
-            elif shell == 'zsh':
-                # For zsh, we need to add to a completion directory
-                zsh_completions = Path.home() / '.zsh' / 'completions'
-                zsh_completions.mkdir(parents=True, exist_ok=True)
-                completion_file = zsh_completions / '_aditi'
-                
-                if hasattr(click_command, 'get_completion_script'):
-                    script = click_command.get_completion_script('zsh', '_aditi')
-                else:
-                    script = get_completion_script(click_command, {}, 'zsh', '_aditi')
+            if mode == 'append':
+                installed = _write_completion_block(completion_file, script)
+            else:
                 completion_file.write_text(script)
-                
-                console.print(f"[green]✓ Completion installed to {completion_file}[/green]")
-                console.print("[dim]Add this to your ~/.zshrc if not already present:[/dim]")
-                console.print(f"[dim]fpath=(~/.zsh/completions $fpath)[/dim]")
-                console.print("[dim]autoload -U compinit && compinit[/dim]")
+                installed = True
             
-            elif shell == 'fish':
-                # Fish completions go in ~/.config/fish/completions/
-                fish_completions = Path.home() / '.config' / 'fish' / 'completions'
-                fish_completions.mkdir(parents=True, exist_ok=True)
-                completion_file = fish_completions / 'aditi.fish'
-                
-                if hasattr(click_command, 'get_completion_script'):
-                    script = click_command.get_completion_script('fish', 'aditi')
-                else:
-                    script = get_completion_script(click_command, {}, 'fish', 'aditi')
-                completion_file.write_text(script)
-                
+            if installed:
                 console.print(f"[green]✓ Completion installed to {completion_file}[/green]")
-                console.print("[dim]Restart your shell or run: source ~/.config/fish/completions/aditi.fish[/dim]")
-            
+                console.print(f"[dim]{hint}[/dim]")
             else:
-                console.print(f"[red]Installation not supported for {shell}[/red]")
-                raise typer.Exit(1)
+                console.print(f"[yellow]Completion already installed for {shell}[/yellow]")
                 
         except Exception as e:
             console.print(f"[red]Error installing completion: {e}[/red]")
@@ -499,5 +540,17 @@ def main(
         raise typer.Exit(2)
 
 
+def run() -> None:
+    """Console-script entry point.
+    
+    A bare ``--version`` is answered directly, without building the Click
+    command tree that ``app()`` constructs on every invocation.
+    """
+    if len(sys.argv) == 2 and sys.argv[1] in ("-V", "--version"):
+        console.print(f"aditi version {get_version()}")
+        return
+    app()
+
+
 if __name__ == "__main__":
-    app()
\ No newline at end of file
+    run()
\ No newline at end of file
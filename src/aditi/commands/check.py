@@ -1,19 +1,32 @@
 """Check command implementation for Aditi CLI."""
 
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
 from ..config import ConfigManager
-from ..vale_container import ValeContainer
+from ..vale_container import get_shared_container, release_shared_container
 from ..processor import RuleProcessor
+from ..scanner import iter_adoc_files
 from ..rules import FixType
 
 console = Console()
 
+# File validation is bound by stat() latency rather than CPU, so overlap
+# more calls than there are cores
+_VALIDATION_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# Number of invalid files listed individually in the warning
+_INVALID_FILES_SHOWN = 5
+
+# Number of violations listed per rule in verbose output
+_VERBOSE_ROWS_PER_RULE = 10
+
 
 def check_command(
     paths: List[Path] = typer.Argument(
@@ -80,9 +93,18 @@ def check_command(
             raise typer.Exit(1)
         paths_to_check = config.allowed_paths
     else:
+        # Memoize allowed-path checks; each path is tested more than once below
+        allowed_cache: Dict[Path, bool] = {}
+        
+        def _allowed(path: Path) -> bool:
+            resolved = path.resolve()
+            if resolved not in allowed_cache:
+                allowed_cache[resolved] = config.is_path_allowed(resolved)
+            return allowed_cache[resolved]
+        
         # If paths are provided and no config was just created, add them to allowed paths
         skipped_paths = []
-        if not config.allowed_paths or all(not config.is_path_allowed(p) for p in paths):
+        if not config.allowed_paths or not any(_allowed(p) for p in paths):
             console.print("\n🔧 Adding specified paths to configuration...")
             for path in paths:
                 if path.exists():
@@ -96,7 +118,7 @@ def check_command(
             # Validate paths against configuration
             paths_to_check = []
             for path in paths:
-                if config.is_path_allowed(path):
+                if _allowed(path):
                     paths_to_check.append(path)
                 else:
                     skipped_paths.append(path)
@@ -121,57 +143,56 @@ def check_command(
         
     # Collect all .adoc files with validation
     adoc_files = []
-    invalid_files = []
     
+    # Only the first few invalid files are reported, so keep just those
+    # and count the rest
+    invalid_head: List[str] = []
+    invalid_count = 0
+    
+    # Gather candidates first; explicitly named files are kept even if they
+    # are symlinks, while directory contents follow the symlink setting.
+    # The suffix test runs first so other paths cost a single stat.
+    candidates: List[Path] = []
     for path in paths_to_check:
-        if path.is_file() and path.suffix == ".adoc":
-            # Validate file is readable and not empty
-            try:
-                if path.stat().st_size == 0:
-                    invalid_files.append(f"{path} (empty file)")
-                    continue
-                # Try to read first few bytes to ensure it's readable
-                with open(path, 'r', encoding='utf-8') as f:
-                    f.read(100)  # Just check if we can read the start
-                adoc_files.append(path)
-            except (OSError, UnicodeDecodeError, PermissionError) as e:
-                invalid_files.append(f"{path} ({e})")
+        if path.suffix == ".adoc" and path.is_file():
+            candidates.append(path)
         elif path.is_dir():
-            # Find all .adoc files recursively, handling symlinks based on config
-            for adoc_file in path.rglob("*.adoc"):
-                try:
-                    # Check if file is accessible and not empty
-                    if adoc_file.stat().st_size == 0:
-                        invalid_files.append(f"{adoc_file} (empty file)")
-                        continue
-                        
-                    if config.ignore_symlinks and adoc_file.is_symlink():
-                        continue
-                        
-                    # Try to read first few bytes to ensure it's readable
-                    with open(adoc_file, 'r', encoding='utf-8') as f:
-                        f.read(100)  # Just check if we can read the start
-                    adoc_files.append(adoc_file)
-                except (OSError, UnicodeDecodeError, PermissionError) as e:
-                    invalid_files.append(f"{adoc_file} ({e})")
+            candidates.extend(iter_adoc_files(path, config.ignore_symlinks))
+    
+    # Validate candidates concurrently; map() preserves discovery order
+    if candidates:
+        workers = min(_VALIDATION_WORKERS, len(candidates))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            errors = executor.map(_validate_adoc, candidates)
+            for candidate, error in zip(candidates, errors, strict=True):
+                if error is None:
+                    adoc_files.append(candidate)
+                else:
+                    invalid_count += 1
+                    if len(invalid_head) < _INVALID_FILES_SHOWN:
+                        invalid_head.append(error)
+    
+    # Drop files reached through more than one path (overlapping allowed
+    # paths, symlinks) and hand Vale the rest in directory order
+    adoc_files = sorted({p.resolve(): p for p in adoc_files}.values(), key=str)
     
     # Report any invalid files found
-    if invalid_files:
-        console.print(f"[yellow]Warning: Skipping {len(invalid_files)} invalid file(s):[/yellow]")
-        for invalid_file in invalid_files[:5]:  # Show first 5
+    if invalid_count:
+        console.print(f"[yellow]Warning: Skipping {invalid_count} invalid file(s):[/yellow]")
+        for invalid_file in invalid_head:
             console.print(f"  • {invalid_file}")
-        if len(invalid_files) > 5:
-            console.print(f"  ... and {len(invalid_files) - 5} more")
+        if invalid_count > len(invalid_head):
+            console.print(f"  ... and {invalid_count - len(invalid_head)} more")
                     
     if not adoc_files:
         console.print("[yellow]No valid .adoc files found to check.[/yellow]")
-        if invalid_files:
-            console.print("All found .adoc files had issues (empty, unreadable, or permission errors).")
+        if invalid_count:
+            console.print("All found .adoc files had issues (unreadable or permission errors).")
         raise typer.Exit(0)
         
     # Initialize Vale container
     try:
-        vale_container = ValeContainer()
+        vale_container = get_shared_container()
         # Ensure Vale image exists
         vale_container.ensure_image_exists()
             
@@ -203,24 +224,73 @@ def check_command(
         console.print(f"[red]Error during check:[/red] {e}")
         raise typer.Exit(1)
     finally:
-        # Cleanup Vale container
+        # Release the shared Vale container
         if 'vale_container' in locals():
-            vale_container.cleanup()
+            release_shared_container()
+
+
+def _adoc_file_problem(path: Path) -> Optional[str]:
+    """Check that an .adoc file can be handed to Vale.
+    
+    Opens the file without reading from it, which proves it is readable
+    even where permission bits alone would mislead (ACLs, root), and
+    stats the open descriptor. Vale reads the content itself and reports
+    decoding problems. Empty files are passed through, since Vale simply
+    reports nothing for them.
+    
+    Args:
+        path: File to validate
+        
+    Returns:
+        A short reason the file should be skipped, or None if it is usable
+    """
+    try:
+        # O_NONBLOCK keeps a stray FIFO from blocking the open
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_NONBLOCK", 0))
+    except PermissionError:
+        return "permission denied"
+    except OSError as e:
+        return str(e)
+    try:
+        st = os.fstat(fd)
+    finally:
+        os.close(fd)
+    if not stat.S_ISREG(st.st_mode):
+        return "not a regular file"
+    return None
+
+
+def _validate_adoc(path: Path) -> Optional[str]:
+    """Validate a candidate .adoc file.
+    
+    Args:
+        path: Candidate file
+        
+    Returns:
+        None if the file is usable, or the reason it should be reported
+        as invalid
+    """
+    problem = _adoc_file_problem(path)
+    if problem:
+        return f"{path} ({problem})"
+    return None
 
 
 def _display_verbose_results(result, processor, show_all=False, export_files=None):
     """Display verbose results with detailed violation information."""
+    from rich.table import Table
+    
     console.print("\n📊 Detailed Analysis Results\n")
     
-    # Group violations by rule
+    # Group violations by rule, keeping only the rows that will be shown
     parser = processor.vale_parser
-    violations_by_rule = parser.group_by_rule(result.violations_found)
+    violations_by_rule = parser.sample_by_rule(result.violations_found, _VERBOSE_ROWS_PER_RULE)
     
-    # Get all rules for descriptions
-    rules = processor.rule_registry.get_all_rules()
-    rule_map = {rule.name: rule for rule in rules}
+    # Look up rules by name for descriptions
+    rule_map = processor.rule_registry.by_name
+    cwd = Path.cwd()
     
-    for rule_name, violations in violations_by_rule.items():
+    for rule_name, (count, display_violations) in violations_by_rule.items():
         rule = rule_map.get(rule_name)
         
         # Determine fix type emoji and text
@@ -238,7 +308,7 @@ def _display_verbose_results(result, processor, show_all=False, export_files=Non
             emoji = "❓"
             fix_text = "Fix: Unknown"
             
-        console.print(f"{emoji} [bold]{rule_name}[/bold] ({len(violations)} {'issue' if len(violations) == 1 else 'issues'})")
+        console.print(f"{emoji} [bold]{rule_name}[/bold] ({count} {'issue' if count == 1 else 'issues'})")
         
         if rule and rule.description:
             console.print(f"{rule.description}")
@@ -251,11 +321,11 @@ def _display_verbose_results(result, processor, show_all=False, export_files=Non
         table.add_column("Line", style="yellow")
         table.add_column("Message", style="white")
         
-        # Limit to first 10 violations in non-verbose mode
-        display_violations = violations[:10] if len(violations) > 10 else violations
-        
         for violation in display_violations:
-            rel_path = violation.file_path.relative_to(Path.cwd())
+            try:
+                rel_path = violation.file_path.relative_to(cwd)
+            except ValueError:
+                rel_path = violation.file_path
             table.add_row(
                 str(rel_path),
                 str(violation.line),
@@ -264,8 +334,8 @@ def _display_verbose_results(result, processor, show_all=False, export_files=Non
             
         console.print(table)
         
-        if len(violations) > 10:
-            console.print(f"  ... and {len(violations) - 10} more\n")
+        if count > len(display_violations):
+            console.print(f"  ... and {count - len(display_violations)} more\n")
         else:
             console.print()
             
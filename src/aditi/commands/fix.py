@@ -1,19 +1,16 @@
 """Fix command implementation for applying DITA compatibility fixes."""
 
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-import questionary
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.table import Table
 
 from ..config import ConfigManager
-from ..vale_container import ValeContainer
+from ..vale_container import get_shared_container, release_shared_container
 from ..processor import RuleProcessor
-from ..rules import FixType
+from ..scanner import iter_adoc_files
+from ..rules import INFORMATIONAL_RULES, FixType
 
 console = Console()
 
@@ -45,11 +42,16 @@ def fix_command(
             raise typer.Exit(1)
         paths_to_fix = config.allowed_paths or config.selected_directories
     else:
-        # Validate paths against configuration
+        # Validate paths against configuration, checking each distinct
+        # resolved path only once
+        allowed_cache: Dict[Path, bool] = {}
         paths_to_fix = []
         skipped_paths = []
         for path in paths:
-            if config.is_path_allowed(path):
+            resolved = path.resolve()
+            if resolved not in allowed_cache:
+                allowed_cache[resolved] = config.is_path_allowed(resolved)
+            if allowed_cache[resolved]:
                 paths_to_fix.append(path)
             else:
                 skipped_paths.append(path)
@@ -75,21 +77,28 @@ def fix_command(
     # Collect all .adoc files
     adoc_files = []
     for path in paths_to_fix:
-        if path.is_file() and path.suffix == ".adoc":
+        if path.suffix == ".adoc" and path.is_file():
             adoc_files.append(path)
         elif path.is_dir():
             # Find all .adoc files recursively, excluding symlinks
-            for adoc_file in path.rglob("*.adoc"):
-                if not adoc_file.is_symlink():
-                    adoc_files.append(adoc_file)
+            adoc_files.extend(iter_adoc_files(path, ignore_symlinks=True))
+    
+    # Drop files reached through more than one path and keep directory order
+    adoc_files = sorted({p.resolve(): p for p in adoc_files}.values(), key=str)
                     
     if not adoc_files:
         console.print("[yellow]No .adoc files found to fix.[/yellow]")
         raise typer.Exit(0)
     
+    # Deferred so that other commands and --help don't pay for loading them
+    import questionary
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
+    
     # Initialize Vale container
     try:
-        vale_container = ValeContainer()
+        vale_container = get_shared_container()
         vale_container.ensure_image_exists()
         
         # Initialize processor
@@ -120,22 +129,22 @@ def fix_command(
         else:
             violations = check_result.violations_found
         
-        # Group violations by fix type
+        # Every rule's can_fix matches on its own name, so a name lookup finds
+        # the same rule as get_rule_for_violation without scanning the registry.
+        # Informational suggestion-level rules are skipped per GitHub issue #26.
+        rules_by_name = processor.rule_registry.by_name
+        fixable_names = {
+            name for name, rule_instance in rules_by_name.items()
+            if rule_instance.fix_type in (FixType.FULLY_DETERMINISTIC, FixType.PARTIALLY_DETERMINISTIC)
+        } - INFORMATIONAL_RULES
+        
+        # Group violations by fix type in a single pass
         fixable_violations = []
         non_fixable_violations = []
-        
-        # Skip informational suggestion-level rules per GitHub issue #26
-        informational_rules = {"AttributeReference", "ConditionalCode", "IncludeDirective", "TagDirective"}
-        
         for violation in violations:
-            # Skip informational rules entirely
-            if violation.rule_name in informational_rules:
-                continue
-                
-            rule_instance = processor.rule_registry.get_rule_for_violation(violation)
-            if rule_instance and rule_instance.fix_type in [FixType.FULLY_DETERMINISTIC, FixType.PARTIALLY_DETERMINISTIC]:
+            if violation.rule_name in fixable_names:
                 fixable_violations.append(violation)
-            else:
+            elif violation.rule_name not in INFORMATIONAL_RULES:
                 non_fixable_violations.append(violation)
         
         # Show summary
@@ -161,7 +170,7 @@ def fix_command(
             table.add_column("Count", style="green")
             
             for rule_name, rule_violations in violations_by_rule.items():
-                rule_instance = processor.rule_registry.get_rule(rule_name)
+                rule_instance = rules_by_name.get(rule_name)
                 if rule_instance:
                     fix_type = "Fully Deterministic" if rule_instance.fix_type == FixType.FULLY_DETERMINISTIC else "Partially Deterministic"
                     table.add_row(rule_name, fix_type, str(len(rule_violations)))
@@ -183,30 +192,19 @@ def fix_command(
         if not dry_run:
             console.print(f"\n⚡ Applying fixes...\n")
             
-            # Get unique files with fixable violations
-            files_to_fix = list(set(v.file_path for v in fixable_violations))
+            # Get unique files with fixable violations, resolving each file
+            # once rather than once per violation, in directory order. The
+            # resolved path only detects duplicates; the processor gets the
+            # path as found, since a symlink may resolve outside the project
+            # root that the Vale container mounts.
+            unique_files = dict.fromkeys(v.file_path for v in fixable_violations)
+            files_to_fix = sorted({p.resolve(): p for p in unique_files}.values(), key=str)
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Processing files...", total=len(files_to_fix))
-                
-                total_fixes_applied = 0
-                files_modified = 0
-                
-                for file_path in files_to_fix:
-                    # Process just this file with rule filter
-                    result = processor.process_files([file_path], dry_run=False, rule_filter=rule)
-                    
-                    if result.fixes_applied:
-                        total_fixes_applied += len(result.fixes_applied)
-                        files_modified += 1
-                    
-                    progress.update(task, advance=1)
+            # Apply fixes to all files in one Vale run; the processor
+            # reports per-file progress itself
+            result = processor.process_files(files_to_fix, dry_run=False, rule_filter=rule)
+            total_fixes_applied = len(result.fixes_applied)
+            files_modified = len(result.files_modified)
             
             # Show results
             console.print(f"\n✅ Fix complete!\n")
@@ -227,17 +225,17 @@ def fix_command(
             console.print("\n🔍 [bold]Dry Run Results[/bold] (no changes made)\n")
             
             violations_by_file = processor.vale_parser.group_by_file(fixable_violations)
+            cwd = Path.cwd()
             
             for file_path, file_violations in list(violations_by_file.items())[:5]:
                 try:
-                    rel_path = file_path.relative_to(Path.cwd())
+                    rel_path = file_path.relative_to(cwd)
                 except ValueError:
                     rel_path = file_path
                 console.print(f"[cyan]{rel_path}[/cyan]")
                 
                 for violation in file_violations[:3]:
-                    rule_instance = processor.rule_registry.get_rule_for_violation(violation)
-                    if rule_instance:
+                    if violation.rule_name in rules_by_name:
                         console.print(f"  Line {violation.line}: {violation.rule_name} - {violation.message}")
                 
                 if len(file_violations) > 3:
@@ -253,6 +251,6 @@ def fix_command(
         console.print(f"[red]Error during fix:[/red] {e}")
         raise typer.Exit(1)
     finally:
-        # Cleanup Vale container
+        # Release the shared Vale container
         if 'vale_container' in locals():
-            vale_container.cleanup()
\ No newline at end of file
+            release_shared_container()
\ No newline at end of file
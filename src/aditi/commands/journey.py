@@ -1,38 +1,55 @@
 """Journey command implementation for guided DITA preparation workflow."""
 
+import functools
+import hashlib
+import heapq
+import json
+import os
+import shutil
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
-import questionary
-from questionary import Style
 import typer
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.table import Table
 
-from ..config import ConfigManager
-from ..scanner import DirectoryScanner
-from ..vale_container import ValeContainer
+from .. import __version__
+from ..config import ConfigManager, SessionState
+from ..scanner import DirectoryScanner, count_adoc_files, iter_adoc_files, iter_adoc_paths
+from ..vale_container import ValeContainer, get_shared_container, release_shared_container
 from ..processor import RuleProcessor
-from ..rules import FixType
+from ..rules import INFORMATIONAL_RULES, FixType, Rule
+from ..vale_parser import Violation, load_vale_json
 
 console = Console()
 
 
-def get_path_suggestions(root_path: Path, partial_path: str) -> List[str]:
+# Most suggestions offered for a mistyped path
+_MAX_PATH_SUGGESTIONS = 5
+
+
+def get_path_suggestions(root_path: Path, partial_path: str,
+                         top_level_dirs: Optional[List[str]] = None) -> List[str]:
     """Get path suggestions based on partial input.
     
     Args:
         root_path: Repository root
         partial_path: Partial path entered by user
+        top_level_dirs: Cached result of _list_subdirectories(root_path),
+            used instead of listing the root again
         
     Returns:
         List of suggested complete paths
     """
-    suggestions = []
+    suggestions: List[str] = []
     
     # Clean the partial path
     partial_path = partial_path.strip()
@@ -43,36 +60,56 @@ def get_path_suggestions(root_path: Path, partial_path: str) -> List[str]:
     
     if '/' in partial_path:
         # User is typing a nested path
-        parent_parts = partial_path.rsplit('/', 1)[0]
-        search_term = partial_path.rsplit('/', 1)[1].lower()
-        parent_path = root_path / parent_parts
+        parent_parts, search_term = partial_path.rsplit('/', 1)
+        search_term = search_term.lower()
         
-        if parent_path.exists() and parent_path.is_dir():
-            try:
-                for item in parent_path.iterdir():
-                    if item.is_dir() and item.name.lower().startswith(search_term):
-                        suggestions.append(f"{parent_parts}/{item.name}")
-            except:
-                pass
+        # Match names before checking the entry type, which scandir
+        # usually answers without another stat
+        try:
+            with os.scandir(root_path / parent_parts) as entries:
+                for entry in entries:
+                    try:
+                        if entry.name.lower().startswith(search_term) and entry.is_dir():
+                            suggestions.append(f"{parent_parts}/{entry.name}")
+                    except OSError:
+                        continue
+                    if len(suggestions) == _MAX_PATH_SUGGESTIONS:
+                        break
+        except OSError:
+            pass
     else:
         # Top-level directory search
         search_term = partial_path.lower()
-        try:
-            for item in root_path.iterdir():
-                if item.is_dir() and not item.name.startswith('.'):
-                    if item.name.lower().startswith(search_term):
-                        suggestions.append(item.name)
-        except:
-            pass
+        if top_level_dirs is None:
+            top_level_dirs = _list_subdirectories(root_path)
+        for name in top_level_dirs:
+            if name.lower().startswith(search_term):
+                suggestions.append(name)
+                if len(suggestions) == _MAX_PATH_SUGGESTIONS:
+                    break
     
-    return suggestions[:5]  # Return max 5 suggestions
+    return suggestions
 
 
-def get_session_age(session_started: Optional[str]) -> Optional[str]:
+@functools.lru_cache(maxsize=32)
+def _parse_session_start(session_started: str) -> datetime:
+    """Parse a session start timestamp, once per distinct value.
+    
+    Args:
+        session_started: ISO timestamp of session start
+        
+    Returns:
+        Parsed start time
+    """
+    return datetime.fromisoformat(session_started)
+
+
+def get_session_age(session_started: Optional[str], now: Optional[datetime] = None) -> Optional[str]:
     """Get human-readable age of session.
     
     Args:
         session_started: ISO timestamp of session start
+        now: Current time, so callers can share one clock reading
         
     Returns:
         Human-readable age string or None if no session
@@ -81,29 +118,24 @@ def get_session_age(session_started: Optional[str]) -> Optional[str]:
         return None
         
     try:
-        start_time = datetime.fromisoformat(session_started)
-        age = datetime.now() - start_time
-        
-        if age.days > 0:
-            return f"{age.days} day{'s' if age.days > 1 else ''}"
-        elif age.seconds >= 3600:
-            hours = age.seconds // 3600
-            return f"{hours} hour{'s' if hours > 1 else ''}"
-        elif age.seconds >= 60:
-            minutes = age.seconds // 60
-            return f"{minutes} minute{'s' if minutes > 1 else ''}"
-        else:
-            return "less than a minute"
+        age = (now or datetime.now()) - _parse_session_start(session_started)
     except Exception:
         return "unknown time"
+    
+    days, seconds = divmod(max(int(age.total_seconds()), 0), 86400)
+    hours, seconds = divmod(seconds, 3600)
+    for count, unit in ((days, "day"), (hours, "hour"), (seconds // 60, "minute")):
+        if count:
+            return f"{count} {unit}{'s' if count > 1 else ''}"
+    return "less than a minute"
 
 
-def display_session_info(session) -> None:
+def display_session_info(session: SessionState, now: Optional[datetime] = None) -> None:
     """Display current session information."""
     if not session.session_started:
         return
         
-    age = get_session_age(session.session_started)
+    age = get_session_age(session.session_started, now)
     console.print(f"\n📋 [bold]Found existing journey session[/bold] ({age} old)")
     
     if session.journey_progress:
@@ -123,9 +155,6 @@ def display_session_info(session) -> None:
 
 def backup_session(config_manager: ConfigManager) -> None:
     """Backup current session to session-backups directory."""
-    import json
-    import shutil
-    
     session_file = config_manager.session_file
     if not session_file.exists():
         return
@@ -138,19 +167,25 @@ def backup_session(config_manager: ConfigManager) -> None:
     timestamp = datetime.now().strftime("%Y-%m-%d-%H%M%S")
     backup_file = backup_dir / f"session-{timestamp}.json"
     
-    # Copy session file
-    shutil.copy2(session_file, backup_file)
+    # Copy session file; a hard link would not do, as the session is
+    # rewritten in place and the backup would change with it
+    shutil.copyfile(session_file, backup_file)
     
-    # Keep only last 5 backups
-    backups = sorted(backup_dir.glob("session-*.json"))
+    # Keep only last 5 backups; timestamped names sort by age, so only
+    # the oldest need ordering
+    with os.scandir(backup_dir) as entries:
+        backups = [
+            entry.name for entry in entries
+            if entry.name.startswith("session-") and entry.name.endswith(".json")
+        ]
     if len(backups) > 5:
-        for old_backup in backups[:-5]:
-            old_backup.unlink()
+        for old_backup in heapq.nsmallest(len(backups) - 5, backups):
+            os.unlink(os.path.join(backup_dir, old_backup))
     
     console.print(f"[dim]Session backed up to {backup_file.name}[/dim]")
 
 
-def validate_session(session) -> List[str]:
+def validate_session(session: SessionState) -> List[str]:
     """Validate session data and return list of validation errors.
     
     Args:
@@ -159,39 +194,82 @@ def validate_session(session) -> List[str]:
     Returns:
         List of validation error messages
     """
-    errors = []
+    errors: List[str] = []
+    if not session.journey_progress:
+        return errors
     
-    # Check if repository path exists
-    if session.journey_progress:
-        repo_path = session.journey_progress.get("repository_root")
-        if repo_path:
-            repo_path = Path(repo_path)
-            if not repo_path.exists():
-                errors.append(f"Repository path no longer exists: {repo_path}")
-            elif not repo_path.is_dir():
-                errors.append(f"Repository path is not a directory: {repo_path}")
-            elif not (repo_path / ".git").exists():
-                errors.append(f"Repository path is no longer a git repository: {repo_path}")
-                
-            # Check if we're in the same directory
-            if repo_path.exists() and repo_path != Path.cwd():
-                errors.append(f"Current directory differs from session repository: {Path.cwd()}")
+    # Check if repository path exists; the directory checks below are
+    # meaningless without it, so stop at the first fatal problem
+    repo_path = session.journey_progress.get("repository_root")
+    if repo_path:
+        repo_path = Path(repo_path)
+        if not repo_path.exists():
+            errors.append(f"Repository path no longer exists: {repo_path}")
+            return errors
+        if not repo_path.is_dir():
+            errors.append(f"Repository path is not a directory: {repo_path}")
+            return errors
+        if not os.access(repo_path / ".git", os.F_OK):
+            errors.append(f"Repository path is no longer a git repository: {repo_path}")
+            
+        # Selected directories are relative to the repository, so they
+        # can't be checked from anywhere else
+        cwd = Path.cwd()
+        if repo_path != cwd:
+            errors.append(f"Current directory differs from session repository: {cwd}")
+            return errors
     
-    # Check if selected directories still exist
-    if session.journey_progress:
-        dirs = session.journey_progress.get("selected_directories", [])
-        missing_dirs = []
-        for dir_path in dirs:
-            if not Path(dir_path).exists():
-                missing_dirs.append(dir_path)
-        if missing_dirs:
-            errors.append(f"Some selected directories no longer exist: {', '.join(missing_dirs[:3])}")
+    # Check if selected directories still exist; only the first few are shown
+    dirs = session.journey_progress.get("selected_directories", [])
+    missing_dirs = _missing_paths(dirs, limit=3)
+    if missing_dirs:
+        errors.append(f"Some selected directories no longer exist: {', '.join(missing_dirs)}")
     
     # TODO: Add git branch validation when git integration is added
     
     return errors
 
 
+def _missing_paths(paths: List[str], limit: Optional[int] = None) -> List[str]:
+    """Find the paths that no longer exist, listing each parent only once.
+    
+    Selected directories usually share a few parents, so one scandir per
+    parent replaces a stat per existing path.
+    
+    Args:
+        paths: Paths to check
+        limit: Stop once this many missing paths are found
+        
+    Returns:
+        The paths that do not exist, in their original order
+    """
+    parent_entries: Dict[str, Optional[set]] = {}
+    missing = []
+    for path in paths:
+        parent, name = os.path.split(os.path.normpath(path))
+        if parent not in parent_entries:
+            try:
+                with os.scandir(parent or os.curdir) as entries:
+                    parent_entries[parent] = {entry.name for entry in entries}
+            except OSError:
+                parent_entries[parent] = None
+        names = parent_entries[parent]
+        # Names not in the listing are stat'ed before being reported, which
+        # covers unreadable parents, '.' and '..', and case-insensitive
+        # file systems
+        if (names is None or name not in names) and not os.path.exists(path):
+            missing.append(path)
+            if len(missing) == limit:
+                break
+    return missing
+
+
+# Upper bound on directories walked concurrently when collecting files
+_SCAN_WORKERS = 8
+
+# Upper bound on files rewritten concurrently when applying comment flags
+_FLAG_WORKERS = 8
+
 # Rule processing order as defined in the mockup
 RULE_PROCESSING_ORDER = [
     # Prerequisites - must run first
@@ -230,6 +308,66 @@ RULE_PROCESSING_ORDER = [
     ("TagDirective", "suggestion", "Informational: Identifies tag directives that may need attention during DITA conversion."),
 ]
 
+# Rule names in processing order, and each rule's severity and description
+RULE_ORDER: Tuple[str, ...] = tuple(name for name, _, _ in RULE_PROCESSING_ORDER)
+RULE_METADATA: Dict[str, Tuple[str, str]] = {
+    name: (severity, description) for name, severity, description in RULE_PROCESSING_ORDER
+}
+RULE_INDEX: Dict[str, int] = {name: i for i, name in enumerate(RULE_ORDER)}
+
+# Marker shown for each severity level; anything else is shown as a suggestion
+LEVEL_EMOJI: Dict[str, str] = {"error": "🔴", "warning": "🟡", "suggestion": "🔵"}
+
+# Rule lines listed by --dry-run, rendered once
+_DRY_RUN_RULE_LINES: Tuple[str, ...] = tuple(
+    f"   {LEVEL_EMOJI.get(level, '🔵')} {rule} ({level})" for rule, level, _ in RULE_PROCESSING_ORDER
+)
+
+
+def _first_pending_rule_index(applied_rules: List[str]) -> Optional[int]:
+    """Find the first rule in processing order that has not been applied.
+    
+    Args:
+        applied_rules: Names of rules applied so far
+        
+    Returns:
+        Index into RULE_ORDER, or None if every rule has been applied
+    """
+    applied_indexes = {RULE_INDEX[name] for name in applied_rules if name in RULE_INDEX}
+    index = 0
+    while index in applied_indexes:
+        index += 1
+    return index if index < len(RULE_ORDER) else None
+
+
+# Static panels, built once rather than on every run
+_DRY_RUN_PANEL = Panel.fit(
+    "🔍 [bold]Aditi Journey - Dry Run Mode[/bold]\n\n"
+    "This will preview what the journey would do:\n"
+    "  ✓ Show repository configuration options\n"
+    "  ✓ Display what fixes would be applied\n"
+    "  ✓ Preview rule processing without changes\n\n"
+    "[dim]No files will be modified in dry-run mode.[/dim]",
+    title="Aditi Journey (Dry Run)",
+    border_style="yellow"
+)
+_WELCOME_PANEL = Panel.fit(
+    "🚀 [bold]Welcome to Aditi's guided journey![/bold]\n\n"
+    "This interactive workflow will help you:\n"
+    "  ✓ Configure Aditi for your repository\n"
+    "  ✓ Automatically fix or flag issues for you\n"
+    "  ✓ Prompt you to review automatic fixes\n"
+    "  ✓ Prompt you to fix flagged issues",
+    title="Aditi Journey",
+    border_style="green"
+)
+_WORKFLOW_TIP_PANEL = Panel(
+    "💡 [bold]Workflow Tip:[/bold]\n"
+    "Before starting, create a feature branch for your changes.\n"
+    "This keeps your work organized and makes it easy to review.",
+    border_style="blue"
+)
+
 
 def journey_command(paths: Optional[List[Path]] = None, dry_run: bool = False, clear: bool = False, status: bool = False) -> None:
     """Start an interactive journey to prepare AsciiDoc files for DITA migration.
@@ -240,6 +378,9 @@ def journey_command(paths: Optional[List[Path]] = None, dry_run: bool = False, c
         clear: Clear current session and start fresh
         status: Show current session status
     """
+    # Deferred so that other commands and --help don't pay for loading it
+    import questionary
+
     config_manager = ConfigManager()
     
     # Handle --clear flag
@@ -278,30 +419,29 @@ def journey_command(paths: Optional[List[Path]] = None, dry_run: bool = False, c
                 if session.journey_progress:
                     dirs = session.journey_progress.get("selected_directories", [])
                     if dirs:
-                        console.print(f"   Selected directories: {len(dirs)}")
-                        for dir_path in dirs[:3]:  # Show first 3
-                            console.print(f"     • {dir_path}")
+                        # Each section is printed in one call; paths are
+                        # escaped so one can't open markup on a later line
+                        lines = [f"   Selected directories: {len(dirs)}"]
+                        lines.extend(f"     • {escape(str(dir_path))}" for dir_path in dirs[:3])  # Show first 3
                         if len(dirs) > 3:
-                            console.print(f"     ... and {len(dirs) - 3} more")
+                            lines.append(f"     ... and {len(dirs) - 3} more")
+                        console.print("\n".join(lines))
                 
                 # Show rules progress
                 if session.applied_rules:
-                    console.print(f"\n   [bold]Completed rules:[/bold]")
-                    for rule in session.applied_rules[-5:]:  # Show last 5
-                        console.print(f"     ✓ {rule}")
+                    lines = ["\n   [bold]Completed rules:[/bold]"]
+                    lines.extend(f"     ✓ {rule}" for rule in session.applied_rules[-5:])  # Show last 5
                     if len(session.applied_rules) > 5:
-                        console.print(f"     ... and {len(session.applied_rules) - 5} more")
+                        lines.append(f"     ... and {len(session.applied_rules) - 5} more")
+                    console.print("\n".join(lines))
                 
                 # Show next rule
                 if session.current_rule:
                     console.print(f"\n   [bold]Next rule:[/bold] {session.current_rule}")
                 elif session.total_rules and len(session.applied_rules) < session.total_rules:
-                    # Find next rule
-                    applied_set = set(session.applied_rules)
-                    for rule_name, _, _ in RULE_PROCESSING_ORDER:
-                        if rule_name not in applied_set:
-                            console.print(f"\n   [bold]Next rule:[/bold] {rule_name}")
-                            break
+                    next_index = _first_pending_rule_index(session.applied_rules)
+                    if next_index is not None:
+                        console.print(f"\n   [bold]Next rule:[/bold] {RULE_ORDER[next_index]}")
                 
                 console.print(f"\n[dim]Run 'aditi journey' to resume[/dim]")
             else:
@@ -312,28 +452,7 @@ def journey_command(paths: Optional[List[Path]] = None, dry_run: bool = False, c
             console.print("[dim]Run 'aditi journey' to start[/dim]")
         return
     
-    if dry_run:
-        console.print(Panel.fit(
-            "🔍 [bold]Aditi Journey - Dry Run Mode[/bold]\n\n"
-            "This will preview what the journey would do:\n"
-            "  ✓ Show repository configuration options\n"
-            "  ✓ Display what fixes would be applied\n"
-            "  ✓ Preview rule processing without changes\n\n"
-            "[dim]No files will be modified in dry-run mode.[/dim]",
-            title="Aditi Journey (Dry Run)",
-            border_style="yellow"
-        ))
-    else:
-        console.print(Panel.fit(
-            "🚀 [bold]Welcome to Aditi's guided journey![/bold]\n\n"
-            "This interactive workflow will help you:\n"
-            "  ✓ Configure Aditi for your repository\n"
-            "  ✓ Automatically fix or flag issues for you\n"
-            "  ✓ Prompt you to review automatic fixes\n"
-            "  ✓ Prompt you to fix flagged issues",
-            title="Aditi Journey",
-            border_style="green"
-        ))
+    console.print(_DRY_RUN_PANEL if dry_run else _WELCOME_PANEL)
 
     if dry_run:
         # In dry-run mode, show what would be done but don't actually do it
@@ -343,28 +462,33 @@ def journey_command(paths: Optional[List[Path]] = None, dry_run: bool = False, c
         current_dir = Path.cwd()
         console.print(f"📁 Would analyze directory: [cyan]{current_dir}[/cyan]")
         
-        # Check for AsciiDoc files
-        adoc_files = list(current_dir.rglob("*.adoc"))
-        if adoc_files:
-            console.print(f"📝 Found {len(adoc_files)} AsciiDoc files that would be analyzed")
-            for file in adoc_files[:5]:  # Show first 5
-                console.print(f"   • {file.relative_to(current_dir)}")
-            if len(adoc_files) > 5:
-                console.print(f"   ... and {len(adoc_files) - 5} more")
+        # Check for AsciiDoc files, keeping only the first few for display
+        # and making Paths of just those
+        preview_files: List[str] = []
+        adoc_count = 0
+        for file in iter_adoc_paths(current_dir):
+            if adoc_count < 5:
+                preview_files.append(file)
+            adoc_count += 1
+        if adoc_count:
+            console.print(f"📝 Found {adoc_count} AsciiDoc files that would be analyzed")
+            for file in preview_files:  # Show first 5
+                console.print(f"   • {Path(file).relative_to(current_dir)}")
+            if adoc_count > 5:
+                console.print(f"   ... and {adoc_count - 5} more")
         else:
             console.print("📝 No AsciiDoc files found in current directory")
         
-        # Show what rules would be processed
-        console.print(f"\n🔍 Would process {len(RULE_PROCESSING_ORDER)} AsciiDocDITA rules:")
-        for rule, level, desc in RULE_PROCESSING_ORDER:
-            emoji = "🔴" if level == "error" else "🟡" if level == "warning" else "🔵"
-            console.print(f"   {emoji} {rule} ({level})")
+        # Show what rules would be processed, heading and list in one print
+        console.print("\n".join((
+            f"\n🔍 Would process {len(RULE_PROCESSING_ORDER)} AsciiDocDITA rules:",
+            *_DRY_RUN_RULE_LINES
+        )))
         
         console.print("\n[dim]To actually perform these actions, run without --dry-run[/dim]")
         return
     
     # Normal interactive mode
-    config_manager = ConfigManager()
     session = config_manager.load_session()
     
     # Check if we have an existing session
@@ -372,7 +496,9 @@ def journey_command(paths: Optional[List[Path]] = None, dry_run: bool = False, c
         # Validate session before showing it
         validation_errors = validate_session(session)
         
-        display_session_info(session)
+        # One clock reading serves both the age shown and the staleness check
+        now = datetime.now()
+        display_session_info(session, now)
         
         # Show validation warnings if any
         if validation_errors:
@@ -382,8 +508,11 @@ def journey_command(paths: Optional[List[Path]] = None, dry_run: bool = False, c
             console.print()
         
         # Add age warning for old sessions
-        age = get_session_age(session.session_started)
-        if age and ("day" in age and int(age.split()[0]) >= 7):
+        try:
+            is_stale = now - _parse_session_start(session.session_started) >= timedelta(days=7)
+        except (TypeError, ValueError):
+            is_stale = False
+        if is_stale:
             console.print("⚠️  [yellow]Session is more than 7 days old. Repository may have changed significantly.[/yellow]\n")
         
         # Ask if they want to resume
@@ -401,31 +530,39 @@ def journey_command(paths: Optional[List[Path]] = None, dry_run: bool = False, c
             
     # Phase 1: Repository Configuration  
     if not session.journey_state or session.journey_state != "configured":
-        if not configure_repository(paths):
+        if not configure_repository(paths, config_manager=config_manager, session=session):
             return
 
     # Phase 2: Rule Application Workflow
-    completed = apply_rules_workflow(paths)
+    completed = apply_rules_workflow(paths, config_manager=config_manager)
 
     # Phase 3: Completion
     if completed:
-        complete_journey()
+        complete_journey(config_manager=config_manager)
     else:
         console.print("\n[yellow]Journey paused. Run 'aditi journey' again to resume.[/yellow]")
 
 
-def configure_repository(paths: Optional[List[Path]] = None) -> bool:
+def configure_repository(paths: Optional[List[Path]] = None,
+                         config_manager: Optional[ConfigManager] = None,
+                         session: Optional[SessionState] = None) -> bool:
     """Configure repository and directory selection.
 
     Args:
         paths: Optional list of file or directory paths to process
+        config_manager: Configuration manager shared across journey phases
+        session: Session already loaded by the caller
 
     Returns:
         True if configuration was successful, False otherwise
     """
+    import questionary
+
     # Initialize configuration manager
-    config_manager = ConfigManager()
+    config_manager = config_manager or ConfigManager()
     config = config_manager.load_config()
+    if session is None:
+        session = config_manager.load_session()
     
     # If no configuration exists, create one automatically
     if not config_manager.config_file.exists():
@@ -456,12 +593,12 @@ def configure_repository(paths: Optional[List[Path]] = None) -> bool:
             if not path.is_absolute():
                 path = current_dir / path
                 
-            if path.is_file() and path.suffix == ".adoc":
+            if str(path).endswith(".adoc") and os.path.isfile(path):
                 selected_files.append(path)
                 console.print(f"  • {path.relative_to(current_dir)} (file)")
             elif path.is_dir():
                 # Check for .adoc files in directory
-                adoc_count = len(list(path.rglob("*.adoc")))
+                adoc_count = count_adoc_files(path)
                 if adoc_count > 0:
                     selected_dirs.append(path.relative_to(current_dir))
                     console.print(f"  • {path.relative_to(current_dir)}/ ({adoc_count} .adoc files)")
@@ -476,11 +613,14 @@ def configure_repository(paths: Optional[List[Path]] = None) -> bool:
             
         # Store both directories and individual files for processing
         if selected_files:
-            # Convert files to their parent directories for configuration
-            file_dirs = list(set(f.parent.relative_to(current_dir) for f in selected_files))
+            # Convert files to their parent directories for configuration,
+            # relativizing each distinct parent once
+            file_dirs = [
+                parent.relative_to(current_dir)
+                for parent in dict.fromkeys(f.parent for f in selected_files)
+            ]
             selected_dirs.extend(file_dirs)
             # Store the specific files in session for later filtering
-            session = config_manager.load_session()
             session.journey_progress = session.journey_progress or {}
             session.journey_progress["selected_files"] = [str(f) for f in selected_files]
             config_manager.save_session(session)
@@ -488,7 +628,8 @@ def configure_repository(paths: Optional[List[Path]] = None) -> bool:
     else:
         # Original interactive mode
         # Check for .git directory
-        if not (current_dir / ".git").exists():
+        # Only existence matters, so access() avoids filling in a full stat
+        if not os.access(current_dir / ".git", os.F_OK):
             console.print("[yellow]Warning: No .git directory found. This may not be a repository root.[/yellow]")
 
         # Ask if this is the repository root
@@ -528,17 +669,19 @@ def configure_repository(paths: Optional[List[Path]] = None) -> bool:
             console.print("\n📁 Enter Custom Directory Paths")
             console.print(f"[dim]Repository root: {current_dir}[/dim]")
             
+            # List the top-level directories once; the listing below and the
+            # suggestions for mistyped paths both reuse it
+            top_level_dirs = _list_subdirectories(current_dir)
+            
             # Show available top-level directories to help users
             console.print("\n[dim]Available directories:[/dim]")
             try:
                 top_dirs = []
-                for item in current_dir.iterdir():
-                    if item.is_dir() and not item.name.startswith('.'):
-                        # Check if it has .adoc files
-                        has_adoc = any(item.rglob("*.adoc"))
-                        if has_adoc:
-                            adoc_count = len(list(item.rglob("*.adoc")))
-                            top_dirs.append((item.name, adoc_count))
+                for name in top_level_dirs:
+                    # Count its .adoc files in one walk; none means skip it
+                    adoc_count = count_adoc_files(current_dir / name)
+                    if adoc_count:
+                        top_dirs.append((name, adoc_count))
                 
                 if top_dirs:
                     # Sort by file count
@@ -581,12 +724,13 @@ def configure_repository(paths: Optional[List[Path]] = None) -> bool:
                 path = Path(path_str)
                 full_path = current_dir / path
                 
-                if full_path.exists() and full_path.is_dir():
+                # is_dir() is False for missing paths, so one stat covers both
+                if full_path.is_dir():
                     # Check if it has .adoc files
-                    adoc_files = list(full_path.rglob("*.adoc"))
-                    if adoc_files:
+                    adoc_count = count_adoc_files(full_path)
+                    if adoc_count:
                         custom_paths.append(path)
-                        console.print(f"  ✓ Added: {path} ({len(adoc_files)} .adoc files)")
+                        console.print(f"  ✓ Added: {path} ({adoc_count} .adoc files)")
                     else:
                         console.print(f"  [yellow]⚠ Warning: {path} has no .adoc files[/yellow]")
                         add_anyway = questionary.confirm("Add anyway?", default=False).ask()
@@ -601,13 +745,12 @@ def configure_repository(paths: Optional[List[Path]] = None) -> bool:
                         # Try to find similar directories
                         parent = full_path.parent
                         if parent.exists():
-                            similar = []
-                            try:
-                                for item in parent.iterdir():
-                                    if item.is_dir() and path_str.lower() in item.name.lower():
-                                        similar.append(item.name)
-                            except:
-                                pass
+                            search_term = path_str.lower()
+                            if parent == current_dir:
+                                candidates = top_level_dirs
+                            else:
+                                candidates = _list_subdirectories(parent, include_hidden=True)
+                            similar = [name for name in candidates if search_term in name.lower()]
                             
                             if similar:
                                 console.print(f"    [dim]Did you mean one of these?[/dim]")
@@ -625,15 +768,10 @@ def configure_repository(paths: Optional[List[Path]] = None) -> bool:
             selected_dirs = custom_paths
 
     # Save configuration
-    save_configuration(current_dir, selected_dirs)
+    save_configuration(current_dir, selected_dirs, config_manager=config_manager, session=session)
 
     # Workflow tip
-    console.print(Panel(
-        "💡 [bold]Workflow Tip:[/bold]\n"
-        "Before starting, create a feature branch for your changes.\n"
-        "This keeps your work organized and makes it easy to review.",
-        border_style="blue"
-    ))
+    console.print(_WORKFLOW_TIP_PANEL)
 
     # Ready to start?
     ready = questionary.confirm(
@@ -658,11 +796,18 @@ def select_directories(root_path: Path) -> Optional[List[Path]]:
     Returns:
         List of selected directory paths or None if cancelled
     """
+    import questionary
+
     console.print("\n🔍 Scanning for AsciiDoc files...")
 
-    # Scan for directories
+    # Scan for directories, showing the running count as they are found
     scanner = DirectoryScanner(ignore_symlinks=True)
-    adoc_dirs = scanner.scan_for_adoc_files(root_path)
+    adoc_dirs: Dict[Path, int] = {}
+    with _new_progress() as progress:
+        task = progress.add_task("Scanning directories...", total=None)
+        for path, count in scanner.iter_adoc_dirs(root_path):
+            adoc_dirs[path] = count
+            progress.update(task, description=f"Found {len(adoc_dirs):,} directories with AsciiDoc files...")
 
     if not adoc_dirs:
         console.print("[yellow]No AsciiDoc files found in the repository.[/yellow]")
@@ -681,72 +826,79 @@ def select_directories(root_path: Path) -> Optional[List[Path]]:
 
     console.print(f"\n🎯 Found documentation to process: {total_files:,} total files\n")
 
-    # Simple numbered selection
-    console.print("\n[bold]Available directories:[/bold]")
-    for i, (path, count) in enumerate(sorted_dirs, 1):
-        console.print(f"  {i}. {path} ({count:,} files)")
-    
-    console.print(f"\n[dim]Enter numbers separated by spaces (e.g., '1 3 4'), or 'all' for all directories:[/dim]")
-    
+    # Repeat the selection prompts until the user confirms or cancels; the
+    # scan above is reused when they choose to customize the selection
     while True:
-        choice = questionary.text("Your selection").ask()
-        if choice is None:  # User cancelled
-            return None
-            
-        choice = choice.strip().lower()
-        if choice == 'all':
-            selected = [str(path) for path, _ in sorted_dirs]
-            break
-        elif choice == '':
-            console.print("[red]Please enter your selection[/red]")
-            continue
-        else:
-            try:
-                numbers = [int(x.strip()) for x in choice.split()]
-                if all(1 <= num <= len(sorted_dirs) for num in numbers):
-                    selected = [str(sorted_dirs[num-1][0]) for num in numbers]
-                    break
-                else:
-                    console.print(f"[red]Please enter numbers between 1 and {len(sorted_dirs)}[/red]")
-            except ValueError:
-                console.print("[red]Please enter valid numbers separated by spaces[/red]")
+        # Simple numbered selection
+        console.print("\n[bold]Available directories:[/bold]")
+        for i, (path, count) in enumerate(sorted_dirs, 1):
+            console.print(f"  {i}. {path} ({count:,} files)")
+        
+        console.print(f"\n[dim]Enter numbers separated by spaces (e.g., '1 3 4'), or 'all' for all directories:[/dim]")
+        
+        while True:
+            choice = questionary.text("Your selection").ask()
+            if choice is None:  # User cancelled
+                return None
+                
+            choice = choice.strip().lower()
+            if choice == 'all':
+                selected = [str(path) for path, _ in sorted_dirs]
+                break
+            elif choice == '':
+                console.print("[red]Please enter your selection[/red]")
+                continue
+            else:
+                try:
+                    numbers = [int(x.strip()) for x in choice.split()]
+                    if all(1 <= num <= len(sorted_dirs) for num in numbers):
+                        selected = [str(sorted_dirs[num-1][0]) for num in numbers]
+                        break
+                    else:
+                        console.print(f"[red]Please enter numbers between 1 and {len(sorted_dirs)}[/red]")
+                except ValueError:
+                    console.print("[red]Please enter valid numbers separated by spaces[/red]")
 
-    # Convert back to Path objects
-    selected_paths = [Path(p) for p in selected]
-    
-    # Calculate total selected files
-    selected_file_count = sum(adoc_dirs.get(path, 0) for path in selected_paths)
+        # Convert back to Path objects
+        selected_paths = [Path(p) for p in selected]
+        
+        # Calculate total selected files
+        selected_file_count = sum(adoc_dirs.get(path, 0) for path in selected_paths)
 
-    # Show what was selected
-    console.print(f"\n✓ Selected {len(selected_paths)} directories with {selected_file_count:,} files")
-    
-    # Ask for confirmation with clearer options
-    choice = questionary.select(
-        "Continue with these directories?",
-        choices=[
-            "Process all selected directories",
-            "Customize selection",
-            "Cancel"
-        ],
-        default="Process all selected directories"
-    ).ask()
-    
-    if choice == "Cancel":
-        return None
-    elif choice == "Customize selection":
-        return select_directories(root_path)  # Recursive call to re-select
-    
-    return selected_paths
+        # Show what was selected
+        console.print(f"\n✓ Selected {len(selected_paths)} directories with {selected_file_count:,} files")
+        
+        # Ask for confirmation with clearer options
+        choice = questionary.select(
+            "Continue with these directories?",
+            choices=[
+                "Process all selected directories",
+                "Customize selection",
+                "Cancel"
+            ],
+            default="Process all selected directories"
+        ).ask()
+        
+        if choice == "Cancel":
+            return None
+        elif choice == "Customize selection":
+            continue  # Re-select without scanning again
+        
+        return selected_paths
 
 
-def save_configuration(root_path: Path, selected_dirs: Optional[List[Path]]) -> None:
+def save_configuration(root_path: Path, selected_dirs: Optional[List[Path]],
+                       config_manager: Optional[ConfigManager] = None,
+                       session: Optional[SessionState] = None) -> None:
     """Save journey configuration.
 
     Args:
         root_path: Repository root path
         selected_dirs: Selected directories or None for all
+        config_manager: Configuration manager shared across journey phases
+        session: Session already loaded by the caller
     """
-    config_manager = ConfigManager()
+    config_manager = config_manager or ConfigManager()
     config = config_manager.load_config()
 
     # Update configuration
@@ -766,189 +918,263 @@ def save_configuration(root_path: Path, selected_dirs: Optional[List[Path]]) ->
     config_manager.save_config(config)
 
     # Initialize session
-    session = config_manager.load_session()
+    if session is None:
+        session = config_manager.load_session()
+    now_iso = datetime.now().isoformat()
     session.journey_state = "configured"
     session.journey_progress = {
         "repository_root": str(root_path),
         "selected_directories": [str(d) for d in (selected_dirs or [])],
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso
     }
-    # Set session timing if this is a new session
+    # Set session timing if this is a new session; Vale results saved by
+    # an earlier session are not reused in a new one
     if not session.session_started:
-        session.session_started = datetime.now().isoformat()
-    session.last_updated = datetime.now().isoformat()
+        session.session_started = now_iso
+        config_manager.clear_scan_cache()
     config_manager.save_session(session)
 
 
-def apply_rules_workflow(paths: Optional[List[Path]] = None) -> bool:
+def apply_rules_workflow(paths: Optional[List[Path]] = None,
+                         config_manager: Optional[ConfigManager] = None) -> bool:
     """Apply rules in the correct order with user interaction.
     
     Args:
         paths: Optional list of file or directory paths to process
+        config_manager: Configuration manager shared across journey phases
     
     Returns:
         True if workflow completed, False if cancelled by user
     """
-    config_manager = ConfigManager()
+    config_manager = config_manager or ConfigManager()
     config = config_manager.load_config()
     session = config_manager.load_session()
 
-    # Initialize Vale container
+    # The shared Vale container is released however the workflow ends:
+    # completed, stopped by the user, or by an error
     try:
-        vale_container = ValeContainer()
-        vale_container.ensure_image_exists()
-    except Exception as e:
-        console.print(f"[red]Failed to initialize Vale:[/red] {e}")
-        raise typer.Exit(1)
+        # Initialize Vale container
+        try:
+            vale_container = get_shared_container()
+            vale_container.ensure_image_exists()
+        except Exception as e:
+            console.print(f"[red]Failed to initialize Vale:[/red] {e}")
+            raise typer.Exit(1)
 
-    # Get files to process
-    if paths:
-        # Use provided paths directly
-        adoc_files = []
-        for path in paths:
-            if path.is_file() and path.suffix == ".adoc":
-                adoc_files.append(path)
-            elif path.is_dir():
-                adoc_files.extend(path.rglob("*.adoc"))
-    elif session.journey_progress and "selected_files" in session.journey_progress:
-        # Use files stored in session from command-line args
-        adoc_files = [Path(f) for f in session.journey_progress["selected_files"]]
-    else:
-        # Use standard collection from config
-        adoc_files = collect_adoc_files(config)
+        # Get files to process
+        if paths:
+            # Use provided paths directly
+            adoc_files = []
+            for path in paths:
+                if path.suffix == ".adoc" and path.is_file():
+                    adoc_files.append(path)
+                elif path.is_dir():
+                    # Same walk and symlink handling as configured collection
+                    adoc_files.extend(iter_adoc_files(path, config.ignore_symlinks))
+        elif session.journey_progress and "selected_files" in session.journey_progress:
+            # Use files stored in session from command-line args
+            adoc_files = [Path(f) for f in session.journey_progress["selected_files"]]
+        else:
+            # Use standard collection from config
+            adoc_files = collect_adoc_files(config)
         
-    if not adoc_files:
-        console.print("[yellow]No .adoc files found to process.[/yellow]")
-        return True  # Consider this as completed since there's nothing to do
+        if not adoc_files:
+            console.print("[yellow]No .adoc files found to process.[/yellow]")
+            return True  # Consider this as completed since there's nothing to do
 
-    # Initialize processor
-    processor = RuleProcessor(vale_container, config)
+        # Initialize processor
+        processor = RuleProcessor(vale_container, config)
     
-    # Track total rules to process
-    session.total_rules = len(RULE_PROCESSING_ORDER)
-    config_manager.save_session(session)
-
-    # Determine starting point for rule processing
-    start_index = 0
-    if session.applied_rules:
-        # Find where we left off
-        applied_set = set(session.applied_rules)
-        for i, (rule_name, _, _) in enumerate(RULE_PROCESSING_ORDER):
-            if rule_name not in applied_set:
-                start_index = i
-                break
-        else:
-            # All rules have been applied
-            console.print("[green]All rules have already been applied![/green]")
-            return True
+        # Track total rules to process; saved with the first rule's progress
+        session.total_rules = len(RULE_ORDER)
+
+        # Determine starting point for rule processing
+        start_index = 0
+        if session.applied_rules:
+            # Find where we left off
+            next_index = _first_pending_rule_index(session.applied_rules)
+            if next_index is None:
+                # All rules have been applied
+                console.print("[green]All rules have already been applied![/green]")
+                return True
+            start_index = next_index
             
-        if start_index > 0:
-            console.print(f"\n[yellow]Resuming from rule {start_index + 1}/{len(RULE_PROCESSING_ORDER)}[/yellow]")
-            console.print(f"[dim]Already completed: {', '.join(session.applied_rules)}[/dim]\n")
-
-    # Process each rule in order with fresh Vale runs
-    for rule_index, (rule_name, severity, description) in enumerate(RULE_PROCESSING_ORDER[start_index:], start=start_index):
-        # Skip informational suggestion-level rules per GitHub issue #26
-        if rule_name in ["AttributeReference", "ConditionalCode", "IncludeDirective", "TagDirective"]:
-            console.print(f"[dim]Skipping informational rule {rule_name} (suggestion-level only)[/dim]")
-            # Mark as applied so it doesn't get processed again
-            session.applied_rules.append(rule_name)
+            if start_index > 0:
+                console.print(f"\n[yellow]Resuming from rule {start_index + 1}/{len(RULE_ORDER)}[/yellow]")
+                console.print(f"[dim]Already completed: {', '.join(session.applied_rules)}[/dim]\n")
+
+        # Sort the rules from the resume point once: rules already applied
+        # (a session can have gaps) are not run again, informational rules are
+        # marked as applied without a check, and unimplemented rules are
+        # reported. Only the rest are checked through Vale and processed.
+        applied_set = set(session.applied_rules)
+        rules_to_run = []
+        for rule_index, rule_name in enumerate(RULE_ORDER[start_index:], start=start_index):
+            if rule_name in applied_set:
+                continue
+            # Skip informational suggestion-level rules per GitHub issue #26
+            if rule_name in INFORMATIONAL_RULES:
+                console.print(f"[dim]Skipping informational rule {rule_name} (suggestion-level only)[/dim]")
+                # Mark as applied so it doesn't get processed again; the next
+                # save records it, and skipping it again on resume costs nothing
+                session.applied_rules.append(rule_name)
+                continue
+            rule = processor.rule_registry.get_rule(rule_name)
+            if not rule:
+                console.print(f"[yellow]Warning: Rule {rule_name} not implemented yet.[/yellow]")
+                continue
+            rules_to_run.append((rule_index, rule_name, rule, RULE_METADATA[rule_name][1]))
+        pending_rules = [rule_name for _, rule_name, _, _ in rules_to_run]
+        # Violations from one Vale pass over all pending rules, made when the
+        # first rule needs it, and the file signatures it reflects
+        cached_violations: Optional[Dict[str, List[Violation]]] = None
+        scanned_signatures: Dict[Path, Optional[Tuple[int, int]]] = {}
+        cwd = Path.cwd()
+        # Each file's path as Vale is given it, worked out once for every
+        # scan; keyed by absolute path, as file signatures are
+        vale_paths = {
+            path.absolute(): vale_path
+            for path, vale_path in zip(adoc_files, _vale_relative_paths(adoc_files, cwd), strict=True)
+        }
+        # One progress display for the whole workflow, shown only while work
+        # runs so that it never overlaps the prompts
+        progress = _new_progress()
+
+        # Process each rule in order
+        for rule_index, rule_name, rule, description in rules_to_run:
+            # Update session with current rule
+            session.current_rule = rule_name
             config_manager.save_session(session)
-            continue
-            
-        # Get the rule instance first to check if it's implemented
-        rule = processor.rule_registry.get_rule(rule_name)
-        if not rule:
-            console.print(f"[yellow]Warning: Rule {rule_name} not implemented yet.[/yellow]")
-            continue
-        
-        # Update session with current rule
-        session.current_rule = rule_name
-        session.last_updated = datetime.now().isoformat()
-        config_manager.save_session(session)
 
-        # Run Vale for just this specific rule
-        console.print(f"\n🔍 Checking for {rule_name} issues... (Rule {rule_index + 1}/{session.total_rules})\n")
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True
-        ) as progress:
-            task = progress.add_task(f"Running Vale {rule_name} analysis...", total=None)
-            
-            # Convert paths to relative paths for Vale
-            relative_paths = []
-            for path in adoc_files:
-                try:
-                    relative_paths.append(str(path.relative_to(Path.cwd())))
-                except ValueError:
-                    relative_paths.append(str(path))
-            
-            # Run Vale with single rule
-            vale_output = processor.vale_container.run_vale_single_rule(
-                rule_name, 
-                relative_paths,
-                project_root=Path.cwd()
-            )
-            progress.stop()
-
-        # Parse the Vale output
-        violations = processor.vale_parser.parse_json_output(vale_output)
+            if cached_violations is None:
+                # Check all remaining rules at once; signatures are taken first
+                # so that edits made during the scan count as changes. Files
+                # unchanged since an earlier journey reuse its saved results.
+                scanned_signatures = _file_signatures(adoc_files)
+                fingerprint = _scan_fingerprint(cwd)
+                alerts_by_file = _load_scan_cache(config_manager.scan_cache_file, fingerprint,
+                                                  pending_rules, scanned_signatures)
+                stale_files = [path for path in adoc_files if str(path.absolute()) not in alerts_by_file]
+                if stale_files:
+                    with progress:
+                        task = progress.add_task(f"Running Vale analysis for {len(pending_rules)} rules...", total=None)
+                        vale_output = processor.vale_container.run_vale_rules(
+                            pending_rules,
+                            [vale_paths[path.absolute()] for path in stale_files],
+                            project_root=cwd,
+                            config_name="vale_journey.ini"
+                        )
+                    progress.remove_task(task)
+                    alerts_by_file.update(_alerts_by_file(vale_output, stale_files))
+                    _save_scan_cache(config_manager.scan_cache_file, fingerprint, pending_rules,
+                                     scanned_signatures, alerts_by_file)
+                else:
+                    console.print("[dim]No files changed since the last journey; reusing its Vale results.[/dim]")
+                # The alerts are keyed by absolute path already, so they become
+                # violations directly, bucketed by rule as they are built
+                cached_violations = {}
+                for file_path_str, alerts in alerts_by_file.items():
+                    file_path = Path(file_path_str)
+                    for alert in alerts:
+                        try:
+                            violation = Violation.from_vale_alert(file_path, alert)
+                        except (KeyError, ValueError) as e:
+                            console.print(f"[yellow]Warning: Skipping malformed alert:[/yellow] {e}")
+                            continue
+                        cached_violations.setdefault(violation.rule_name, []).append(violation)
+
+            console.print(f"\n🔍 Checking for {rule_name} issues... (Rule {rule_index + 1}/{session.total_rules})\n")
         
-        # Filter to just this rule's issues (in case Vale returns others)
-        rule_violations = [v for v in violations if v.rule_name == rule_name]
+            # Files changed since the scan (by earlier rules or by the user) are
+            # checked again for this and every later rule in one Vale run, so
+            # each edit costs one run rather than one per remaining rule
+            current_signatures = _file_signatures(adoc_files)
+            changed_files = [
+                path for path, signature in current_signatures.items()
+                if signature != scanned_signatures.get(path)
+            ]
+            if changed_files:
+                remaining_rules = pending_rules[pending_rules.index(rule_name):]
+                with progress:
+                    task = progress.add_task(f"Running Vale analysis on {len(changed_files)} changed files...", total=None)
+                    vale_output = processor.vale_container.run_vale_rules(
+                        remaining_rules,
+                        [vale_paths[path] for path in changed_files],
+                        project_root=cwd,
+                        config_name="vale_journey.ini"
+                    )
+                progress.remove_task(task)
+            
+                changed_set = set(changed_files)
+                for name, violations in cached_violations.items():
+                    cached_violations[name] = [v for v in violations if v.file_path not in changed_set]
+                for violation in processor.vale_parser.parse_json_output(vale_output):
+                    cached_violations.setdefault(violation.rule_name, []).append(violation)
+                for path in changed_files:
+                    scanned_signatures[path] = current_signatures[path]
+            rule_violations = cached_violations.get(rule_name, [])
         
-        if not rule_violations:
-            # No issues for this rule - show success message and mark as completed
-            console.print(f"✅ [green]No {rule_name} violations found - this rule is already satisfied![/green]\n")
-            # Update session to mark this rule as applied
+            if not rule_violations:
+                # No issues for this rule - show success message and mark as completed
+                console.print(f"✅ [green]No {rule_name} violations found - this rule is already satisfied![/green]\n")
+                # Update session to mark this rule as applied
+                session.applied_rules.append(rule_name)
+                config_manager.save_session(session)
+                continue  # Move to next rule
+
+            # Process this rule
+            if not process_single_rule(rule, rule_violations, description, processor,
+                                       progress=progress):
+                # User chose to stop
+                return False
+
+            # Update session
             session.applied_rules.append(rule_name)
             config_manager.save_session(session)
-            continue  # Move to next rule
 
-        # Process this rule
-        if not process_single_rule(rule, rule_violations, description, processor, config_manager):
-            # User chose to stop
-            return False
-
-        # Update session
-        session.applied_rules.append(rule_name)
+        # Clear current rule since we're done
+        session.current_rule = None
         config_manager.save_session(session)
-
-    # Cleanup
-    vale_container.cleanup()
-    
-    # Clear current rule since we're done
-    session.current_rule = None
-    session.last_updated = datetime.now().isoformat()
-    config_manager.save_session(session)
     
-    # All rules processed successfully
-    return True
+        # All rules processed successfully
+        return True
+    finally:
+        # Release the shared Vale container
+        if 'vale_container' in locals():
+            release_shared_container()
 
 
-def process_single_rule(rule, issues, description, processor, config_manager) -> bool:
+def process_single_rule(rule: Rule, issues: List[Violation], description: str,
+                        processor: RuleProcessor,
+                        progress: Optional[Progress] = None) -> bool:
     """Process a single rule with user interaction.
 
+    Args:
+        progress: Progress display to reuse for applying flags
+
     Returns:
         True to continue, False to stop
     """
+    import questionary
+
     # Create a visual separator and prominent rule announcement
     console.print("\n" + "─" * 80)
     console.print(f"\n🔧 [bold cyan]Processing {rule.name} issues[/bold cyan] [yellow]({len(issues)} found)[/yellow]\n")
     console.print(f"[bold]{rule.name}:[/bold] {description}\n")
 
-    # Show affected files
-    files_affected = list(set(v.file_path for v in issues))
+    # Bucket issues by file once; the files are shown and processed in
+    # the order Vale reported them
+    issues_by_file: Dict[Path, List[Violation]] = {}
+    for issue in issues:
+        issues_by_file.setdefault(issue.file_path, []).append(issue)
+    files_affected = list(issues_by_file)
     console.print("These files have this issue:")
     # Use the processor's file list display helper if available
     if hasattr(processor, '_display_file_list'):
         processor._display_file_list(files_affected, rule.name, show_all=False, max_display=10)
     else:
         # Fallback to inline display
-        for i, file_path in enumerate(files_affected[:10]):
-            rel_path = file_path.relative_to(Path.cwd())
+        for rel_path in _vale_relative_paths(files_affected[:10]):
             console.print(f"  • {rel_path}")
         if len(files_affected) > 10:
             console.print(f"  ... and {len(files_affected) - 10} more")
@@ -972,82 +1198,69 @@ def process_single_rule(rule, issues, description, processor, config_manager) ->
     console.print(fix_description)
     console.print()
 
-    # Get user choice with text input
-    choice_letters = [c[0] for c in choices]
-    default_letter = default[0]
-    
-    # Create appropriate prompt text based on available choices
+    # Get user choice from a menu; a choice's letter moves the pointer to it
+    # and Enter confirms. The menu only offers valid choices, so there is no
+    # free-text input to validate and re-ask
     if rule.fix_type == FixType.NON_DETERMINISTIC:
-        prompt_text = f"Flag or skip? ({'/'.join(choice_letters)})"
+        prompt_text = "Flag or skip?"
     else:
-        prompt_text = f"Auto-fix, flag, or skip? ({'/'.join(choice_letters)})"
-
-    action = questionary.text(prompt_text).ask()
-    
-    if action is None:  # User cancelled (Ctrl+C)
-        return False
-    
-    # Use default if user just pressed Enter
-    if action.strip() == "":
-        action = default_letter
+        prompt_text = "Auto-fix, flag, or skip?"
 
-    action_char = action.strip().lower()
+    action_char = questionary.select(
+        prompt_text,
+        choices=[
+            questionary.Choice(c, value=c[0].lower(), shortcut_key=c[0].lower())
+            for c in choices
+        ],
+        default=default[0].lower(),
+        use_shortcuts=True
+    ).ask()
 
-    # Validate input
-    valid_choices = [c.lower() for c in choice_letters]
-    if action_char not in valid_choices:
-        console.print(f"[red]Invalid choice '{action}'. Please enter one of: {'/'.join(choice_letters)}[/red]")
-        return process_single_rule(rule, issues, description, processor, config_manager)
+    if action_char is None:  # User cancelled (Ctrl+C)
+        return False
 
     if action_char == 's':
         console.print("[yellow]Skipped.[/yellow]")
         return continue_prompt()
 
+    # Files left unchanged by the fixes or flags (and by the user) keep
+    # their issues on recheck without another Vale run
+    signatures = _file_signatures(files_affected)
+
     # Apply fixes or flags
     if action_char == 'a':
-        apply_auto_fixes(rule, issues, processor, files_affected)
+        apply_auto_fixes(rule, processor, files_affected)
     else:  # 'f'
-        apply_flags(rule, issues, processor, files_affected)
+        apply_flags(rule, issues, processor, files_affected, progress=progress,
+                    issues_by_file=issues_by_file)
 
     # Show completion message
     show_completion_message(rule, len(files_affected))
 
-    return recheck_and_continue_prompt(rule.name, files_affected, processor)
+    return recheck_and_continue_prompt(rule.name, files_affected, processor,
+                                       issues=issues, signatures=signatures)
 
 
-def apply_auto_fixes(rule, issues, processor, files_affected):
+def apply_auto_fixes(rule: Rule, processor: RuleProcessor, files_affected: List[Path]) -> None:
     """Apply automatic fixes for a rule."""
     console.print()
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        console=console
-    ) as progress:
-        task = progress.add_task(f"Applying {rule.name} fixes...", total=len(files_affected))
-
-        # Process each file
-        fixes_applied = 0
-        file_fix_counts = {}  # Track actual fixes per file
-        for file_path in files_affected:
-            file_issues = [v for v in issues if v.file_path == file_path]
-
-            # Apply fixes to this file for the specific rule only
-            result = processor.process_files([file_path], dry_run=False, rule_filter=rule.name)
-            file_fixes = len([f for f in result.fixes_applied if f.violation.file_path == file_path])
-            file_fix_counts[file_path] = file_fixes
-            fixes_applied += file_fixes
-
-            progress.update(task, advance=1)
+    
+    # Fix all affected files with a single Vale run; the processor reports
+    # per-file progress itself
+    result = processor.process_files(files_affected, dry_run=False, rule_filter=rule.name)
+    
+    # Count the fixes actually applied to each file, in one pass
+    fix_counts = Counter(fix.violation.file_path for fix in result.fixes_applied)
+    file_fix_counts = {file_path: fix_counts[file_path] for file_path in files_affected}
+    fixes_applied = sum(file_fix_counts.values())
 
     # Show summary
     if fixes_applied > 0:
         console.print(f"\n✓ Applied {fixes_applied} {rule.name} {'fix' if fixes_applied == 1 else 'fixes'}.")
-        for file_path, fix_count in file_fix_counts.items():
-            if fix_count > 0:
-                rel_path = file_path.relative_to(Path.cwd())
-                console.print(f"  • {rel_path} ({fix_count} {'fix' if fix_count == 1 else 'fixes'})")
+        fixed_files = [file_path for file_path, fix_count in file_fix_counts.items() if fix_count > 0]
+        for file_path, rel_path in zip(fixed_files, _vale_relative_paths(fixed_files), strict=True):
+            fix_count = file_fix_counts[file_path]
+            console.print(f"  • {rel_path} ({fix_count} {'fix' if fix_count == 1 else 'fixes'})")
     else:
         console.print(f"\n[yellow]No {rule.name} fixes could be applied automatically.[/yellow]")
         console.print("[dim]Some violations may be in code blocks or require manual review.[/dim]")
@@ -1056,51 +1269,131 @@ def apply_auto_fixes(rule, issues, processor, files_affected):
         console.print(f"  [show the full list of files]")
 
 
-def apply_flags(rule, issues, processor, files_affected):
+def _flag_file(file_path: Path, file_issues: List[Violation], rule: Rule) -> int:
+    """Insert comment flags for a rule's issues into one file.
+    
+    Args:
+        file_path: File to flag
+        file_issues: Issues of the rule in this file
+        rule: Rule that creates the comment flags
+        
+    Returns:
+        Number of flags inserted
+    """
+    # Read and rewrite through one descriptor: a single open, a read sized
+    # from fstat, and an in-place write that keeps the file's inode and mode
+    fd = os.open(file_path, os.O_RDWR)
+    try:
+        data = os.read(fd, os.fstat(fd).st_size)
+        while True:
+            # Pick up anything appended since fstat
+            more = os.read(fd, 65536)
+            if not more:
+                break
+            data += more
+        output, flags_applied = _insert_flags(data, file_issues, rule)
+        if not flags_applied:
+            return 0
+
+        os.lseek(fd, 0, os.SEEK_SET)
+        view = memoryview(output)
+        while view:
+            view = view[os.write(fd, view):]
+        os.ftruncate(fd, len(output))
+        return flags_applied
+    finally:
+        os.close(fd)
+
+
+def _insert_flags(data: bytes, file_issues: List[Violation], rule: Rule) -> Tuple[bytes, int]:
+    """Insert comment flags into raw file content.
+    
+    Works on the undecoded bytes: a newline byte never occurs inside a
+    UTF-8 multi-byte sequence, so lines can be split without decoding.
+    Splitting and joining run in C; the Python work is per issue rather
+    than per line, and nothing after the last flagged line is split.
+    
+    Args:
+        data: File content
+        file_issues: Issues of the rule in this file
+        rule: Rule that creates the comment flags
+        
+    Returns:
+        Flagged content and the number of flags inserted
+    """
+    if not file_issues:
+        return data, 0
+    # Split only as far as the last flagged line; the rest stays one chunk
+    last_line = max(issue.line for issue in file_issues)
+    lines = data.split(b'\n', max(last_line, 0))
+    if len(lines) > last_line:
+        # Every line up to the last flagged one ends in a newline
+        line_count = last_line
+    else:
+        # A trailing newline leaves an empty last element that is not a line
+        line_count = len(lines) - 1 if not data or data.endswith(b'\n') else len(lines)
+
+    # Collect each line's comments in line order
+    comments_by_line: Dict[int, List[bytes]] = {}
+    flags_applied = 0
+    for issue in sorted(file_issues, key=attrgetter("line")):
+        if 0 < issue.line <= line_count:
+            comment = rule.create_comment_flag(issue).encode('utf-8')
+            comments_by_line.setdefault(issue.line - 1, []).append(comment)
+            flags_applied += 1
+    if not flags_applied:
+        return data, 0
+
+    # Put the comments before the line they flag, ending them the way the
+    # file's own lines end; split lines keep their b'\r', so only the
+    # inserted breaks need it
+    newline = b'\r\n' if b'\r\n' in data else b'\n'
+    for index, comments in comments_by_line.items():
+        comments.append(lines[index])
+        lines[index] = newline.join(comments)
+
+    return b'\n'.join(lines), flags_applied
+
+
+def apply_flags(rule: Rule, issues: List[Violation], processor: RuleProcessor, files_affected: List[Path],
+                progress: Optional[Progress] = None,
+                issues_by_file: Optional[Dict[Path, List[Violation]]] = None) -> None:
     """Apply comment flags for a rule."""
     console.print()
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        console=console
-    ) as progress:
+    if progress is None:
+        progress = _new_progress()
+    with progress:
         task = progress.add_task("Applying flags...", total=len(files_affected))
 
-        # Flag each issue with a comment
-        flags_applied = 0
-        for file_path in files_affected:
-            file_issues = [v for v in issues if v.file_path == file_path]
-
-            try:
-                content = file_path.read_text(encoding='utf-8')
-                lines = content.splitlines(keepends=True)
-
-                # Sort issues by line number (reverse to avoid offset issues)
-                sorted_issues = sorted(file_issues, key=lambda v: v.line, reverse=True)
-
-                for issue in sorted_issues:
-                    if 0 < issue.line <= len(lines):
-                        # Insert comment before the line (not at the line position)
-                        comment = rule.create_comment_flag(issue) + "\n"
-                        # Insert at the line position, which pushes the original line down
-                        lines.insert(issue.line - 1, comment)
-                        flags_applied += 1
+        # Bucket issues by file once instead of filtering them per file,
+        # unless the caller already has
+        if issues_by_file is None:
+            issues_by_file = {}
+            for issue in issues:
+                issues_by_file.setdefault(issue.file_path, []).append(issue)
 
-                # Write back
-                file_path.write_text(''.join(lines), encoding='utf-8')
-
-            except Exception as e:
-                console.print(f"[red]Error flagging {file_path}:[/red] {e}")
-
-            progress.update(task, advance=1)
+        # Flag each file independently on a thread pool; results are
+        # collected as they finish so the progress bar stays responsive
+        flags_applied = 0
+        if files_affected:
+            with ThreadPoolExecutor(max_workers=min(_FLAG_WORKERS, len(files_affected))) as executor:
+                futures = {
+                    executor.submit(_flag_file, file_path, issues_by_file.get(file_path, []), rule): file_path
+                    for file_path in files_affected
+                }
+                for future in as_completed(futures):
+                    try:
+                        flags_applied += future.result()
+                    except Exception as e:
+                        console.print(f"[red]Error flagging {futures[future]}:[/red] {e}")
+                    progress.update(task, advance=1)
+    progress.remove_task(task)
 
     # Show summary
     console.print(f"\n✓ Applied {flags_applied} {rule.name} flags.")
-    for i, file_path in enumerate(files_affected[:5]):
-        rel_path = file_path.relative_to(Path.cwd())
-        file_flags = len([v for v in issues if v.file_path == file_path])
+    shown_files = files_affected[:5]
+    for file_path, rel_path in zip(shown_files, _vale_relative_paths(shown_files), strict=True):
+        file_flags = len(issues_by_file.get(file_path, []))
         console.print(f"  • {rel_path} ({file_flags} {'flag' if file_flags == 1 else 'flags'})")
     if len(files_affected) > 5:
         console.print(f"  • ...")
@@ -1122,37 +1415,47 @@ def show_completion_message(rule, file_count):
     ))
 
 
-def recheck_rule_violations(rule_name: str, files_affected: List[Path], processor) -> None:
+def recheck_rule_violations(rule_name: str, files_affected: List[Path], processor: RuleProcessor,
+                            issues: Optional[List[Violation]] = None,
+                            signatures: Optional[Dict[Path, Optional[Tuple[int, int]]]] = None) -> None:
     """Recheck for violations of a specific rule after fixes were applied.
     
     Args:
         rule_name: Name of the rule to check
         files_affected: List of files that were processed
         processor: RuleProcessor instance
+        issues: The rule's issues before fixing; with signatures, files
+            that have not changed since keep these instead of a new check
+        signatures: File signatures taken when issues was current
     """
     console.print(f"\n🔍 [bold]Rechecking {rule_name} violations...[/bold]")
     
     try:
-        # Convert paths to relative paths for Vale
-        relative_paths = []
-        for path in files_affected:
-            try:
-                relative_paths.append(str(path.relative_to(Path.cwd())))
-            except ValueError:
-                relative_paths.append(str(path))
-        
-        # Run Vale with single rule
-        vale_output = processor.vale_container.run_vale_single_rule(
-            rule_name, 
-            relative_paths,
-            project_root=Path.cwd()
-        )
-        
-        # Parse the Vale output
-        violations = processor.vale_parser.parse_json_output(vale_output)
+        files_to_check = files_affected
+        rule_issues: List[Violation] = []
+        if issues is not None and signatures is not None:
+            current_signatures = _file_signatures(files_affected)
+            files_to_check = [
+                path for path in files_affected
+                if current_signatures[path.absolute()] != signatures.get(path.absolute())
+            ]
+            unchanged = set(files_affected).difference(files_to_check)
+            rule_issues = [v for v in issues if v.file_path in unchanged]
         
-        # Filter to just this rule's issues
-        rule_issues = [v for v in violations if v.rule_name == rule_name]
+        if files_to_check:
+            # Run Vale with single rule on paths relative to the project root
+            cwd = Path.cwd()
+            vale_output = processor.vale_container.run_vale_single_rule(
+                rule_name, 
+                _vale_relative_paths(files_to_check, cwd),
+                project_root=cwd
+            )
+            
+            # Keep just this rule's issues (in case Vale returns others)
+            rule_issues += [
+                v for v in processor.vale_parser.parse_json_output(vale_output)
+                if v.rule_name == rule_name
+            ]
         
         if not rule_issues:
             console.print("✅ [green]No remaining issues found for this rule![/green]")
@@ -1160,7 +1463,7 @@ def recheck_rule_violations(rule_name: str, files_affected: List[Path], processo
             console.print(f"⚠️  [yellow]{len(rule_issues)} issue(s) still remain for this rule:[/yellow]\n")
             
             # Show affected files in the same format as process_single_rule
-            files_with_issues = list(set(v.file_path for v in rule_issues))
+            files_with_issues = list(dict.fromkeys(v.file_path for v in rule_issues))
             console.print("These files have this issue:")
             # Use the processor's file list display helper if available
             if hasattr(processor, '_display_file_list'):
@@ -1176,17 +1479,23 @@ def recheck_rule_violations(rule_name: str, files_affected: List[Path], processo
         console.print(f"[red]Error during recheck: {e}[/red]")
 
 
-def recheck_and_continue_prompt(rule_name: str, files_affected: List[Path], processor) -> bool:
+def recheck_and_continue_prompt(rule_name: str, files_affected: List[Path], processor: RuleProcessor,
+                                issues: Optional[List[Violation]] = None,
+                                signatures: Optional[Dict[Path, Optional[Tuple[int, int]]]] = None) -> bool:
     """Ask user to recheck violations and continue with next rule.
     
     Args:
         rule_name: Name of the rule that was processed
         files_affected: List of files that were processed  
         processor: RuleProcessor instance
+        issues: The rule's issues before fixing, passed to the recheck
+        signatures: File signatures taken when issues was current
         
     Returns:
         True to continue, False to stop
     """
+    import questionary
+
     console.print()
     
     # Ask if user wants to recheck for issues
@@ -1196,7 +1505,8 @@ def recheck_and_continue_prompt(rule_name: str, files_affected: List[Path], proc
     ).ask()
     
     if recheck:
-        recheck_rule_violations(rule_name, files_affected, processor)
+        recheck_rule_violations(rule_name, files_affected, processor,
+                                issues=issues, signatures=signatures)
     
     # Ask if user wants to continue
     console.print()
@@ -1213,6 +1523,8 @@ def continue_prompt() -> bool:
     Returns:
         True to continue, False to stop
     """
+    import questionary
+
     console.print()
     cont = questionary.confirm(
         "Continue with next rule?",
@@ -1221,6 +1533,244 @@ def continue_prompt() -> bool:
     return cont if cont is not None else False
 
 
+def _list_subdirectories(root: Path, include_hidden: bool = False) -> List[str]:
+    """List the names of a directory's subdirectories in one scandir pass.
+    
+    Args:
+        root: Directory to list
+        include_hidden: Whether to include names starting with a dot
+        
+    Returns:
+        Subdirectory names; empty if the directory cannot be read
+    """
+    names = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                try:
+                    if (include_hidden or not entry.name.startswith('.')) and entry.is_dir():
+                        names.append(entry.name)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return names
+
+
+def _new_progress() -> Progress:
+    """Create the journey's progress display.
+    
+    The display can be entered again after it stops, with tasks removed
+    once they finish. A spinner and indeterminate bar show for tasks
+    without a total; the percentage is shown only for tasks with one.
+    
+    Returns:
+        Transient progress display on the journey console
+    """
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        console=console,
+        transient=True
+    )
+
+
+def _vale_relative_paths(paths: List[Path], cwd: Optional[Path] = None) -> List[str]:
+    """Convert paths to the form Vale is given, relative to the working directory.
+    
+    Args:
+        paths: Paths to convert
+        cwd: Working directory, if the caller already has it
+        
+    Returns:
+        Relative path strings, or absolute ones for paths outside the
+        working directory
+    """
+    cwd = cwd or Path.cwd()
+    relative_paths = []
+    for path in paths:
+        try:
+            relative_paths.append(str(path.relative_to(cwd)))
+        except ValueError:
+            relative_paths.append(str(path))
+    return relative_paths
+
+
+def _file_signatures(paths: List[Path]) -> Dict[Path, Optional[Tuple[int, int]]]:
+    """Get file modification times and sizes, keyed the way Vale results name files.
+    
+    Args:
+        paths: Files to stat
+        
+    Returns:
+        Mapping of absolute path to (st_mtime_ns, st_size), or None if the
+        file cannot be read
+    """
+    signatures: Dict[Path, Optional[Tuple[int, int]]] = {}
+    for path in paths:
+        try:
+            stat_result = path.stat()
+            signatures[path.absolute()] = (stat_result.st_mtime_ns, stat_result.st_size)
+        except OSError:
+            signatures[path.absolute()] = None
+    return signatures
+
+
+def _alerts_by_file(vale_output: str, paths: List[Path]) -> Dict[str, List[Dict[str, Any]]]:
+    """Split Vale JSON output into alerts per file.
+    
+    Args:
+        vale_output: Raw JSON output from Vale
+        paths: Files that were checked; those without alerts get an empty list
+        
+    Returns:
+        Mapping of absolute path string to the file's Vale alerts
+    """
+    alerts: Dict[str, List[Dict[str, Any]]] = {str(path.absolute()): [] for path in paths}
+    cwd = Path.cwd()
+    for file_path_str, file_data in load_vale_json(vale_output or "{}").items():
+        file_path = Path(file_path_str)
+        if not file_path.is_absolute():
+            file_path = cwd / file_path
+        alerts[str(file_path)] = file_data.get("Alerts", []) if isinstance(file_data, dict) else file_data
+    return alerts
+
+
+def _scan_fingerprint(project_root: Path) -> str:
+    """Identify everything other than the files that Vale results depend on.
+    
+    Covers the repository, the aditi version, the Vale image, the
+    repository's .vale.ini and the files of its styles directory, so
+    saved results are dropped when any of them changes.
+    
+    Args:
+        project_root: Repository root Vale runs in
+        
+    Returns:
+        Hex digest to store with, and compare against, saved results
+    """
+    digest = hashlib.sha256()
+    for part in (str(project_root.absolute()), __version__, ValeContainer.VALE_IMAGE):
+        digest.update(part.encode("utf-8") + b"\0")
+    
+    vale_ini = project_root / ".vale.ini"
+    try:
+        config_bytes = vale_ini.read_bytes()
+    except OSError:
+        config_bytes = b""
+    digest.update(config_bytes + b"\0")
+    
+    # Styles are found the way the rule configs find them
+    styles_path = ".vale/styles"
+    for line in config_bytes.decode("utf-8", errors="replace").splitlines():
+        if line.strip().startswith("StylesPath"):
+            styles_path = line.split("=", 1)[1].strip()
+            break
+    styles_dir = project_root / styles_path
+    for dirpath, dirnames, filenames in os.walk(styles_dir):
+        dirnames.sort()
+        for name in sorted(filenames):
+            file_path = os.path.join(dirpath, name)
+            try:
+                stat_result = os.stat(file_path)
+            except OSError:
+                continue
+            entry = f"{os.path.relpath(file_path, styles_dir)}:{stat_result.st_mtime_ns}:{stat_result.st_size}"
+            digest.update(entry.encode("utf-8") + b"\0")
+    return digest.hexdigest()
+
+
+def _load_scan_cache(cache_file: Path, fingerprint: str, rule_names: List[str],
+                     signatures: Dict[Path, Optional[Tuple[int, int]]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Load saved Vale alerts for files that have not changed since they were scanned.
+    
+    Args:
+        cache_file: Scan cache written by an earlier journey
+        fingerprint: Current _scan_fingerprint; a cache saved under another
+            one is not used
+        rule_names: Rules the results must cover
+        signatures: Current file signatures from _file_signatures
+        
+    Returns:
+        Mapping of absolute path string to Vale alerts, for unchanged files
+        only; empty if there is no usable cache
+    """
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache["fingerprint"] != fingerprint or not set(rule_names) <= set(cache["rules"]):
+            return {}
+        cached_files = cache["files"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+    alerts: Dict[str, List[Dict[str, Any]]] = {}
+    for path, signature in signatures.items():
+        entry = cached_files.get(str(path))
+        if signature is not None and entry and tuple(entry["signature"]) == signature:
+            alerts[str(path)] = entry["alerts"]
+    return alerts
+
+
+def _save_scan_cache(cache_file: Path, fingerprint: str, rule_names: List[str],
+                     signatures: Dict[Path, Optional[Tuple[int, int]]],
+                     alerts: Dict[str, List[Dict[str, Any]]]) -> None:
+    """Save Vale alerts with the file signatures they were produced for.
+    
+    The cache only saves time, so failures to write it are ignored.
+    
+    Args:
+        cache_file: Where to write the scan cache
+        fingerprint: _scan_fingerprint the alerts were produced under
+        rule_names: Rules the alerts cover
+        signatures: File signatures taken before the scan
+        alerts: Mapping of absolute path string to Vale alerts
+    """
+    cached_files = {
+        str(path): {"signature": list(signature), "alerts": alerts.get(str(path), [])}
+        for path, signature in signatures.items()
+        if signature is not None
+    }
+    try:
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump({"fingerprint": fingerprint, "rules": rule_names, "files": cached_files}, f)
+    except OSError:
+        pass
+
+
+def _outermost_directories(dirs: List[Path]) -> List[Path]:
+    """Drop directories that a walk of another listed directory would cover.
+    
+    A nested directory is kept when the walk of its ancestor would prune
+    it, such as one inside a hidden directory.
+    
+    Args:
+        dirs: Directories to walk, in order
+        
+    Returns:
+        The directories still needing a walk, in their original order
+    """
+    # Keyed by resolved path so that repeats are dropped as well
+    by_real: Dict[Path, Path] = {}
+    for path in dirs:
+        by_real.setdefault(path.resolve(), path)
+
+    kept = []
+    for real, path in by_real.items():
+        # Only the nearest listed ancestor matters: it is walked itself or
+        # covered by a walk that prunes the same names below it
+        ancestor = next((parent for parent in real.parents if parent in by_real), None)
+        if ancestor is not None and not any(
+            part.startswith('.') or part == 'node_modules'
+            for part in real.relative_to(ancestor).parts
+        ):
+            continue
+        kept.append(path)
+    return kept
+
+
 def collect_adoc_files(config) -> List[Path]:
     """Collect all .adoc files from configured directories.
 
@@ -1231,28 +1781,42 @@ def collect_adoc_files(config) -> List[Path]:
         List of .adoc file paths
     """
     adoc_files = []
+    dirs_to_walk = []
     paths_to_check = config.allowed_paths or config.selected_directories or [Path.cwd()]
 
     for path in paths_to_check:
-        if path.is_file() and path.suffix == ".adoc":
+        if path.suffix == ".adoc" and path.is_file():
             adoc_files.append(path)
         elif path.is_dir():
-            # Find all .adoc files recursively, excluding symlinks if configured
-            for adoc_file in path.rglob("*.adoc"):
-                if config.ignore_symlinks:
-                    # Only add if it's NOT a symlink
-                    if not adoc_file.is_symlink():
-                        adoc_files.append(adoc_file)
-                else:
-                    # Add all files (including symlinks)
-                    adoc_files.append(adoc_file)
+            dirs_to_walk.append(path)
+
+    # Selected directories often nest (a directory and its modules
+    # subdirectory both hold files); walk each tree only once
+    dirs_to_walk = _outermost_directories(dirs_to_walk)
+
+    # Find all .adoc files recursively, excluding symlinks if configured.
+    # Walks are bound by directory syscalls, which release the GIL, so
+    # several directories are walked concurrently; map() keeps their order.
+    def walk(path: Path) -> List[Path]:
+        return list(iter_adoc_files(path, config.ignore_symlinks))
+
+    if len(dirs_to_walk) > 1:
+        with ThreadPoolExecutor(max_workers=min(_SCAN_WORKERS, len(dirs_to_walk))) as executor:
+            for found in executor.map(walk, dirs_to_walk):
+                adoc_files.extend(found)
+    elif dirs_to_walk:
+        adoc_files.extend(walk(dirs_to_walk[0]))
 
     return adoc_files
 
 
-def complete_journey():
-    """Complete the journey and generate report."""
-    config_manager = ConfigManager()
+def complete_journey(config_manager: Optional[ConfigManager] = None) -> None:
+    """Complete the journey and generate report.
+
+    Args:
+        config_manager: Configuration manager shared across journey phases
+    """
+    config_manager = config_manager or ConfigManager()
     session = config_manager.load_session()
 
     # Generate report
@@ -1287,29 +1851,33 @@ def generate_preparation_report(session) -> Optional[Path]:
         reports_dir.mkdir(parents=True, exist_ok=True)
 
         # Generate report filename
-        timestamp = datetime.now().strftime("%Y-%m-%d-%H%M%S")
+        now = datetime.now()
+        timestamp = now.strftime("%Y-%m-%d-%H%M%S")
         report_path = reports_dir / f"{timestamp}-preparation-report.md"
 
-        # Write report
-        with open(report_path, 'w') as f:
-            f.write("# Aditi Preparation Report\n\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-
-            f.write("## Summary\n\n")
-            f.write(f"- Repository: {session.journey_progress.get('repository_root', 'Unknown')}\n")
-            f.write(f"- Rules Applied: {len(session.applied_rules)}\n")
-
-            if session.applied_rules:
-                f.write("\n## Rules Applied\n\n")
-                for rule in session.applied_rules:
-                    f.write(f"- {rule}\n")
-
-            f.write("\n## Next Steps\n\n")
-            f.write("1. Review all changes made by Aditi\n")
-            f.write("2. Search for `TBD` placeholders and replace with appropriate values\n")
-            f.write("3. Fix any issues that were flagged with comments\n")
-            f.write("4. Run `aditi check` to verify no issues remain\n")
-            f.write("5. Create a pull request with your changes\n")
+        # Build the report, then write it in one go
+        parts = [
+            "# Aditi Preparation Report\n\n",
+            f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+            "## Summary\n\n",
+            f"- Repository: {session.journey_progress.get('repository_root', 'Unknown')}\n",
+            f"- Rules Applied: {len(session.applied_rules)}\n",
+        ]
+
+        if session.applied_rules:
+            parts.append("\n## Rules Applied\n\n")
+            parts.extend(f"- {rule}\n" for rule in session.applied_rules)
+
+        parts.append(
+            "\n## Next Steps\n\n"
+            "1. Review all changes made by Aditi\n"
+            "2. Search for `TBD` placeholders and replace with appropriate values\n"
+            "3. Fix any issues that were flagged with comments\n"
+            "4. Run `aditi check` to verify no issues remain\n"
+            "5. Create a pull request with your changes\n"
+        )
+
+        report_path.write_text(''.join(parts), encoding='utf-8')
 
         return report_path
 
@@ -75,7 +75,7 @@ def vale_command(
     # Collect all .adoc files
     adoc_files = []
     for path in paths_to_check:
-        if path.is_file() and path.suffix == ".adoc":
+        if path.suffix == ".adoc" and path.is_file():
             adoc_files.append(path)
         elif path.is_dir():
             # Find all .adoc files recursively, handling symlinks based on config
@@ -2,11 +2,13 @@
 
 import json
 import logging
+import os
+from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from pydantic_settings import BaseSettings
 
 logger = logging.getLogger(__name__)
@@ -209,6 +211,11 @@ class AditiConfig(BaseModel):
         True,
         description="Whether to ignore symlinks when scanning"
     )
+    
+    # Resolved allowed paths keyed by (cwd, allowed_paths) for is_path_allowed
+    _allowed_roots_cache: Optional[
+        Tuple[Tuple[str, Tuple[Path, ...]], FrozenSet[Path]]
+    ] = PrivateAttr(default=None)
 
     def get_current_repository(self) -> Optional[RepositoryConfig]:
         """Get the current repository configuration."""
@@ -232,16 +239,24 @@ class AditiConfig(BaseModel):
         # Convert to absolute path for comparison
         abs_path = path.resolve()
         
-        # Check if path is under any allowed path
-        for allowed_path in self.allowed_paths:
-            allowed_abs = allowed_path.resolve()
-            try:
-                abs_path.relative_to(allowed_abs)
-                return True
-            except ValueError:
-                continue
-                
-        return False
+        # Allowed if the path or any of its ancestors is an allowed root
+        roots = self._resolved_allowed_paths()
+        if abs_path in roots:
+            return True
+        return any(parent in roots for parent in abs_path.parents)
+
+    def _resolved_allowed_paths(self) -> FrozenSet[Path]:
+        """Get the resolved allowed paths, rebuilt only when they change.
+        
+        Returns:
+            Frozen set of resolved allowed paths
+        """
+        key = (os.getcwd(), tuple(self.allowed_paths))
+        cached = self._allowed_roots_cache
+        if cached is None or cached[0] != key:
+            cached = (key, frozenset(p.resolve() for p in self.allowed_paths))
+            self._allowed_roots_cache = cached
+        return cached[1]
 
     def add_repository(
         self,
@@ -285,6 +300,7 @@ class ConfigManager:
         self.config_dir = config_dir or Path.home() / "aditi-data"
         self.config_file = self.config_dir / "config.json"
         self.session_file = self.config_dir / "session.json"
+        self.scan_cache_file = self.config_dir / "scan_cache.json"
         self._config: Optional[AditiConfig] = None
         self._session: Optional[SessionState] = None
 
@@ -381,6 +397,9 @@ class ConfigManager:
         elif self._session is None:
             raise ValueError("No session state to save")
 
+        # Stamped here, once per write, rather than by callers on every change
+        self._session.last_updated = datetime.now().isoformat(timespec="seconds")
+
         self.ensure_config_dir()
 
         try:
@@ -396,11 +415,20 @@ class ConfigManager:
             raise
 
     def clear_session(self) -> None:
-        """Clear session state."""
+        """Clear session state, and the scan results saved for it."""
         self._session = SessionState()
         if self.session_file.exists():
             self.session_file.unlink()
             logger.info("Cleared session state")
+        self.clear_scan_cache()
+
+    def clear_scan_cache(self) -> None:
+        """Delete the Vale results saved by earlier journeys."""
+        try:
+            self.scan_cache_file.unlink()
+            logger.info("Cleared scan cache")
+        except FileNotFoundError:
+            pass
             
     def create_default_config(self, scan_for_docs: bool = True) -> AditiConfig:
         """Create a default configuration with automatic path discovery.
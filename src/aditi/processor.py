@@ -4,15 +4,14 @@ This module orchestrates rule execution, manages file operations,
 and tracks changes made to AsciiDoc files.
 """
 
-import json
+import os
 import signal
 import shutil
-import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
@@ -20,11 +19,27 @@ from rich.table import Table
 
 from .config import AditiConfig
 from .vale_container import ValeContainer
-from .vale_parser import ValeParser, Violation, Severity
+from .vale_parser import ValeParser, Violation, Severity, load_vale_json
 from .rules import RuleRegistry, FixType, Fix
 
 console = Console()
 
+# Large batches are split across concurrent Vale containers. Each container
+# is limited to two CPUs, so size the pool to leave headroom.
+VALE_SHARD_MIN_FILES = 200
+VALE_SHARD_WORKERS = max(1, min(4, (os.cpu_count() or 2) // 2))
+
+# Files fixed concurrently; each worker also backs up and rewrites its file
+FIX_WORKERS = 4
+
+
+def _display_path(file_path: Path, cwd: Path) -> Path:
+    """Return the path relative to cwd, or unchanged if it lies outside."""
+    try:
+        return file_path.relative_to(cwd)
+    except ValueError:
+        return file_path
+
 
 @dataclass
 class FileChange:
@@ -84,7 +99,6 @@ class RuleProcessor:
         self.rule_registry = RuleRegistry()
         self._backup_dir: Optional[Path] = None
         self._file_cache: Dict[Path, str] = {}  # Cache file contents to avoid re-reading
-        self._lock = threading.Lock()  # Thread safety for parallel processing
         self._interrupted = False  # Track if processing was interrupted
         self._cleanup_handlers: List[callable] = []  # Cleanup functions to call on interrupt
         
@@ -96,11 +110,11 @@ class RuleProcessor:
         # Set up signal handlers for graceful shutdown
         self._setup_signal_handlers()
         
-    def process_files(self, file_paths: List[Path], dry_run: bool = True, rule_filter: Optional[str] = None) -> ProcessingResult:
+    def process_files(self, file_paths: Iterable[Path], dry_run: bool = True, rule_filter: Optional[str] = None) -> ProcessingResult:
         """Process files through the rule pipeline.
         
         Args:
-            file_paths: List of files to process
+            file_paths: Files to process; any iterable, consumed once
             dry_run: If True, don't apply fixes, just report them
             rule_filter: Optional rule name to filter processing to only that rule
             
@@ -121,8 +135,11 @@ class RuleProcessor:
             self._backup_dir = self._create_backup_directory()
             
         try:
-            # Step 1: Run Vale on all files
-            est_time = len(file_paths) * 0.3  # Rough estimate: 0.3s per file for Vale
+            # Step 1: Run Vale on all files, converting paths to Vale
+            # arguments in a single pass over the input
+            project_root = Path.cwd()
+            path_args = self._vale_path_args(file_paths, project_root)
+            est_time = len(path_args) * 0.3  # Rough estimate: 0.3s per file for Vale
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
@@ -130,24 +147,24 @@ class RuleProcessor:
                 transient=True
             ) as progress:
                 task = progress.add_task(
-                    f"🔍 Running Vale analysis on {len(file_paths)} files (~{est_time:.0f}s estimated)...",
+                    f"🔍 Running Vale analysis on {len(path_args)} files (~{est_time:.0f}s estimated)...",
                     total=None
                 )
-                vale_output = self._run_vale_on_files(file_paths)
+                vale_results = self._run_vale_with_args(path_args, project_root)
             
-            if not vale_output:
+            if vale_results is None:
                 result.errors.append("Failed to run Vale analysis")
                 return result
                 
-            # Step 2: Parse Vale output
-            violations = self.vale_parser.parse_json_output(vale_output)
+            # Step 2: Create violations from the decoded Vale output
+            violations = self.vale_parser.parse_results(vale_results)
             result.violations_found = violations
             
             # Step 3: Group violations by file
             violations_by_file = self.vale_parser.group_by_file(violations)
             
             # Step 4: Process files with parallel processing for better performance
-            max_workers = min(4, len(violations_by_file))  # Limit parallelism
+            max_workers = min(FIX_WORKERS, len(violations_by_file))  # Limit parallelism
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
@@ -164,7 +181,7 @@ class RuleProcessor:
                 with ThreadPoolExecutor(max_workers=max_workers) as executor:
                     # Submit all file processing tasks
                     future_to_file = {
-                        executor.submit(self._process_file_violations, file_path, file_violations, dry_run, rule_filter): file_path
+                        executor.submit(self._fix_file, file_path, file_violations, dry_run, rule_filter): file_path
                         for file_path, file_violations in violations_by_file.items()
                     }
                     
@@ -177,23 +194,14 @@ class RuleProcessor:
                             # Check for interruption before processing results
                             self._check_interrupted()
                             
-                            fixes = future.result()
+                            fixes, applied = future.result()
                             
-                            if fixes:
-                                if not dry_run:
-                                    # Backup and apply fixes (thread-safe)
-                                    with self._lock:
-                                        self._check_interrupted()  # Check again inside critical section
-                                        self._backup_file(file_path)
-                                        applied = self._apply_fixes_to_file(file_path, fixes)
-                                        if applied:
-                                            result.fixes_applied.extend(applied)
-                                            result.files_modified.add(file_path)
-                                        else:
-                                            result.fixes_skipped.extend(fixes)
-                                else:
-                                    # In dry run, all fixes are "skipped"
-                                    result.fixes_skipped.extend(fixes)
+                            if applied:
+                                result.fixes_applied.extend(applied)
+                                result.files_modified.add(file_path)
+                            elif fixes:
+                                # In dry run, or if none applied, all fixes are "skipped"
+                                result.fixes_skipped.extend(fixes)
                                     
                         except KeyboardInterrupt:
                             console.print(f"[yellow]Interrupted while processing {file_path}[/yellow]")
@@ -272,40 +280,131 @@ class RuleProcessor:
             except Exception as e:
                 raise RuntimeError(f"Cannot decode file {file_path}: {e}")
         
-    def _run_vale_on_files(self, file_paths: List[Path]) -> Optional[str]:
+    def _run_vale_on_files(self, file_paths: Iterable[Path]) -> Optional[Dict[str, Any]]:
         """Run Vale on the specified files.
         
         Args:
-            file_paths: List of file paths to check
+            file_paths: Files to check
             
         Returns:
-            JSON output from Vale or None on error
+            Decoded JSON output from Vale or None on error
         """
-        try:
-            # Convert paths to relative paths from current working directory
-            # since the container mounts the project root at /docs
-            project_root = Path.cwd()
-            path_args = []
-            for p in file_paths:
-                try:
-                    rel_path = p.relative_to(project_root)
-                    path_args.append(str(rel_path))
-                except ValueError:
-                    # If file is outside project root, use absolute path
-                    path_args.append(str(p))
+        project_root = Path.cwd()
+        return self._run_vale_with_args(self._vale_path_args(file_paths, project_root), project_root)
+        
+    def _vale_path_args(self, file_paths: Iterable[Path], project_root: Path) -> List[str]:
+        """Convert file paths to Vale command-line arguments.
+        
+        Paths are made relative to the project root, since the container
+        mounts it at /docs; files outside it keep their absolute path.
+        
+        Args:
+            file_paths: Files to check
+            project_root: Directory mounted into the Vale container
             
+        Returns:
+            List of path arguments for Vale
+        """
+        path_args = []
+        for p in file_paths:
+            try:
+                path_args.append(str(p.relative_to(project_root)))
+            except ValueError:
+                # If file is outside project root, use absolute path
+                path_args.append(str(p))
+        return path_args
+        
+    def _run_vale_with_args(self, path_args: List[str], project_root: Path) -> Optional[Dict[str, Any]]:
+        """Run Vale with JSON output on prepared path arguments.
+        
+        The output is decoded here, once, so sharded runs can be merged
+        without encoding them again.
+        
+        Args:
+            path_args: Path arguments from _vale_path_args
+            project_root: Directory mounted into the Vale container
+            
+        Returns:
+            Decoded JSON output from Vale or None on error
+        """
+        try:
+            workers = min(VALE_SHARD_WORKERS, len(path_args) // VALE_SHARD_MIN_FILES)
+            if workers >= 2:
+                return self._run_vale_sharded(path_args, project_root, workers)
             # Run Vale with JSON output using optimized method
             output = self.vale_container.run_vale_raw(
                 ["--output=JSON"] + path_args,
                 project_root
             )
-            
-            return output
-            
         except Exception as e:
             console.print(f"[red]Vale execution failed:[/red] {e}")
             return None
+        return load_vale_json(output) if output else None
+            
+    def _run_vale_sharded(self, path_args: List[str], project_root: Path,
+                          workers: int) -> Optional[Dict[str, Any]]:
+        """Run Vale over contiguous shards of the arguments concurrently.
+        
+        Vale's JSON output is keyed by file, so shard results merge with a
+        plain dict update.
+        
+        Args:
+            path_args: Path arguments from _vale_path_args
+            project_root: Directory mounted into the Vale container
+            workers: Number of shards and concurrent Vale runs
+            
+        Returns:
+            Merged output, or None if any shard produced no output; the
+            failed shards are reported, since partial results would
+            silently leave their files unchecked
+        """
+        shard_size = -(-len(path_args) // workers)  # Ceiling division
+        shards = [path_args[i:i + shard_size] for i in range(0, len(path_args), shard_size)]
+        
+        with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+            outputs = list(executor.map(
+                lambda shard: self.vale_container.run_vale_raw(["--output=JSON"] + shard, project_root),
+                shards
+            ))
+            
+        failed = False
+        merged: Dict[str, Any] = {}
+        for index, (shard, output) in enumerate(zip(shards, outputs, strict=True), start=1):
+            if not output:
+                console.print(
+                    f"[red]Vale produced no output for shard {index}/{len(shards)}[/red] "
+                    f"({len(shard)} files, {shard[0]} to {shard[-1]})"
+                )
+                failed = True
+                continue
+            merged.update(load_vale_json(output))
+        return None if failed else merged
             
+    def _fix_file(self, file_path: Path, violations: List[Violation],
+                  dry_run: bool, rule_filter: Optional[str] = None) -> Tuple[List[Fix], List[Fix]]:
+        """Work out a file's fixes and, unless this is a dry run, apply them.
+        
+        Runs on a worker thread. Each file is backed up and rewritten by
+        its own worker, so the writes overlap instead of queuing behind
+        the thread collecting results.
+        
+        Args:
+            file_path: Path to the file
+            violations: List of violations in the file
+            dry_run: Whether this is a dry run
+            rule_filter: Optional rule name to filter processing to only that rule
+            
+        Returns:
+            Tuple of (fixes found, fixes applied)
+        """
+        fixes = self._process_file_violations(file_path, violations, dry_run, rule_filter)
+        if not fixes or dry_run:
+            return fixes, []
+        
+        self._check_interrupted()
+        self._backup_file(file_path)
+        return fixes, self._apply_fixes_to_file(file_path, fixes)
+        
     def _process_file_violations(self, file_path: Path, violations: List[Violation], 
                                 dry_run: bool, rule_filter: Optional[str] = None) -> List[Fix]:
         """Process violations for a single file.
@@ -475,16 +574,11 @@ class RuleProcessor:
             show_all: If True, show all files without truncation
             max_display: Maximum number of files to show when not showing all
         """
-        if show_all or len(files) <= max_display:
-            # Show all files
-            for file_path in files:
-                rel_path = file_path.relative_to(Path.cwd())
-                console.print(f"  • {rel_path}")
-        else:
-            # Show truncated list
-            for file_path in files[:max_display]:
-                rel_path = file_path.relative_to(Path.cwd())
-                console.print(f"  • {rel_path}")
+        cwd = Path.cwd()
+        truncated = not show_all and len(files) > max_display
+        for file_path in (files[:max_display] if truncated else files):
+            console.print(f"  • {_display_path(file_path, cwd)}")
+        if truncated:
             console.print(f"  ... and {len(files) - max_display} more")
     
     def display_summary(self, result: ProcessingResult, show_all: bool = False, export_files: Optional[Path] = None):
@@ -499,10 +593,16 @@ class RuleProcessor:
         
         # Prepare export data if needed
         export_data = {} if export_files else None
+        cwd = Path.cwd()
         
         # Violations by rule
         rule_counts = result.get_violations_by_rule()
         if rule_counts:
+            # Each rule's affected files, first-seen order, in one pass
+            files_by_rule: Dict[str, Dict[Path, None]] = {}
+            for v in result.violations_found:
+                files_by_rule.setdefault(v.rule_name, {})[v.file_path] = None
+            
             # Group by fix type
             rules = self.rule_registry.get_all_rules()
             rule_fix_types = {rule.name: rule.fix_type for rule in rules}
@@ -525,14 +625,11 @@ class RuleProcessor:
                         console.print(f"  {rule_name} ({count} {'issue' if count == 1 else 'issues'})")
                         
                         # Get affected files for this rule
-                        affected_files = list(set(
-                            v.file_path for v in result.violations_found 
-                            if v.rule_name == rule_name
-                        ))
+                        affected_files = list(files_by_rule.get(rule_name, ()))
                         
                         # Store in export data if needed
                         if export_data is not None:
-                            export_data[rule_name] = [str(f.relative_to(Path.cwd())) for f in affected_files]
+                            export_data[rule_name] = [str(_display_path(f, cwd)) for f in affected_files]
                         
                         # Display files if show_all or in verbose mode
                         if show_all and affected_files:
@@ -579,20 +676,22 @@ class RuleProcessor:
         # Export file list if requested
         if export_files and export_data:
             try:
-                with open(export_files, 'w') as f:
-                    # Write header
-                    f.write(f"# Aditi Check Results - Files with Issues\n")
-                    f.write(f"# Generated: {datetime.now().isoformat()}\n")
-                    f.write(f"# Total files: {len(result.files_processed)}\n")
-                    f.write(f"# Total issues: {result.total_violations}\n\n")
-                    
-                    # Write files by rule
-                    for rule_name in sorted(export_data.keys()):
-                        files = export_data[rule_name]
-                        f.write(f"## {rule_name} ({len(files)} files)\n")
-                        for file_path in sorted(files):
-                            f.write(f"  - {file_path}\n")
-                        f.write("\n")
+                # Build the list, then write it in one go
+                parts = [
+                    "# Aditi Check Results - Files with Issues\n",
+                    f"# Generated: {datetime.now().isoformat()}\n",
+                    f"# Total files: {len(result.files_processed)}\n",
+                    f"# Total issues: {result.total_violations}\n\n",
+                ]
+                
+                # Files by rule
+                for rule_name in sorted(export_data.keys()):
+                    files = export_data[rule_name]
+                    parts.append(f"## {rule_name} ({len(files)} files)\n")
+                    parts.extend(f"  - {file_path}\n" for file_path in sorted(files))
+                    parts.append("\n")
+                
+                Path(export_files).write_text(''.join(parts), encoding='utf-8')
                         
                 console.print(f"\n✓ Full file list exported to: {export_files}")
             except Exception as e:
@@ -4,13 +4,14 @@ This package contains the rule engine that processes Vale violations
 and applies fixes to AsciiDoc files.
 """
 
-from .base import Rule, FixType, Fix
+from .base import Rule, FixType, Fix, INFORMATIONAL_RULES
 from .registry import RuleRegistry, get_rule_registry
 
 __all__ = [
     "Rule",
     "FixType", 
     "Fix",
+    "INFORMATIONAL_RULES",
     "RuleRegistry",
     "get_rule_registry"
 ]
\ No newline at end of file
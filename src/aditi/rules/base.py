@@ -16,6 +16,11 @@ class FixType(Enum):
     NON_DETERMINISTIC = "non_deterministic"
 
 
+# Informational suggestion-level rules that are never fixed or flagged
+# (GitHub issue #26)
+INFORMATIONAL_RULES = frozenset({"AttributeReference", "ConditionalCode", "IncludeDirective", "TagDirective"})
+
+
 @dataclass
 class Fix:
     """Represents a fix for a violation."""
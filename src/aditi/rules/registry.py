@@ -1,9 +1,10 @@
 """Rule registry for discovering and managing rules."""
 
-from typing import Dict, List, Type, Optional
+from typing import Dict, List, Mapping, Type, Optional
 import importlib
 import pkgutil
 from pathlib import Path
+from types import MappingProxyType
 
 from .base import Rule
 from ..vale_parser import Violation
@@ -18,6 +19,7 @@ class RuleRegistry:
     def __init__(self):
         self._rules: Dict[str, Type[Rule]] = {}
         self._instances: Dict[str, Rule] = {}
+        self._by_name = MappingProxyType(self._instances)
         
     def register(self, rule_class: Type[Rule]) -> None:
         """Register a rule class.
@@ -41,6 +43,15 @@ class RuleRegistry:
         """
         return self._instances.get(name)
     
+    @property
+    def by_name(self) -> Mapping[str, Rule]:
+        """Read-only view of registered rule instances keyed by name.
+        
+        The view tracks later registrations, so callers can hold on to it
+        for fast per-violation lookups.
+        """
+        return self._by_name
+    
     def get_rule_for_violation(self, violation: Violation) -> Optional[Rule]:
         """Get the appropriate rule for a violation.
         
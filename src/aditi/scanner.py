@@ -1,14 +1,80 @@
 """Directory scanner for finding AsciiDoc files."""
 
 import os
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from rich.console import Console
 
 console = Console()
 
 
+def iter_adoc_paths(root: Path, ignore_symlinks: bool = True) -> Iterator[str]:
+    """Yield .adoc file paths under a directory using an iterative scandir walk.
+    
+    Hidden directories and node_modules are pruned, and symlinked
+    directories are never followed. File type checks use the information
+    cached on each DirEntry, so non-matching entries cost no extra stat.
+    Paths are yielded as strings, so callers that only count or sample
+    the files don't build a Path for each one.
+    
+    Args:
+        root: Directory to walk
+        ignore_symlinks: Whether to skip symlinked .adoc files
+        
+    Yields:
+        Path strings of .adoc files
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith('.') and entry.name != 'node_modules':
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.adoc'):
+                        if entry.is_symlink():
+                            if not ignore_symlinks and entry.is_file():
+                                yield entry.path
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry.path
+                except OSError:
+                    continue
+
+
+def iter_adoc_files(root: Path, ignore_symlinks: bool = True) -> Iterator[Path]:
+    """Yield .adoc files under a directory, as walked by iter_adoc_paths.
+    
+    Args:
+        root: Directory to walk
+        ignore_symlinks: Whether to skip symlinked .adoc files
+        
+    Yields:
+        Paths of .adoc files
+    """
+    return map(Path, iter_adoc_paths(root, ignore_symlinks))
+
+
+def count_adoc_files(root: Path, limit: Optional[int] = None, ignore_symlinks: bool = True) -> int:
+    """Count .adoc files under a directory without building a list of them.
+    
+    Args:
+        root: Directory to walk
+        limit: Stop counting once this many files are found
+        ignore_symlinks: Whether to skip symlinked .adoc files
+        
+    Returns:
+        Number of .adoc files found, at most limit if one is given
+    """
+    return sum(1 for _ in islice(iter_adoc_paths(root, ignore_symlinks), limit))
+
+
 class DirectoryScanner:
     """Scans directories for AsciiDoc files."""
     
@@ -30,77 +96,86 @@ class DirectoryScanner:
         Returns:
             Dictionary mapping directory paths to count of .adoc files
         """
-        adoc_dirs: Dict[Path, int] = {}
+        try:
+            return dict(self.iter_adoc_dirs(root_path))
+        except (OSError, PermissionError) as e:
+            console.print(f"[red]Error: Cannot scan root directory {root_path}: {e}[/red]")
+            return {}
+        except Exception as e:
+            console.print(f"[red]Unexpected error during directory scan: {e}[/red]")
+            return {}
+    
+    def iter_adoc_dirs(self, root_path: Path) -> Iterator[Tuple[Path, int]]:
+        """Yield directories containing .adoc files as the walk finds them.
+        
+        Lets callers report progress while a large tree is scanned, rather
+        than waiting for the whole result.
         
+        Args:
+            root_path: Root path to start scanning from
+            
+        Yields:
+            Tuples of (directory path relative to root_path, count of .adoc files)
+        """
         # Load .gitignore patterns if available
         gitignore_path = root_path / ".gitignore"
         if gitignore_path.exists():
             self._load_gitignore(gitignore_path)
         
         # Walk the directory tree with error handling
-        try:
-            for dirpath, dirnames, filenames in os.walk(root_path, followlinks=not self.ignore_symlinks):
-                try:
-                    current_dir = Path(dirpath)
-                    
-                    # Check if directory is accessible
-                    if not current_dir.exists() or not os.access(current_dir, os.R_OK):
-                        console.print(f"[yellow]Warning: Cannot access directory {current_dir}[/yellow]")
-                        dirnames.clear()  # Don't recurse into inaccessible directories
-                        continue
-                    
-                    # Skip hidden directories and common build/vendor directories
-                    dirnames[:] = [
-                        d for d in dirnames 
-                        if not d.startswith('.') 
-                        and d not in {'node_modules', 'vendor', 'build', 'dist', 'target', '__pycache__', '.git'}
-                        and len(d) < 255  # Avoid extremely long directory names
-                    ]
-                    
-                    # Skip if path matches gitignore patterns
-                    if self._should_ignore(current_dir, root_path):
-                        dirnames.clear()  # Don't recurse into ignored directories
-                        continue
-                    
-                    # Count .adoc files in current directory with safety checks
-                    adoc_count = 0
-                    for f in filenames:
-                        if (f.endswith('.adoc') and not f.startswith('.') 
-                            and len(f) < 255 and self._is_safe_filename(f)):
-                            # Additional check to ensure the file is actually accessible
-                            file_path = current_dir / f
-                            try:
-                                if file_path.exists() and os.access(file_path, os.R_OK):
-                                    adoc_count += 1
-                            except (OSError, PermissionError):
-                                console.print(f"[yellow]Warning: Cannot access file {file_path}[/yellow]")
-                                continue
-                    
-                    if adoc_count > 0:
-                        try:
-                            # Store relative path for display
-                            rel_path = current_dir.relative_to(root_path)
-                            adoc_dirs[rel_path] = adoc_count
-                        except ValueError:
-                            # Handle case where current_dir is not relative to root_path
-                            console.print(f"[yellow]Warning: Path {current_dir} is not under {root_path}[/yellow]")
-                            continue
-                            
-                except (OSError, PermissionError) as e:
-                    console.print(f"[yellow]Warning: Error processing directory {dirpath}: {e}[/yellow]")
+        for dirpath, dirnames, filenames in os.walk(root_path, followlinks=not self.ignore_symlinks):
+            try:
+                current_dir = Path(dirpath)
+                
+                # Check if directory is accessible
+                if not current_dir.exists() or not os.access(current_dir, os.R_OK):
+                    console.print(f"[yellow]Warning: Cannot access directory {current_dir}[/yellow]")
+                    dirnames.clear()  # Don't recurse into inaccessible directories
                     continue
-                except Exception as e:
-                    console.print(f"[yellow]Warning: Unexpected error in directory {dirpath}: {e}[/yellow]")
+                
+                # Skip hidden directories and common build/vendor directories
+                dirnames[:] = [
+                    d for d in dirnames 
+                    if not d.startswith('.') 
+                    and d not in {'node_modules', 'vendor', 'build', 'dist', 'target', '__pycache__', '.git'}
+                    and len(d) < 255  # Avoid extremely long directory names
+                ]
+                
+                # Skip if path matches gitignore patterns
+                if self._should_ignore(current_dir, root_path):
+                    dirnames.clear()  # Don't recurse into ignored directories
                     continue
-                    
-        except (OSError, PermissionError) as e:
-            console.print(f"[red]Error: Cannot scan root directory {root_path}: {e}[/red]")
-            return {}
-        except Exception as e:
-            console.print(f"[red]Unexpected error during directory scan: {e}[/red]")
-            return {}
                 
-        return adoc_dirs
+                # Count .adoc files in current directory with safety checks
+                adoc_count = 0
+                for f in filenames:
+                    if (f.endswith('.adoc') and not f.startswith('.') 
+                        and len(f) < 255 and self._is_safe_filename(f)):
+                        # Additional check to ensure the file is actually accessible
+                        file_path = current_dir / f
+                        try:
+                            if file_path.exists() and os.access(file_path, os.R_OK):
+                                adoc_count += 1
+                        except (OSError, PermissionError):
+                            console.print(f"[yellow]Warning: Cannot access file {file_path}[/yellow]")
+                            continue
+                
+                if adoc_count > 0:
+                    try:
+                        # Store relative path for display
+                        rel_path = current_dir.relative_to(root_path)
+                    except ValueError:
+                        # Handle case where current_dir is not relative to root_path
+                        console.print(f"[yellow]Warning: Path {current_dir} is not under {root_path}[/yellow]")
+                        continue
+                    yield rel_path, adoc_count
+                        
+            except (OSError, PermissionError) as e:
+                console.print(f"[yellow]Warning: Error processing directory {dirpath}: {e}[/yellow]")
+                continue
+            except Exception as e:
+                console.print(f"[yellow]Warning: Unexpected error in directory {dirpath}: {e}[/yellow]")
+                continue
     
     def _is_safe_filename(self, filename: str) -> bool:
         """Check if filename is safe to process.
@@ -4,14 +4,16 @@ This module provides a wrapper around Podman/Docker to run Vale with AsciiDocDIT
 It handles container lifecycle, mounting volumes, and processing Vale output.
 """
 
+import functools
 import json
 import logging
 import os
 import shutil
 import subprocess
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Set
 
 from rich.console import Console
 
@@ -25,6 +27,10 @@ class ValeContainer:
     VALE_IMAGE = "docker.io/jdkato/vale:latest"
     CONTAINER_NAME = "aditi-vale"
 
+    # Runtimes known to have the Vale image locally. The image does not go
+    # away during a run, so this is shared by every instance in the process.
+    _image_verified_runtimes: Set[str] = set()
+
     def __init__(self, use_podman: bool = True):
         """Initialize Vale container manager.
 
@@ -33,7 +39,6 @@ class ValeContainer:
         """
         self.runtime = "podman" if use_podman else "docker"
         self._check_runtime_available()
-        self._image_pulled = False  # Cache image pull status
 
     def _check_runtime_available(self) -> None:
         """Check if container runtime is available."""
@@ -67,8 +72,8 @@ class ValeContainer:
 
     def ensure_image_exists(self) -> None:
         """Ensure the Vale image exists locally, pull if needed."""
-        # Return early if we've already verified the image exists
-        if self._image_pulled:
+        # Return early if this process has already verified the image
+        if self.runtime in self._image_verified_runtimes:
             return
             
         try:
@@ -79,11 +84,10 @@ class ValeContainer:
                 text=True
             )
             logger.debug(f"Vale image {self.VALE_IMAGE} already exists")
-            self._image_pulled = True
         except subprocess.CalledProcessError:
             logger.info(f"Vale image not found locally, pulling...")
             self.pull_image()
-            self._image_pulled = True
+        self._image_verified_runtimes.add(self.runtime)
 
     def init_vale_config(self, project_root: Path, force: bool = False) -> None:
         """Initialize Vale configuration in the project.
@@ -340,8 +344,19 @@ class ValeContainer:
         Returns:
             Path to the temporary config file
         """
-        import tempfile
+        return self.create_rules_config([rule_name], project_root, f"vale_{rule_name}.ini")
+
+    def create_rules_config(self, rule_names: List[str], project_root: Path, config_name: str) -> Path:
+        """Create a temporary Vale config that runs only the given rules.
         
+        Args:
+            rule_names: Names of the rules to run (e.g., ["ContentType"])
+            project_root: Project root directory
+            config_name: File name for the config inside .vale_temp/
+            
+        Returns:
+            Path to the temporary config file
+        """
         # Read the original config to get styles path
         original_config = project_root / ".vale.ini"
         if not original_config.exists():
@@ -376,9 +391,10 @@ class ValeContainer:
         ]
         
         # Build rule settings
+        enabled_rules = set(rule_names)
         rule_settings = []
         for r in all_rules:
-            if r == rule_name:
+            if r in enabled_rules:
                 rule_settings.append(f"AsciiDocDITA.{r} = YES")
             else:
                 rule_settings.append(f"AsciiDocDITA.{r} = NO")
@@ -387,7 +403,7 @@ class ValeContainer:
         
         # Create temp config content
         temp_config_content = f"""
-# Temporary Vale config for single rule: {rule_name}
+# Temporary Vale config for rules: {', '.join(rule_names)}
 StylesPath = {styles_path}
 MinAlertLevel = suggestion
 
@@ -401,7 +417,7 @@ BasedOnStyles = AsciiDocDITA
         # Create temp file in project root (so relative paths work)
         temp_dir = project_root / ".vale_temp"
         temp_dir.mkdir(exist_ok=True)
-        temp_config = temp_dir / f"vale_{rule_name}.ini"
+        temp_config = temp_dir / config_name
         temp_config.write_text(temp_config_content)
         
         # Ensure file is flushed to disk before container runs
@@ -415,7 +431,7 @@ BasedOnStyles = AsciiDocDITA
             # Fallback: just sync all pending filesystem operations
             os.sync()
         
-        logger.debug(f"Created temporary Vale config for rule {rule_name}: {temp_config}")
+        logger.debug(f"Created temporary Vale config for rules {', '.join(rule_names)}: {temp_config}")
         return temp_config
 
     def run_vale_single_rule(self, rule_name: str, file_paths: List[str], project_root: Optional[Path] = None) -> str:
@@ -426,6 +442,26 @@ BasedOnStyles = AsciiDocDITA
             file_paths: List of file paths to check
             project_root: Project root directory. Defaults to current directory.
             
+        Returns:
+            Vale JSON output as string
+        """
+        return self.run_vale_rules([rule_name], file_paths, project_root, config_name=f"vale_{rule_name}.ini")
+
+    def run_vale_rules(
+        self,
+        rule_names: List[str],
+        file_paths: List[str],
+        project_root: Optional[Path] = None,
+        config_name: str = "vale_rules.ini"
+    ) -> str:
+        """Run Vale with only the given rules enabled.
+        
+        Args:
+            rule_names: Names of the rules to run
+            file_paths: List of file paths to check
+            project_root: Project root directory. Defaults to current directory.
+            config_name: File name for the temporary config inside .vale_temp/
+            
         Returns:
             Vale JSON output as string
         """
@@ -433,7 +469,7 @@ BasedOnStyles = AsciiDocDITA
             project_root = Path.cwd()
             
         # Create temporary config
-        temp_config = self.create_single_rule_config(rule_name, project_root)
+        temp_config = self.create_rules_config(rule_names, project_root, config_name)
         
         # Verify the temp config file exists before running container
         if not temp_config.exists():
@@ -452,11 +488,11 @@ BasedOnStyles = AsciiDocDITA
                 "-v", f"{project_root.absolute()}:/docs:ro",
                 "-w", "/docs",
                 self.VALE_IMAGE,
-                "--config", f".vale_temp/vale_{rule_name}.ini",  # Use temp config
+                "--config", f".vale_temp/{config_name}",  # Use temp config
                 "--output", "JSON"
             ] + file_paths
             
-            logger.debug(f"Running Vale for single rule {rule_name}: {' '.join(cmd)}")
+            logger.debug(f"Running Vale for rules {', '.join(rule_names)}: {' '.join(cmd)}")
             logger.debug(f"Working directory: {project_root}")
             logger.debug(f"Temp config path relative to project root: {temp_config.relative_to(project_root)}")
             logger.debug(f"Container runtime: {self.runtime}")
@@ -568,9 +604,13 @@ BasedOnStyles = AsciiDocDITA
             logger.warning(f"Failed to cleanup container: {e}")
 
 
+@functools.lru_cache(maxsize=1)
 def check_container_runtime() -> str:
     """Check which container runtime is available.
 
+    The result is cached for the life of the process; a failed probe is
+    not cached, so it is retried on the next call.
+
     Returns:
         'podman' or 'docker' based on availability
 
@@ -592,4 +632,42 @@ def check_container_runtime() -> str:
     raise RuntimeError(
         "Neither Podman nor Docker is available. "
         "Please install Podman (recommended) or Docker to use Aditi."
-    )
\ No newline at end of file
+    )
+
+
+# Shared container manager for commands run in the same process
+_shared_container: Optional[ValeContainer] = None
+_shared_refs = 0
+_shared_lock = threading.Lock()
+
+
+def get_shared_container() -> ValeContainer:
+    """Get the process-wide Vale container manager.
+
+    The instance is created on first use and kept for the life of the
+    process, so later commands skip the runtime and image checks. Each call
+    must be paired with release_shared_container().
+
+    Returns:
+        The shared ValeContainer instance
+    """
+    global _shared_container, _shared_refs
+    with _shared_lock:
+        if _shared_container is None:
+            _shared_container = ValeContainer()
+        _shared_refs += 1
+        return _shared_container
+
+
+def release_shared_container() -> None:
+    """Release a reference taken with get_shared_container().
+
+    Containers are cleaned up once the last user releases the manager.
+    """
+    global _shared_refs
+    with _shared_lock:
+        if _shared_refs == 0:
+            return
+        _shared_refs -= 1
+        if _shared_refs == 0 and _shared_container is not None:
+            _shared_container.cleanup()
@@ -7,13 +7,37 @@ for processing by the rule engine.
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from enum import Enum
 
 from rich.console import Console
 
 console = Console()
 
+_loads_json: Callable[[str | bytes], Any]
+try:
+    # Optional faster decoder for large Vale reports
+    from orjson import loads as _orjson_loads
+    _loads_json = _orjson_loads
+except ImportError:
+    _loads_json = json.loads
+
+
+def load_vale_json(json_output: str) -> Any:
+    """Decode Vale JSON output, using orjson when it is installed.
+    
+    Args:
+        json_output: Raw JSON output from Vale
+        
+    Returns:
+        Decoded JSON value
+        
+    Raises:
+        json.JSONDecodeError: If the output is not valid JSON (orjson's
+            error type is a subclass)
+    """
+    return _loads_json(json_output)
+
 
 class Severity(Enum):
     """Vale violation severity levels."""
@@ -83,11 +107,22 @@ class ValeParser:
             ValueError: If the JSON structure is unexpected
         """
         try:
-            vale_results = json.loads(json_output)
+            vale_results = load_vale_json(json_output)
         except json.JSONDecodeError as e:
             console.print(f"[red]Error parsing Vale output:[/red] {e}")
             raise
 
+        return self.parse_results(vale_results)
+
+    def parse_results(self, vale_results: Dict[str, Any]) -> List[Violation]:
+        """Create violations from Vale output that is already decoded.
+        
+        Args:
+            vale_results: Decoded Vale JSON output, keyed by file path
+            
+        Returns:
+            List of Violation objects
+        """
         violations = []
         
         # Vale output is a dictionary with file paths as keys
@@ -127,9 +162,10 @@ class ValeParser:
         grouped: Dict[Path, List[Violation]] = {}
         
         for violation in violations:
-            if violation.file_path not in grouped:
-                grouped[violation.file_path] = []
-            grouped[violation.file_path].append(violation)
+            bucket = grouped.get(violation.file_path)
+            if bucket is None:
+                bucket = grouped[violation.file_path] = []
+            bucket.append(violation)
             
         return grouped
 
@@ -145,12 +181,37 @@ class ValeParser:
         grouped: Dict[str, List[Violation]] = {}
         
         for violation in violations:
-            if violation.rule_name not in grouped:
-                grouped[violation.rule_name] = []
-            grouped[violation.rule_name].append(violation)
+            bucket = grouped.get(violation.rule_name)
+            if bucket is None:
+                bucket = grouped[violation.rule_name] = []
+            bucket.append(violation)
             
         return grouped
 
+    def sample_by_rule(self, violations: List[Violation], limit: int) -> Dict[str, Tuple[int, List[Violation]]]:
+        """Count violations per rule, keeping only the first few of each.
+        
+        Args:
+            violations: List of violations to group
+            limit: Maximum number of violations to keep per rule
+            
+        Returns:
+            Dictionary mapping rule names to (total count, first violations)
+        """
+        counts: Dict[str, int] = {}
+        samples: Dict[str, List[Violation]] = {}
+        
+        for violation in violations:
+            rule_name = violation.rule_name
+            count = counts.get(rule_name, 0)
+            if count == 0:
+                samples[rule_name] = []
+            if count < limit:
+                samples[rule_name].append(violation)
+            counts[rule_name] = count + 1
+            
+        return {rule_name: (counts[rule_name], samples[rule_name]) for rule_name in counts}
+
     def filter_by_severity(self, violations: List[Violation], severity: Severity) -> List[Violation]:
         """Filter violations by severity level.
         
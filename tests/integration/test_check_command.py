@@ -1,5 +1,6 @@
 """Integration tests for the check command."""
 
+import os
 import pytest
 from pathlib import Path
 from typer.testing import CliRunner
@@ -8,7 +9,7 @@ from unittest.mock import Mock, patch
 from aditi.cli import app
 from aditi.config import AditiConfig, ConfigManager
 from aditi.processor import ProcessingResult
-from aditi.vale_parser import Violation, Severity
+from aditi.vale_parser import ValeParser, Violation, Severity
 
 
 class TestCheckCommand:
@@ -51,7 +52,8 @@ class TestCheckCommand:
     def test_check_command_with_path(self, runner, test_files, mock_config):
         """Test check command with explicit path."""
         with patch('aditi.commands.check.ConfigManager') as mock_cm, \
-             patch('aditi.commands.check.ValeContainer') as mock_vc, \
+             patch('aditi.commands.check.get_shared_container') as mock_vc, \
+             patch('aditi.commands.check.release_shared_container') as mock_release, \
              patch('aditi.commands.check.RuleProcessor') as mock_rp:
             
             # Setup mocks
@@ -89,8 +91,8 @@ class TestCheckCommand:
             assert result.exit_code == 0
             assert "Analyzing AsciiDoc files" in result.output
             
-            # Verify Vale container was cleaned up
-            mock_vale.cleanup.assert_called_once()
+            # Verify the shared Vale container was released
+            mock_release.assert_called_once_with()
     
     def test_check_command_no_adoc_files(self, runner, tmp_path, mock_config):
         """Test check command when no .adoc files are found."""
@@ -110,7 +112,7 @@ class TestCheckCommand:
     def test_check_command_with_rule_filter(self, runner, test_files, mock_config):
         """Test check command with rule filter."""
         with patch('aditi.commands.check.ConfigManager') as mock_cm, \
-             patch('aditi.commands.check.ValeContainer') as mock_vc, \
+             patch('aditi.commands.check.get_shared_container') as mock_vc, \
              patch('aditi.commands.check.RuleProcessor') as mock_rp:
             
             # Setup mocks
@@ -142,7 +144,7 @@ class TestCheckCommand:
     def test_check_command_verbose_mode(self, runner, test_files, mock_config):
         """Test check command in verbose mode."""
         with patch('aditi.commands.check.ConfigManager') as mock_cm, \
-             patch('aditi.commands.check.ValeContainer') as mock_vc, \
+             patch('aditi.commands.check.get_shared_container') as mock_vc, \
              patch('aditi.commands.check.RuleProcessor') as mock_rp:
             
             # Setup mocks
@@ -172,10 +174,8 @@ class TestCheckCommand:
             
             mock_processor = Mock()
             mock_processor.process_files.return_value = mock_result
-            mock_processor.vale_parser.group_by_rule.return_value = {
-                "EntityReference": mock_result.violations_found
-            }
-            mock_processor.rule_registry.get_all_rules.return_value = []
+            mock_processor.vale_parser = ValeParser()
+            mock_processor.rule_registry.by_name = {}
             mock_rp.return_value = mock_processor
             
             # Ensure the vale container mock has ensure_image_exists method
@@ -189,10 +189,28 @@ class TestCheckCommand:
             assert result.exit_code == 0
             assert "Detailed Analysis Results" in result.output
     
+    def test_verbose_results_show_paths_outside_cwd(self, tmp_path, capsys):
+        """Test that verbose output falls back to absolute paths outside the working directory."""
+        from aditi.commands.check import _display_verbose_results
+        
+        violation = Violation(
+            tmp_path / "outside.adoc", "EntityReference", 1, 1,
+            "Replace entity", Severity.ERROR, "&nbsp;"
+        )
+        result = Mock(violations_found=[violation])
+        processor = Mock()
+        processor.vale_parser = ValeParser()
+        processor.rule_registry.by_name = {}
+        
+        with patch('pathlib.Path.cwd', return_value=tmp_path / "elsewhere"):
+            _display_verbose_results(result, processor)
+        
+        assert "Replace entity" in capsys.readouterr().out
+    
     def test_check_command_with_errors(self, runner, test_files, mock_config):
         """Test check command when errors occur."""
         with patch('aditi.commands.check.ConfigManager') as mock_cm, \
-             patch('aditi.commands.check.ValeContainer') as mock_vc, \
+             patch('aditi.commands.check.get_shared_container') as mock_vc, \
              patch('aditi.commands.check.RuleProcessor') as mock_rp:
             
             # Setup mocks
@@ -225,7 +243,7 @@ class TestCheckCommand:
     def test_check_command_vale_setup_failure(self, runner, test_files, mock_config):
         """Test check command when Vale setup fails."""
         with patch('aditi.commands.check.ConfigManager') as mock_cm, \
-             patch('aditi.commands.check.ValeContainer') as mock_vc:
+             patch('aditi.commands.check.get_shared_container') as mock_vc:
             
             # Setup mocks
             mock_cm.return_value.load_config.return_value = mock_config
@@ -238,4 +256,103 @@ class TestCheckCommand:
             result = runner.invoke(app, ["check", str(test_files)])
             
             assert result.exit_code == 1
-            assert "Failed to initialize Vale" in result.output
\ No newline at end of file
+            assert "Failed to initialize Vale" in result.output
+    
+    def test_check_command_passes_empty_files_to_vale(self, runner, test_files, mock_config):
+        """Test that empty .adoc files are checked rather than reported as invalid."""
+        (test_files / "empty.adoc").write_text("")
+        
+        with patch('aditi.commands.check.ConfigManager') as mock_cm, \
+             patch('aditi.commands.check.get_shared_container'), \
+             patch('aditi.commands.check.RuleProcessor') as mock_rp:
+            
+            mock_cm.return_value.load_config.return_value = mock_config
+            mock_processor = Mock()
+            mock_processor.process_files.return_value = ProcessingResult(
+                violations_found=[],
+                fixes_applied=[],
+                fixes_skipped=[],
+                files_processed=set(),
+                files_modified=set(),
+                errors=[]
+            )
+            mock_rp.return_value = mock_processor
+            
+            result = runner.invoke(app, ["check", str(test_files)])
+            
+            assert result.exit_code == 0
+            assert "invalid file" not in result.output
+            checked = mock_processor.process_files.call_args[0][0]
+            assert sorted(p.name for p in checked) == ["empty.adoc", "test1.adoc", "test2.adoc"]
+    
+    def test_check_command_truncates_invalid_file_report(self, runner, test_files, mock_config):
+        """Test that only the first invalid files are listed, with a count of the rest."""
+        for i in range(8):
+            (test_files / f"bad{i}.adoc").write_text("= Bad")
+        
+        def file_problem(path):
+            return "permission denied" if path.name.startswith("bad") else None
+        
+        with patch('aditi.commands.check.ConfigManager') as mock_cm, \
+             patch('aditi.commands.check.get_shared_container'), \
+             patch('aditi.commands.check.RuleProcessor') as mock_rp, \
+             patch('aditi.commands.check._adoc_file_problem', side_effect=file_problem):
+            
+            mock_cm.return_value.load_config.return_value = mock_config
+            mock_processor = Mock()
+            mock_processor.process_files.return_value = ProcessingResult(
+                violations_found=[],
+                fixes_applied=[],
+                fixes_skipped=[],
+                files_processed=set(),
+                files_modified=set(),
+                errors=[]
+            )
+            mock_rp.return_value = mock_processor
+            
+            result = runner.invoke(app, ["check", str(test_files)])
+            
+            assert result.exit_code == 0
+            assert "Skipping 8 invalid file(s)" in result.output
+            assert result.output.count("permission denied") == 5
+            assert "... and 3 more" in result.output
+    
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="FIFOs not supported")
+    def test_adoc_file_problem_classifies_files(self, tmp_path):
+        """Test that readable files pass and non-regular files are rejected without blocking."""
+        from aditi.commands.check import _adoc_file_problem
+        
+        regular = tmp_path / "ok.adoc"
+        regular.write_text("= Title")
+        fifo = tmp_path / "pipe.adoc"
+        os.mkfifo(fifo)
+        
+        assert _adoc_file_problem(regular) is None
+        assert _adoc_file_problem(fifo) == "not a regular file"
+        assert "No such file" in _adoc_file_problem(tmp_path / "missing.adoc")
+    
+    def test_check_command_deduplicates_overlapping_paths(self, runner, test_files, mock_config):
+        """Test that files reached through overlapping paths are checked once, in order."""
+        with patch('aditi.commands.check.ConfigManager') as mock_cm, \
+             patch('aditi.commands.check.get_shared_container'), \
+             patch('aditi.commands.check.RuleProcessor') as mock_rp:
+            
+            mock_cm.return_value.load_config.return_value = mock_config
+            mock_processor = Mock()
+            mock_processor.process_files.return_value = ProcessingResult(
+                violations_found=[],
+                fixes_applied=[],
+                fixes_skipped=[],
+                files_processed=set(),
+                files_modified=set(),
+                errors=[]
+            )
+            mock_rp.return_value = mock_processor
+            
+            result = runner.invoke(
+                app, ["check", str(test_files / "test2.adoc"), str(test_files)]
+            )
+            
+            assert result.exit_code == 0
+            checked = mock_processor.process_files.call_args[0][0]
+            assert [p.name for p in checked] == ["test1.adoc", "test2.adoc"]
@@ -0,0 +1,226 @@
+"""Tests for CLI helpers."""
+
+import runpy
+from importlib.metadata import PackageNotFoundError
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from aditi import cli
+
+
+class TestGetVersion:
+    """Test version lookup."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Reset the memoized version around each test."""
+        cli.get_version.cache_clear()
+        yield
+        cli.get_version.cache_clear()
+
+    def test_prefers_package_metadata(self):
+        """Test that installed metadata is used without reading pyproject.toml."""
+        with patch("importlib.metadata.version", return_value="9.9.9"), \
+             patch("builtins.open") as mock_open:
+            assert cli.get_version() == "9.9.9"
+            mock_open.assert_not_called()
+
+    def test_falls_back_to_pyproject(self):
+        """Test that pyproject.toml is read when metadata is missing."""
+        with patch("importlib.metadata.version", side_effect=PackageNotFoundError):
+            version = cli.get_version()
+        assert version != "unknown"
+        assert version[0].isdigit()
+
+    def test_result_is_memoized(self):
+        """Test that repeated calls reuse the first lookup."""
+        with patch("importlib.metadata.version", return_value="1.2.3") as mock_version:
+            cli.get_version()
+            cli.get_version()
+        mock_version.assert_called_once()
+
+    def test_pyproject_parse_is_cached(self):
+        """Test that an unchanged pyproject.toml is parsed only once."""
+        cli._PYPROJECT_CACHE.clear()
+        with patch("importlib.metadata.version", side_effect=PackageNotFoundError):
+            first = cli.get_version()
+            cli.get_version.cache_clear()
+            with patch("tomllib.load") as mock_load:
+                second = cli.get_version()
+        assert first == second
+        mock_load.assert_not_called()
+
+
+class TestCompletion:
+    """Test the completion command."""
+
+    @pytest.fixture
+    def runner(self):
+        """Create CLI test runner."""
+        return CliRunner()
+
+    @pytest.fixture
+    def fake_getter(self):
+        """Replace the bound completion generator with a stub."""
+        calls = []
+
+        def getter(_command, shell, prog):
+            calls.append((shell, prog))
+            return f"# script for {shell} as {prog}"
+
+        with patch.object(cli, "_GET_COMPLETION", getter):
+            yield calls
+
+    def test_show_uses_shell_program_name(self, runner, fake_getter):
+        """Test that --show renders the script for the requested shell."""
+        result = runner.invoke(cli.app, ["completion", "zsh", "--show"])
+        assert result.exit_code == 0
+        assert fake_getter == [("zsh", "_aditi")]
+        assert "# script for zsh as _aditi" in result.stdout
+
+    @pytest.mark.usefixtures("fake_getter")
+    def test_install_fish_writes_completion_file(self, runner, tmp_path):
+        """Test that --install writes the script to the shell's completion path."""
+        with patch("pathlib.Path.home", return_value=tmp_path):
+            result = runner.invoke(cli.app, ["completion", "fish", "--install"])
+        assert result.exit_code == 0
+        target = tmp_path / ".config" / "fish" / "completions" / "aditi.fish"
+        assert target.read_text() == "# script for fish as aditi"
+
+    @pytest.mark.usefixtures("fake_getter")
+    def test_install_bash_replaces_existing_block(self, runner, tmp_path):
+        """Test that reinstalling bash completion rewrites the aditi block in place."""
+        completion_file = tmp_path / ".bash_completion"
+        completion_file.write_text(
+            "# other tool\n"
+            "# >>> aditi completion >>>\nold script\n# <<< aditi completion <<<\n"
+            "# trailing\n"
+        )
+        with patch("pathlib.Path.home", return_value=tmp_path):
+            result = runner.invoke(cli.app, ["completion", "bash", "--install"])
+        assert result.exit_code == 0
+        assert completion_file.read_text() == (
+            "# other tool\n"
+            "# >>> aditi completion >>>\n# script for bash as aditi\n# <<< aditi completion <<<\n"
+            "# trailing\n"
+        )
+
+    @pytest.mark.usefixtures("fake_getter")
+    def test_install_bash_appends_block(self, runner, tmp_path):
+        """Test that bash completion is appended when not yet installed."""
+        completion_file = tmp_path / ".bash_completion"
+        completion_file.write_text("# other tool\n")
+        with patch("pathlib.Path.home", return_value=tmp_path):
+            result = runner.invoke(cli.app, ["completion", "bash", "--install"])
+        assert result.exit_code == 0
+        assert completion_file.read_text().endswith(
+            "# >>> aditi completion >>>\n# script for bash as aditi\n# <<< aditi completion <<<\n"
+        )
+        assert completion_file.read_text().startswith("# other tool\n")
+
+    @pytest.mark.usefixtures("fake_getter")
+    def test_click_command_is_built_once(self, runner):
+        """Test that the Click command tree is reused across invocations."""
+        cli._click_command.cache_clear()
+        with patch("typer.main.get_command") as mock_get_command:
+            runner.invoke(cli.app, ["completion", "bash", "--show"])
+            runner.invoke(cli.app, ["completion", "zsh", "--show"])
+        mock_get_command.assert_called_once_with(cli.app)
+        cli._click_command.cache_clear()
+
+    @pytest.mark.usefixtures("fake_getter")
+    @pytest.mark.parametrize("shell_env,expected", [
+        ("/usr/bin/zsh", "zsh"),
+        ("/opt/homebrew/bin/fish", "fish"),
+        ("/bin/tcsh", "bash"),
+        ("", "bash"),
+    ])
+    def test_detects_shell_from_environment(self, runner, monkeypatch, shell_env, expected):
+        """Test that the shell is detected from the SHELL basename."""
+        monkeypatch.setenv("SHELL", shell_env)
+        result = runner.invoke(cli.app, ["completion"])
+        assert result.exit_code == 0
+        assert f"Detected shell: {expected}" in result.stdout
+
+    @pytest.mark.usefixtures("fake_getter")
+    def test_unsupported_shell(self, runner):
+        """Test that an unknown shell is rejected."""
+        result = runner.invoke(cli.app, ["completion", "tcsh", "--show"])
+        assert result.exit_code == 1
+        assert "Unsupported shell 'tcsh'. Supported shells: bash, zsh, fish, powershell" in result.stdout
+
+    def test_unavailable_prints_manual_instructions(self, runner):
+        """Test the fallback when no completion generator is available."""
+        with patch.object(cli, "_GET_COMPLETION", None):
+            result = runner.invoke(cli.app, ["completion", "--show"])
+        assert result.exit_code == 0
+        assert "Manual setup instructions" in result.stdout
+
+
+class TestDryRunHelp:
+    """Test the --dry-run help text."""
+
+    def test_journey_keeps_its_own_help(self):
+        """Test that journey describes its dry run, not the shared one."""
+        result = CliRunner().invoke(cli.app, ["journey", "--help"], env={"COLUMNS": "200"})
+        assert "Show what would be configured and fixed" in result.stdout
+
+
+class TestSetupLogging:
+    """Test logging configuration."""
+
+    def test_configures_only_once(self):
+        """Test that repeated calls do not rebuild the handler."""
+        with patch.object(cli.setup_logging, "_configured", False, create=True), \
+             patch("logging.basicConfig") as mock_basic_config:
+            cli.setup_logging()
+            cli.setup_logging(verbose=True)
+        mock_basic_config.assert_called_once()
+
+    def test_later_verbose_call_raises_level(self):
+        """Test that verbose=True after the first call still enables DEBUG."""
+        import logging
+
+        root_logger = logging.getLogger()
+        saved_level = root_logger.level
+        try:
+            with patch.object(cli.setup_logging, "_configured", True, create=True), \
+                 patch.object(cli.setup_logging, "_handler", None, create=True):
+                cli.setup_logging(verbose=True)
+                assert root_logger.level == logging.DEBUG
+                assert logging.getLogger("urllib3").level == logging.NOTSET
+                cli.setup_logging()
+                assert root_logger.level == logging.INFO
+                assert logging.getLogger("urllib3").level == logging.WARNING
+        finally:
+            root_logger.setLevel(saved_level)
+
+
+class TestRun:
+    """Test the console-script entry point."""
+
+    @pytest.mark.parametrize("flag", ["--version", "-V"])
+    def test_version_fast_path_skips_app(self, flag, capsys):
+        """Test that a bare version flag is answered without invoking the app."""
+        with patch("sys.argv", ["aditi", flag]), \
+             patch.object(cli, "app") as mock_app:
+            cli.run()
+        mock_app.assert_not_called()
+        assert f"aditi version {cli.get_version()}" in capsys.readouterr().out
+
+    def test_other_arguments_dispatch_to_app(self):
+        """Test that anything else is handled by the Typer app."""
+        with patch("sys.argv", ["aditi", "check", "--help"]), \
+             patch.object(cli, "app") as mock_app:
+            cli.run()
+        mock_app.assert_called_once_with()
+
+    def test_module_entry_point_uses_run(self, capsys):
+        """Test that python -m aditi takes the same version fast path."""
+        with patch("sys.argv", ["aditi", "--version"]), \
+             patch.object(cli, "app") as mock_app:
+            runpy.run_module("aditi", run_name="__main__")
+        mock_app.assert_not_called()
+        assert f"aditi version {cli.get_version()}" in capsys.readouterr().out
@@ -167,6 +167,22 @@ class TestAditiConfig:
         assert repo.root == temp_dir.resolve()
 
 
+    def test_is_path_allowed_with_allowed_paths(self, temp_dir: Path):
+        """Test allowed-path checks against configured roots."""
+        docs = temp_dir / "docs"
+        (docs / "nested").mkdir(parents=True)
+        config = AditiConfig(allowed_paths=[docs])
+        
+        assert config.is_path_allowed(docs)
+        assert config.is_path_allowed(docs / "nested" / "file.adoc")
+        assert not config.is_path_allowed(temp_dir / "other" / "file.adoc")
+        assert not config.is_path_allowed(temp_dir)
+        
+        # Changes to allowed_paths are picked up
+        config.allowed_paths.append(temp_dir / "other")
+        assert config.is_path_allowed(temp_dir / "other" / "file.adoc")
+
+
 class TestConfigManager:
     """Test ConfigManager class."""
     
@@ -232,6 +248,19 @@ class TestConfigManager:
         assert loaded.feature_branch == "aditi/test"
         assert "file1.adoc" in loaded.processed_files
     
+    def test_save_session_stamps_last_updated(self, temp_dir: Path):
+        """Test that each save records when it happened, to the second."""
+        manager = ConfigManager(config_dir=temp_dir)
+        session = SessionState(last_updated="2020-01-01T00:00:00")
+        
+        manager.save_session(session)
+        
+        stamp = session.last_updated
+        assert stamp != "2020-01-01T00:00:00"
+        assert "." not in stamp
+        manager._session = None
+        assert manager.load_session().last_updated == stamp
+    
     def test_clear_session(self, temp_dir: Path):
         """Test clearing session state."""
         manager = ConfigManager(config_dir=temp_dir)
@@ -246,6 +275,15 @@ class TestConfigManager:
         assert not manager.session_file.exists()
         assert manager.session.current_branch is None
     
+    def test_clear_session_drops_scan_cache(self, temp_dir: Path):
+        """Test that clearing the session also deletes saved Vale results."""
+        manager = ConfigManager(config_dir=temp_dir)
+        manager.scan_cache_file.write_text("{}")
+        
+        manager.clear_session()
+        assert not manager.scan_cache_file.exists()
+        manager.clear_scan_cache()  # Nothing left to delete is fine
+    
     def test_property_access(self, temp_dir: Path):
         """Test property access auto-loads."""
         manager = ConfigManager(config_dir=temp_dir)
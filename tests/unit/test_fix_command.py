@@ -8,6 +8,7 @@ from typer import Exit
 from aditi.config import AditiConfig
 from aditi.vale_parser import Violation, Severity
 from aditi.processor import ProcessingResult
+from aditi.rules import FixType
 
 
 class TestFixCommand:
@@ -38,7 +39,7 @@ class TestFixCommand:
         # Just test that the function exists and is callable
         assert callable(fix_command)
     
-    @patch("aditi.commands.fix.ValeContainer")
+    @patch("aditi.commands.fix.get_shared_container")
     @patch("aditi.commands.fix.ConfigManager")
     def test_fix_command_no_adoc_files(self, mock_cm_class, mock_vale_class, capsys):
         """Test fix command when no .adoc files are found."""
@@ -65,6 +66,54 @@ class TestFixCommand:
                     captured = capsys.readouterr()
                     assert "No .adoc files found" in captured.out
 
+    
+    @patch("aditi.commands.fix.RuleProcessor")
+    @patch("aditi.commands.fix.get_shared_container")
+    @patch("aditi.commands.fix.ConfigManager")
+    def test_fix_command_applies_fixes_in_one_batch(self, mock_cm_class, mock_vale_class, mock_rp_class, tmp_path, capsys):
+        """Test that fixes for all files are applied with a single processor run."""
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        (docs / "a.adoc").write_text("Text with &nbsp; entity")
+        (shared / "b.adoc").write_text("Text with &nbsp; entity")
+        # A symlink resolves outside docs; it must be passed on as found
+        (docs / "b.adoc").symlink_to(shared / "b.adoc")
+        files = [docs / "a.adoc", docs / "b.adoc"]
+        
+        mock_config = AditiConfig()
+        mock_config.allowed_paths = [docs]
+        mock_cm_class.return_value.load_config.return_value = mock_config
+        
+        violations = [
+            Violation(f, "EntityReference", 1, 11, "Replace entity", Severity.ERROR, "&nbsp;")
+            for f in files
+        ]
+        check_result = ProcessingResult(
+            violations_found=violations, fixes_applied=[], fixes_skipped=[],
+            files_processed=set(files), files_modified=set(), errors=[]
+        )
+        apply_result = ProcessingResult(
+            violations_found=violations, fixes_applied=[Mock(), Mock()], fixes_skipped=[],
+            files_processed=set(files), files_modified=set(files), errors=[]
+        )
+        mock_processor = mock_rp_class.return_value
+        mock_processor.process_files.side_effect = [check_result, apply_result]
+        rule = Mock(fix_type=FixType.FULLY_DETERMINISTIC)
+        rule.name = "EntityReference"
+        mock_processor.rule_registry.by_name = {"EntityReference": rule}
+        
+        from aditi.commands.fix import fix_command
+        fix_command(interactive=False)
+        
+        assert mock_processor.process_files.call_count == 2
+        applied_files, = mock_processor.process_files.call_args_list[1][0]
+        assert applied_files == files
+        captured = capsys.readouterr()
+        assert "Files modified: 2" in captured.out
+        assert "Fixes applied: 2" in captured.out
+
 
 class TestFixCommandIntegration:
     """Test fix command integration scenarios."""
@@ -1,12 +1,25 @@
 """Unit tests for the journey command."""
 
 import pytest
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
 from aditi.commands.journey import (
+    RULE_INDEX,
+    RULE_METADATA,
+    RULE_ORDER,
     RULE_PROCESSING_ORDER,
-    collect_adoc_files
+    _first_pending_rule_index,
+    _missing_paths,
+    backup_session,
+    collect_adoc_files,
+    configure_repository,
+    get_path_suggestions,
+    get_session_age,
+    save_configuration,
+    select_directories,
+    validate_session
 )
 from aditi.config import AditiConfig
 
@@ -14,45 +27,68 @@ from aditi.config import AditiConfig
 class TestJourneyHelpers:
     """Test journey command helper functions."""
     
-    def test_collect_adoc_files_with_allowed_paths(self):
+    def test_collect_adoc_files_with_allowed_paths(self, tmp_path):
         """Test collecting .adoc files from allowed paths."""
+        (tmp_path / "subdir").mkdir()
+        (tmp_path / "file1.adoc").write_text("= One\n")
+        (tmp_path / "subdir" / "file2.adoc").write_text("= Two\n")
+        (tmp_path / "notes.txt").write_text("not asciidoc\n")
+        
         config = AditiConfig()
-        config.allowed_paths = [Path("/test/docs")]
+        config.allowed_paths = [tmp_path]
         
-        with patch("pathlib.Path.is_file") as mock_is_file:
-            with patch("pathlib.Path.is_dir") as mock_is_dir:
-                with patch("pathlib.Path.rglob") as mock_rglob:
-                    mock_is_file.return_value = False
-                    mock_is_dir.return_value = True
-                    mock_rglob.return_value = [
-                        Path("/test/docs/file1.adoc"),
-                        Path("/test/docs/subdir/file2.adoc")
-                    ]
-                    
-                    files = collect_adoc_files(config)
-                    assert len(files) == 2
-                    assert Path("/test/docs/file1.adoc") in files
-    
-    def test_collect_adoc_files_with_symlinks(self):
+        files = collect_adoc_files(config)
+        assert len(files) == 2
+        assert tmp_path / "file1.adoc" in files
+        assert tmp_path / "subdir" / "file2.adoc" in files
+    
+    def test_collect_adoc_files_with_symlinks(self, tmp_path):
         """Test collecting .adoc files respecting symlink settings."""
+        (tmp_path / "real.adoc").write_text("= Real\n")
+        (tmp_path / "link.adoc").symlink_to(tmp_path / "real.adoc")
+        
         config = AditiConfig()
-        config.allowed_paths = [Path("/test/docs")]
+        config.allowed_paths = [tmp_path]
         config.ignore_symlinks = True
         
-        mock_file1 = Mock(spec=Path)
-        mock_file1.is_symlink.return_value = False
-        mock_file2 = Mock(spec=Path)
-        mock_file2.is_symlink.return_value = True
+        files = collect_adoc_files(config)
+        assert files == [tmp_path / "real.adoc"]  # Only non-symlink file
         
-        with patch("pathlib.Path.is_file") as mock_is_file:
-            with patch("pathlib.Path.is_dir") as mock_is_dir:
-                with patch("pathlib.Path.rglob") as mock_rglob:
-                    mock_is_file.return_value = False
-                    mock_is_dir.return_value = True
-                    mock_rglob.return_value = [mock_file1, mock_file2]
-                    
-                    files = collect_adoc_files(config)
-                    assert len(files) == 1  # Only non-symlink file
+        config.ignore_symlinks = False
+        assert len(collect_adoc_files(config)) == 2
+    
+    def test_collect_adoc_files_from_several_directories(self, tmp_path):
+        """Test that files from every allowed directory are kept in path order."""
+        dirs = [tmp_path / name for name in ("b", "a", "c")]
+        for directory in dirs:
+            directory.mkdir()
+            (directory / "topic.adoc").write_text("= Topic\n")
+        
+        config = AditiConfig()
+        config.allowed_paths = dirs
+        
+        files = collect_adoc_files(config)
+        assert files == [directory / "topic.adoc" for directory in dirs]
+    
+    def test_collect_adoc_files_walks_nested_selections_once(self, tmp_path):
+        """Test that a selected directory inside another is not walked again."""
+        (tmp_path / "docs" / "modules").mkdir(parents=True)
+        (tmp_path / "docs" / ".drafts").mkdir()
+        (tmp_path / "docs" / "index.adoc").write_text("= Index\n")
+        (tmp_path / "docs" / "modules" / "con_a.adoc").write_text("= A\n")
+        (tmp_path / "docs" / ".drafts" / "draft.adoc").write_text("= Draft\n")
+        
+        config = AditiConfig()
+        config.allowed_paths = [
+            tmp_path / "docs",
+            tmp_path / "docs" / "modules",
+            tmp_path / "docs" / ".drafts",
+            tmp_path / "docs",
+        ]
+        
+        files = collect_adoc_files(config)
+        
+        assert sorted(f.name for f in files) == ["con_a.adoc", "draft.adoc", "index.adoc"]
     
     def test_collect_adoc_files_single_file(self):
         """Test collecting when path is a single .adoc file."""
@@ -67,6 +103,156 @@ class TestJourneyHelpers:
                 assert len(files) == 1
                 assert Path("/test/file.adoc") in files
 
+    
+    def test_backup_session_keeps_last_five(self, tmp_path):
+        """Test that the session is copied and only five backups are kept."""
+        config_manager = Mock()
+        config_manager.config_dir = tmp_path
+        config_manager.session_file = tmp_path / "session.json"
+        config_manager.session_file.write_text('{"current_rule": "EntityReference"}')
+        backup_dir = tmp_path / "session-backups"
+        backup_dir.mkdir()
+        for day in range(1, 7):
+            (backup_dir / f"session-2020-01-0{day}-000000.json").write_text("{}")
+        
+        backup_session(config_manager)
+        
+        backups = sorted(p.name for p in backup_dir.iterdir())
+        assert len(backups) == 5
+        assert "session-2020-01-01-000000.json" not in backups
+        assert (backup_dir / backups[-1]).read_text() == '{"current_rule": "EntityReference"}'
+
+    
+    def test_get_session_age(self):
+        """Test that the largest non-zero unit is reported."""
+        now = datetime(2024, 1, 10, 12, 0, 0)
+        assert get_session_age(None, now) is None
+        assert get_session_age("2024-01-08T11:00:00", now) == "2 days"
+        assert get_session_age("2024-01-10T11:00:00", now) == "1 hour"
+        assert get_session_age("2024-01-10T11:55:30", now) == "4 minutes"
+        assert get_session_age("2024-01-10T11:59:30", now) == "less than a minute"
+        assert get_session_age("not a timestamp", now) == "unknown time"
+
+    
+    def test_missing_paths(self, tmp_path, monkeypatch):
+        """Test that missing selected directories are found by parent listing."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "docs" / "modules").mkdir(parents=True)
+        paths = ["docs", "docs/modules/", "docs/gone", "gone/deeper", str(tmp_path / "docs"), "."]
+        assert _missing_paths(paths) == ["docs/gone", "gone/deeper"]
+
+    
+    def test_validate_session_stops_at_missing_repository(self, tmp_path, monkeypatch):
+        """Test that directory checks are skipped once the repository is gone."""
+        from aditi.config import SessionState
+        
+        monkeypatch.chdir(tmp_path)
+        session = SessionState(journey_progress={
+            "repository_root": str(tmp_path / "gone"),
+            "selected_directories": ["docs"],
+        })
+        assert validate_session(session) == [f"Repository path no longer exists: {tmp_path / 'gone'}"]
+        
+        (tmp_path / ".git").mkdir()
+        session.journey_progress["repository_root"] = str(tmp_path)
+        session.journey_progress["selected_directories"] = ["a", "b", "c", "d"]
+        errors = validate_session(session)
+        assert errors == ["Some selected directories no longer exist: a, b, c"]
+
+
+class TestPathSuggestions:
+    """Test directory suggestions for typed paths."""
+    
+    def test_top_level_suggestions(self, tmp_path):
+        """Test that visible top-level directories are suggested by prefix."""
+        for name in ("docs", "Design", ".git", "src"):
+            (tmp_path / name).mkdir()
+        (tmp_path / "dump.adoc").write_text("= File\n")
+        
+        assert sorted(get_path_suggestions(tmp_path, "d")) == ["Design", "docs"]
+    
+    def test_top_level_suggestions_use_cached_listing(self, tmp_path):
+        """Test that a cached top-level listing is used instead of the disk."""
+        assert get_path_suggestions(tmp_path, "./gu", top_level_dirs=["guides", "api"]) == ["guides"]
+    
+    def test_nested_suggestions_are_capped(self, tmp_path):
+        """Test that nested suggestions skip files and stop at five matches."""
+        for i in range(8):
+            (tmp_path / "docs" / f"mod{i}").mkdir(parents=True)
+        (tmp_path / "docs" / "modules.adoc").write_text("= File\n")
+        
+        suggestions = get_path_suggestions(tmp_path, "docs/MOD")
+        assert len(suggestions) == 5
+        assert all(s.startswith("docs/mod") and not s.endswith(".adoc") for s in suggestions)
+        assert get_path_suggestions(tmp_path, "missing/x") == []
+
+
+class TestSelectDirectories:
+    """Test interactive directory selection."""
+    
+    @patch("questionary.select")
+    @patch("questionary.text")
+    @patch("aditi.commands.journey.DirectoryScanner")
+    def test_customize_reuses_scan(self, mock_scanner_class, mock_text, mock_select):
+        """Test that customizing the selection prompts again without rescanning."""
+        mock_scanner = mock_scanner_class.return_value
+        mock_scanner.iter_adoc_dirs.return_value = iter([(Path("docs"), 3), (Path("guides"), 1)])
+        mock_text.return_value.ask.side_effect = ["all", "2"]
+        mock_select.return_value.ask.side_effect = [
+            "Customize selection",
+            "Process all selected directories"
+        ]
+        
+        selected = select_directories(Path("/repo"))
+        
+        assert selected == [Path("guides")]
+        mock_scanner.iter_adoc_dirs.assert_called_once()
+
+
+
+class TestConfigureRepository:
+    """Test repository configuration from provided paths."""
+    
+    @patch("questionary.confirm")
+    @patch("aditi.commands.journey.save_configuration")
+    def test_provided_paths(self, mock_save, mock_confirm, tmp_path, monkeypatch):
+        """Test that files contribute their parent directories once each."""
+        from aditi.config import SessionState
+        
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "guides").mkdir()
+        for name in ("docs/a.adoc", "docs/b.adoc", "guides/c.adoc"):
+            (tmp_path / name).write_text("= Topic\n")
+        mock_confirm.return_value.ask.return_value = True
+        config_manager = Mock()
+        session = SessionState()
+        
+        paths = [Path("docs/a.adoc"), Path("docs/b.adoc"), Path("guides"), Path("missing.adoc")]
+        assert configure_repository(paths, config_manager=config_manager, session=session)
+        
+        selected_dirs = mock_save.call_args.args[1]
+        assert selected_dirs == [Path("guides"), Path("docs")]
+        assert mock_save.call_args.kwargs["session"] is session
+
+
+class TestSaveConfiguration:
+    """Test saving the journey configuration."""
+    
+    def test_new_session_starts_at_configuration_time(self, tmp_path):
+        """Test that a new session's start matches the configuration timestamp."""
+        from aditi.config import SessionState
+        
+        config_manager = Mock()
+        config_manager.load_config.return_value = AditiConfig()
+        session = SessionState()
+        
+        save_configuration(tmp_path, [Path("docs")], config_manager=config_manager, session=session)
+        
+        assert session.journey_state == "configured"
+        assert session.session_started == session.journey_progress["timestamp"]
+        config_manager.save_session.assert_called_once_with(session)
+
 
 class TestRuleProcessingOrder:
     """Test rule processing order configuration."""
@@ -104,6 +290,19 @@ class TestRuleProcessingOrder:
         # Check all expected rules are present
         missing_rules = expected_rules - processing_rules
         assert len(missing_rules) == 0, f"Missing rules in RULE_PROCESSING_ORDER: {missing_rules}"
+    
+    def test_rule_lookups_match_processing_order(self):
+        """Test that the name tuple and metadata dict mirror RULE_PROCESSING_ORDER."""
+        assert RULE_ORDER == tuple(rule[0] for rule in RULE_PROCESSING_ORDER)
+        for rule_name, severity, description in RULE_PROCESSING_ORDER:
+            assert RULE_METADATA[rule_name] == (severity, description)
+            assert RULE_ORDER[RULE_INDEX[rule_name]] == rule_name
+    
+    def test_first_pending_rule_index(self):
+        """Test that the first unapplied rule is found, including after gaps."""
+        assert _first_pending_rule_index([]) == 0
+        assert _first_pending_rule_index([RULE_ORDER[0], RULE_ORDER[2], "Unknown"]) == 1
+        assert _first_pending_rule_index(list(RULE_ORDER)) is None
 
 
 class TestJourneyCommand:
@@ -136,6 +335,48 @@ class TestJourneyCommand:
         mock_configure.assert_called_once()
         mock_apply.assert_called_once()
     
+    def test_journey_command_dry_run_previews_files(self, tmp_path, monkeypatch, capsys):
+        """Test that dry-run counts every file but lists only the first five."""
+        from aditi.commands.journey import journey_command
+        
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "docs").mkdir()
+        for i in range(7):
+            (tmp_path / "docs" / f"topic{i}.adoc").write_text("= Topic\n")
+        
+        journey_command(dry_run=True)
+        
+        captured = capsys.readouterr()
+        assert "Found 7 AsciiDoc files" in captured.out
+        assert captured.out.count("   • docs/topic") == 5
+        assert "... and 2 more" in captured.out
+        assert "🔴 EntityReference (error)" in captured.out
+        assert "🔵 TagDirective (suggestion)" in captured.out
+    
+    @patch("aditi.commands.journey.ConfigManager")
+    def test_journey_command_status_lists_progress(self, mock_cm_class, capsys):
+        """Test that --status lists directories, recent rules and the next rule."""
+        from aditi.commands.journey import journey_command
+        from aditi.config import SessionState
+        
+        session = SessionState(
+            journey_state="configured",
+            journey_progress={"selected_directories": ["docs", "guides", "api", "[legacy]"]},
+            applied_rules=list(RULE_ORDER[:6]),
+            total_rules=len(RULE_ORDER),
+            session_started="2020-01-01T00:00:00",
+        )
+        mock_cm_class.return_value.load_session.return_value = session
+        
+        journey_command(status=True)
+        
+        out = capsys.readouterr().out
+        assert "Selected directories: 4" in out
+        assert "... and 1 more" in out
+        assert f"✓ {RULE_ORDER[5]}" in out
+        assert f"✓ {RULE_ORDER[0]}" not in out
+        assert f"Next rule: {RULE_ORDER[6]}" in out
+    
     @patch("aditi.commands.journey.ConfigManager")
     @patch("questionary.confirm")
     @patch("aditi.commands.journey.configure_repository")
@@ -170,7 +411,8 @@ class TestJourneyCommand:
         
         # Mock config manager to return empty session
         mock_cm = Mock()
-        mock_cm.load_session.return_value = SessionState()  # Empty session
+        session = SessionState()  # Empty session
+        mock_cm.load_session.return_value = session
         mock_cm_class.return_value = mock_cm
         
         # Mock successful flow
@@ -181,7 +423,10 @@ class TestJourneyCommand:
         # Run command
         journey_command()
         
-        # Verify all steps called
-        mock_configure.assert_called_once()
-        mock_apply.assert_called_once()
-        mock_complete.assert_called_once()
\ No newline at end of file
+        # Verify all steps called with the same configuration manager, and
+        # the session loaded once
+        mock_configure.assert_called_once_with(None, config_manager=mock_cm, session=session)
+        mock_apply.assert_called_once_with(None, config_manager=mock_cm)
+        mock_complete.assert_called_once_with(config_manager=mock_cm)
+        mock_cm_class.assert_called_once()
+        mock_cm.load_session.assert_called_once()
\ No newline at end of file
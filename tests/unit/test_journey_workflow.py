@@ -1,5 +1,8 @@
 """Unit tests for the journey workflow functions."""
 
+import json
+import os
+
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
@@ -7,30 +10,44 @@ from datetime import datetime
 from typer import Exit
 
 from aditi.commands.journey import (
+    RULE_ORDER,
+    _new_progress,
+    apply_auto_fixes,
+    apply_flags,
     apply_rules_workflow,
-    generate_preparation_report
+    generate_preparation_report,
+    process_single_rule,
+    recheck_rule_violations,
+    _file_signatures
 )
 from aditi.config import SessionState, AditiConfig
-from aditi.vale_parser import Violation, Severity
+from aditi.vale_parser import Severity, ValeParser, Violation
 from aditi.processor import ProcessingResult
-from aditi.rules import FixType
+from aditi.rules import INFORMATIONAL_RULES, FixType
 
 
 class TestApplyRulesWorkflow:
     """Test the apply_rules_workflow function."""
     
+    @pytest.fixture(autouse=True)
+    def mock_release(self):
+        """Stub out releasing the shared Vale container."""
+        with patch("aditi.commands.journey.release_shared_container") as mock:
+            yield mock
+    
     @patch("questionary.confirm")
     @patch("aditi.commands.journey.process_single_rule")
     @patch("aditi.commands.journey.collect_adoc_files")
     @patch("aditi.commands.journey.RuleProcessor")
-    @patch("aditi.commands.journey.ValeContainer")
+    @patch("aditi.commands.journey.get_shared_container")
     @patch("aditi.commands.journey.ConfigManager")
     def test_apply_rules_workflow_success(self, mock_cm_class, mock_vale_class,
                                          mock_processor_class, mock_collect,
-                                         mock_process_rule, mock_confirm, capsys):
+                                         mock_process_rule, mock_confirm, mock_release, tmp_path, capsys):
         """Test successful rule application workflow."""
         # Setup mocks
         mock_cm = Mock()
+        mock_cm.scan_cache_file = tmp_path / "scan_cache.json"
         mock_config = AditiConfig()
         mock_session = SessionState()
         mock_cm.load_config.return_value = mock_config
@@ -67,11 +84,13 @@ class TestApplyRulesWorkflow:
             "EntityReference": [violation1],
             "ContentType": [violation2]
         }
-        # Mock parse_json_output to return list of violations
-        mock_processor.vale_parser.parse_json_output.return_value = [violation2]  # ContentType is first rule
         mock_processor.rule_registry.get_rule.side_effect = lambda name: Mock(name=name)
-        # Mock vale_container attribute and its methods
+        # Mock vale_container attribute and its methods; the scan finds a
+        # ContentType issue, the first rule
         mock_processor.vale_container = Mock()
+        mock_processor.vale_container.run_vale_rules.return_value = json.dumps(
+            {"/test/file1.adoc": [{"Check": "AsciiDocDITA.ContentType", "Line": 1, "Severity": "warning"}]}
+        )
         mock_processor.vale_container.run_vale_single_rule.return_value = '{}'
         mock_processor_class.return_value = mock_processor
         
@@ -90,13 +109,213 @@ class TestApplyRulesWorkflow:
         # Should process at least one rule (ContentType)
         assert mock_process_rule.call_count >= 1
         
-        # Session should be updated
+        # Session should be updated, loaded once, and saved with the
+        # skipped informational rules at the end
         assert "ContentType" in mock_session.applied_rules
+        assert "TagDirective" in mock_session.applied_rules
+        mock_cm.load_session.assert_called_once()
+        mock_cm.save_session.assert_called_with(mock_session)
         
-        # Vale should be cleaned up
-        mock_vale.cleanup.assert_called_once()
+        # The shared Vale container should be released
+        mock_release.assert_called_once_with()
     
-    @patch("aditi.commands.journey.ValeContainer")
+    @patch("questionary.confirm")
+    @patch("aditi.commands.journey.process_single_rule")
+    @patch("aditi.commands.journey.RuleProcessor")
+    @patch("aditi.commands.journey.get_shared_container")
+    @patch("aditi.commands.journey.ConfigManager")
+    def test_apply_rules_workflow_rescans_only_changed_files(self, mock_cm_class, mock_vale_class,
+                                                             mock_processor_class, mock_process_rule,
+                                                             mock_confirm, tmp_path, monkeypatch):
+        """Test that one scan covers all rules and an edited file is re-checked once."""
+        monkeypatch.chdir(tmp_path)
+        changed = tmp_path / "a.adoc"
+        unchanged = tmp_path / "b.adoc"
+        changed.write_text("= A\n")
+        unchanged.write_text("= B\n")
+        
+        mock_cm = Mock()
+        mock_cm.load_config.return_value = AditiConfig()
+        mock_cm.load_session.return_value = SessionState()
+        mock_cm.scan_cache_file = tmp_path / "scan_cache.json"
+        mock_cm_class.return_value = mock_cm
+        
+        first = {str(changed): [{"Check": "AsciiDocDITA.ContentType", "Line": 1, "Severity": "error"}]}
+        mock_processor = Mock()
+        mock_processor.vale_parser = ValeParser()
+        mock_processor.rule_registry.get_rule.return_value = Mock()
+        mock_processor.vale_container.run_vale_rules.side_effect = [json.dumps(first), "{}"]
+        mock_processor.vale_container.run_vale_single_rule.return_value = "{}"
+        mock_processor_class.return_value = mock_processor
+        
+        def edit_file(*_args, **_kwargs):
+            stat = changed.stat()
+            os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            return True
+        mock_process_rule.side_effect = edit_file
+        mock_confirm.return_value.ask.return_value = True
+        
+        apply_rules_workflow([changed, unchanged])
+        
+        # The edit is re-checked once, for all the rules still to come
+        run_vale_rules = mock_processor.vale_container.run_vale_rules
+        mock_process_rule.assert_called_once()
+        assert run_vale_rules.call_count == 2
+        assert run_vale_rules.call_args_list[0].args[1] == ["a.adoc", "b.adoc"]
+        assert run_vale_rules.call_args_list[1].args[1] == ["a.adoc"]
+        assert "ContentType" not in run_vale_rules.call_args_list[1].args[0]
+        mock_processor.vale_container.run_vale_single_rule.assert_not_called()
+    
+    @patch("questionary.confirm")
+    @patch("aditi.commands.journey.process_single_rule")
+    @patch("aditi.commands.journey.RuleProcessor")
+    @patch("aditi.commands.journey.get_shared_container")
+    @patch("aditi.commands.journey.ConfigManager")
+    def test_apply_rules_workflow_rescans_with_relative_paths(self, mock_cm_class, mock_vale_class,
+                                                              mock_processor_class, mock_process_rule,
+                                                              mock_confirm, tmp_path, monkeypatch):
+        """Test that a journey started on a relative path re-checks edited files."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "docs").mkdir()
+        changed = tmp_path / "docs" / "a.adoc"
+        changed.write_text("= A\n")
+        
+        mock_cm = Mock()
+        mock_cm.load_config.return_value = AditiConfig()
+        mock_cm.load_session.return_value = SessionState()
+        mock_cm.scan_cache_file = tmp_path / "scan_cache.json"
+        mock_cm_class.return_value = mock_cm
+        
+        first = {str(changed): [{"Check": "AsciiDocDITA.ContentType", "Line": 1, "Severity": "error"}]}
+        mock_processor = Mock()
+        mock_processor.vale_parser = ValeParser()
+        mock_processor.rule_registry.get_rule.return_value = Mock()
+        mock_processor.vale_container.run_vale_rules.side_effect = [json.dumps(first), "{}"]
+        mock_processor_class.return_value = mock_processor
+        
+        def edit_file(*_args, **_kwargs):
+            changed.write_text("= A, edited\n")
+            return True
+        mock_process_rule.side_effect = edit_file
+        mock_confirm.return_value.ask.return_value = True
+        
+        apply_rules_workflow([Path("docs")])
+        
+        run_vale_rules = mock_processor.vale_container.run_vale_rules
+        assert run_vale_rules.call_count == 2
+        assert run_vale_rules.call_args_list[0].args[1] == [os.path.join("docs", "a.adoc")]
+        assert run_vale_rules.call_args_list[1].args[1] == [os.path.join("docs", "a.adoc")]
+    
+    @patch("aditi.commands.journey.process_single_rule")
+    @patch("aditi.commands.journey.RuleProcessor")
+    @patch("aditi.commands.journey.get_shared_container")
+    @patch("aditi.commands.journey.ConfigManager")
+    def test_apply_rules_workflow_reuses_saved_scan(self, mock_cm_class, mock_vale_class,
+                                                    mock_processor_class, mock_process_rule,
+                                                    tmp_path, monkeypatch):
+        """Test that a later journey reuses saved results for unchanged files."""
+        monkeypatch.chdir(tmp_path)
+        unchanged = tmp_path / "a.adoc"
+        edited = tmp_path / "b.adoc"
+        unchanged.write_text("= A\n")
+        edited.write_text("= B\n")
+        alert = {"Check": "AsciiDocDITA.ContentType", "Line": 1, "Message": "msg", "Severity": "warning"}
+        
+        def run_journey(vale_output):
+            mock_cm = Mock()
+            mock_cm.load_config.return_value = AditiConfig()
+            mock_cm.load_session.return_value = SessionState()
+            mock_cm.scan_cache_file = tmp_path / "scan_cache.json"
+            mock_cm_class.return_value = mock_cm
+            processor = Mock()
+            processor.vale_parser = ValeParser()
+            processor.rule_registry.get_rule.return_value = Mock()
+            processor.vale_container.run_vale_rules.return_value = vale_output
+            mock_processor_class.return_value = processor
+            mock_process_rule.reset_mock()
+            mock_process_rule.return_value = False  # Stop at the first rule with issues
+            apply_rules_workflow([unchanged, edited])
+            return processor
+        
+        first = run_journey(json.dumps({"a.adoc": [alert]}))
+        first.vale_container.run_vale_rules.assert_called_once()
+        
+        edited.write_text("= B, edited\n")
+        second = run_journey("{}")
+        
+        # Only the edited file is scanned again; the saved alert still counts
+        second.vale_container.run_vale_rules.assert_called_once()
+        assert second.vale_container.run_vale_rules.call_args.args[1] == ["b.adoc"]
+        issues = mock_process_rule.call_args.args[1]
+        assert [(v.file_path, v.rule_name) for v in issues] == [(unchanged, "ContentType")]
+    
+    @patch("aditi.commands.journey.process_single_rule")
+    @patch("aditi.commands.journey.RuleProcessor")
+    @patch("aditi.commands.journey.get_shared_container")
+    @patch("aditi.commands.journey.ConfigManager")
+    def test_apply_rules_workflow_drops_scan_after_vale_changes(self, mock_cm_class, mock_vale_class,
+                                                                mock_processor_class, mock_process_rule,
+                                                                tmp_path, monkeypatch):
+        """Test that saved results are not reused after the Vale config or styles change."""
+        monkeypatch.chdir(tmp_path)
+        target = tmp_path / "a.adoc"
+        target.write_text("= A\n")
+        vale_ini = tmp_path / ".vale.ini"
+        vale_ini.write_text("StylesPath = styles\n")
+        (tmp_path / "styles").mkdir()
+        rule_file = tmp_path / "styles" / "Rule.yml"
+        rule_file.write_text("level: warning\n")
+        
+        def run_journey():
+            mock_cm = Mock()
+            mock_cm.load_config.return_value = AditiConfig()
+            mock_cm.load_session.return_value = SessionState()
+            mock_cm.scan_cache_file = tmp_path / "scan_cache.json"
+            mock_cm_class.return_value = mock_cm
+            processor = Mock()
+            processor.vale_parser = ValeParser()
+            processor.rule_registry.get_rule.return_value = Mock()
+            processor.vale_container.run_vale_rules.return_value = "{}"
+            mock_processor_class.return_value = processor
+            apply_rules_workflow([target])
+            return processor.vale_container.run_vale_rules.call_count
+        
+        assert run_journey() == 1
+        assert run_journey() == 0
+        rule_file.write_text("level: suggestion\n")
+        assert run_journey() == 1
+        vale_ini.write_text("StylesPath = styles\nMinAlertLevel = warning\n")
+        assert run_journey() == 1
+    
+    @patch("aditi.commands.journey.RuleProcessor")
+    @patch("aditi.commands.journey.get_shared_container")
+    @patch("aditi.commands.journey.ConfigManager")
+    def test_apply_rules_workflow_skips_rules_applied_after_a_gap(self, mock_cm_class, mock_vale_class,
+                                                                  mock_processor_class, tmp_path, monkeypatch):
+        """Test that resuming at a gap does not run later applied rules again."""
+        monkeypatch.chdir(tmp_path)
+        target = tmp_path / "a.adoc"
+        target.write_text("= A\n")
+        session = SessionState(applied_rules=[RULE_ORDER[0], RULE_ORDER[2]])
+        mock_cm = Mock()
+        mock_cm.load_config.return_value = AditiConfig()
+        mock_cm.load_session.return_value = session
+        mock_cm.scan_cache_file = tmp_path / "scan_cache.json"
+        mock_cm_class.return_value = mock_cm
+        processor = Mock()
+        processor.vale_parser = ValeParser()
+        processor.rule_registry.get_rule.return_value = Mock()
+        processor.vale_container.run_vale_rules.return_value = "{}"
+        mock_processor_class.return_value = processor
+        
+        assert apply_rules_workflow([target])
+        
+        scanned_rules = processor.vale_container.run_vale_rules.call_args.args[0]
+        assert RULE_ORDER[1] in scanned_rules
+        assert RULE_ORDER[2] not in scanned_rules
+        assert sorted(session.applied_rules) == sorted(RULE_ORDER)
+    
+    @patch("aditi.commands.journey.get_shared_container")
     @patch("aditi.commands.journey.ConfigManager")
     def test_apply_rules_workflow_vale_error(self, mock_cm_class, mock_vale_class, capsys):
         """Test workflow when Vale initialization fails."""
@@ -114,10 +333,10 @@ class TestApplyRulesWorkflow:
         assert "Failed to initialize Vale" in captured.out
     
     @patch("aditi.commands.journey.collect_adoc_files")
-    @patch("aditi.commands.journey.ValeContainer")
+    @patch("aditi.commands.journey.get_shared_container")
     @patch("aditi.commands.journey.ConfigManager")
     def test_apply_rules_workflow_no_files(self, mock_cm_class, mock_vale_class,
-                                          mock_collect, capsys):
+                                          mock_collect, mock_release, capsys):
         """Test workflow when no .adoc files are found."""
         mock_cm = Mock()
         mock_cm.load_config.return_value = AditiConfig()
@@ -133,19 +352,44 @@ class TestApplyRulesWorkflow:
         
         captured = capsys.readouterr()
         assert "No .adoc files found to process" in captured.out
+        # Returning early still releases the shared container
+        mock_release.assert_called_once_with()
+    
+    @patch("aditi.commands.journey.collect_adoc_files")
+    @patch("aditi.commands.journey.RuleProcessor")
+    @patch("aditi.commands.journey.get_shared_container")
+    @patch("aditi.commands.journey.ConfigManager")
+    def test_apply_rules_workflow_error_releases_container(self, mock_cm_class, mock_vale_class,
+                                                          mock_processor_class, mock_collect,
+                                                          mock_release, tmp_path):
+        """Test that an error during the rules still releases the shared container."""
+        mock_cm = Mock()
+        mock_cm.scan_cache_file = tmp_path / "scan_cache.json"
+        mock_cm.load_config.return_value = AditiConfig()
+        mock_cm.load_session.return_value = SessionState()
+        mock_cm_class.return_value = mock_cm
+        mock_collect.return_value = [tmp_path / "file.adoc"]
+        mock_processor = mock_processor_class.return_value
+        mock_processor.vale_container.run_vale_rules.side_effect = RuntimeError("Vale failed")
+        
+        with pytest.raises(RuntimeError):
+            apply_rules_workflow()
+        
+        mock_release.assert_called_once_with()
     
     @patch("questionary.confirm")
     @patch("aditi.commands.journey.process_single_rule")
     @patch("aditi.commands.journey.collect_adoc_files")
     @patch("aditi.commands.journey.RuleProcessor")
-    @patch("aditi.commands.journey.ValeContainer")
+    @patch("aditi.commands.journey.get_shared_container")
     @patch("aditi.commands.journey.ConfigManager")
     def test_apply_rules_workflow_user_stops(self, mock_cm_class, mock_vale_class,
                                             mock_processor_class, mock_collect,
-                                            mock_process_rule, mock_confirm, capsys):
+                                            mock_process_rule, mock_confirm, tmp_path, capsys):
         """Test workflow when user chooses to stop."""
         # Setup mocks
         mock_cm = Mock()
+        mock_cm.scan_cache_file = tmp_path / "scan_cache.json"
         mock_config = AditiConfig()
         mock_session = SessionState()
         mock_cm.load_config.return_value = mock_config
@@ -180,6 +424,7 @@ class TestApplyRulesWorkflow:
         mock_processor.rule_registry.get_rule.return_value = Mock()
         # Mock vale_container attribute and its methods
         mock_processor.vale_container = Mock()
+        mock_processor.vale_container.run_vale_rules.return_value = '{}'
         mock_processor.vale_container.run_vale_single_rule.return_value = '{}'
         mock_processor_class.return_value = mock_processor
         
@@ -197,7 +442,7 @@ class TestApplyRulesWorkflow:
     
     @patch("aditi.commands.journey.collect_adoc_files")
     @patch("aditi.commands.journey.RuleProcessor")
-    @patch("aditi.commands.journey.ValeContainer")
+    @patch("aditi.commands.journey.get_shared_container")
     @patch("aditi.commands.journey.ConfigManager")
     def test_apply_rules_workflow_unimplemented_rule(self, mock_cm_class, mock_vale_class,
                                                      mock_processor_class, mock_collect,
@@ -243,6 +488,261 @@ class TestApplyRulesWorkflow:
         # Verify warning shown
         captured = capsys.readouterr()
         assert "Warning: Rule EntityReference not implemented yet" in captured.out
+        # Nothing is left to check, so Vale is never run
+        mock_vale.run_vale_rules.assert_not_called()
+        assert mock_processor.rule_registry.get_rule.call_count == len(RULE_ORDER) - len(INFORMATIONAL_RULES)
+
+
+class TestProcessSingleRule:
+    """Test the per-rule prompt."""
+    
+    @patch("questionary.confirm")
+    @patch("questionary.select")
+    def test_choice_is_a_single_select(self, mock_select, mock_confirm, capsys):
+        """Test that the rule prompt offers only the valid choices as shortcuts."""
+        cwd = Path.cwd()
+        issues = [Violation(cwd / "a.adoc", "TaskStep", 1, 1, "msg", Severity.WARNING, "x")]
+        rule = Mock()
+        rule.name = "TaskStep"
+        rule.fix_type = FixType.NON_DETERMINISTIC
+        mock_select.return_value.ask.return_value = "s"
+        mock_confirm.return_value.ask.return_value = True
+        
+        assert process_single_rule(rule, issues, "desc", Mock(spec=[]))
+        
+        mock_select.assert_called_once()
+        kwargs = mock_select.call_args.kwargs
+        assert [c.shortcut_key for c in kwargs["choices"]] == ["f", "s"]
+        assert kwargs["default"] == "f"
+        assert kwargs["use_shortcuts"] is True
+        assert "Skipped." in capsys.readouterr().out
+
+    @patch("questionary.select")
+    def test_cancel_stops(self, mock_select):
+        """Test that cancelling the prompt stops the journey."""
+        issues = [Violation(Path.cwd() / "a.adoc", "TaskStep", 1, 1, "msg", Severity.WARNING, "x")]
+        rule = Mock()
+        rule.name = "TaskStep"
+        rule.fix_type = FixType.NON_DETERMINISTIC
+        mock_select.return_value.ask.return_value = None
+        
+        assert not process_single_rule(rule, issues, "desc", Mock(spec=[]))
+
+
+class TestRecheckRuleViolations:
+    """Test the recheck after a rule's fixes."""
+
+    def test_only_changed_files_are_rechecked(self, tmp_path, monkeypatch, capsys):
+        """Test that unchanged files keep their issues without a Vale run."""
+        monkeypatch.chdir(tmp_path)
+        fixed = tmp_path / "fixed.adoc"
+        untouched = tmp_path / "untouched.adoc"
+        fixed.write_text("= Fixed\n&nbsp;\n")
+        untouched.write_text("= Untouched\n&nbsp;\n")
+        files = [fixed, untouched]
+        issues = [
+            Violation(fixed, "EntityReference", 2, 1, "msg", Severity.ERROR, "&nbsp;"),
+            Violation(untouched, "EntityReference", 2, 1, "msg", Severity.ERROR, "&nbsp;"),
+        ]
+        signatures = _file_signatures(files)
+        fixed.write_text("= Fixed\n{nbsp} \n")
+
+        processor = Mock()
+        processor.vale_parser.parse_json_output.return_value = []
+        del processor._display_file_list
+        recheck_rule_violations("EntityReference", files, processor,
+                                issues=issues, signatures=signatures)
+
+        processor.vale_container.run_vale_single_rule.assert_called_once_with(
+            "EntityReference", ["fixed.adoc"], project_root=tmp_path
+        )
+        out = capsys.readouterr().out
+        assert "1 issue(s) still remain" in out
+        assert "untouched.adoc" in out
+
+    def test_no_vale_run_when_nothing_changed(self, tmp_path, monkeypatch, capsys):
+        """Test that a recheck with no changed files skips Vale."""
+        monkeypatch.chdir(tmp_path)
+        target = tmp_path / "a.adoc"
+        target.write_text("= A\n")
+        processor = Mock()
+        recheck_rule_violations("EntityReference", [target], processor,
+                                issues=[], signatures=_file_signatures([target]))
+
+        processor.vale_container.run_vale_single_rule.assert_not_called()
+        assert "No remaining issues" in capsys.readouterr().out
+
+
+class TestApplyAutoFixes:
+    """Test the apply_auto_fixes function."""
+    
+    def test_fixes_all_files_in_one_run(self, capsys):
+        """Test that every affected file is fixed with a single processor call."""
+        cwd = Path.cwd()
+        files = [cwd / "a.adoc", cwd / "b.adoc"]
+        violations = [
+            Violation(files[0], "EntityReference", 1, 1, "msg", Severity.ERROR, "&nbsp;"),
+            Violation(files[0], "EntityReference", 2, 1, "msg", Severity.ERROR, "&nbsp;"),
+            Violation(files[1], "EntityReference", 1, 1, "msg", Severity.ERROR, "&nbsp;"),
+        ]
+        rule = Mock()
+        rule.name = "EntityReference"
+        processor = Mock()
+        processor.process_files.return_value = ProcessingResult(
+            violations_found=violations,
+            fixes_applied=[Mock(violation=violations[0]), Mock(violation=violations[1])],
+            fixes_skipped=[],
+            files_processed=set(files),
+            files_modified={files[0]},
+            errors=[]
+        )
+        
+        apply_auto_fixes(rule, processor, files)
+        
+        processor.process_files.assert_called_once_with(files, dry_run=False, rule_filter="EntityReference")
+        captured = capsys.readouterr()
+        assert "Applied 2 EntityReference fixes" in captured.out
+        assert "a.adoc (2 fixes)" in captured.out
+        assert "b.adoc" not in captured.out
+
+    def test_file_outside_cwd_is_listed(self, tmp_path, capsys):
+        """Test that a fixed file outside the working directory is shown in full."""
+        outside = tmp_path / "outside.adoc"
+        violation = Violation(outside, "EntityReference", 1, 1, "msg", Severity.ERROR, "&nbsp;")
+        rule = Mock()
+        rule.name = "EntityReference"
+        processor = Mock()
+        processor.process_files.return_value = ProcessingResult(
+            violations_found=[violation],
+            fixes_applied=[Mock(violation=violation)],
+            fixes_skipped=[],
+            files_processed={outside},
+            files_modified={outside},
+            errors=[]
+        )
+        
+        apply_auto_fixes(rule, processor, [outside])
+        
+        assert f"{outside} (1 fix)" in capsys.readouterr().out.replace("\n", "")
+
+
+class TestApplyFlags:
+    """Test the apply_flags function."""
+    
+    def test_flags_each_file(self, tmp_path, monkeypatch, capsys):
+        """Test that every file is flagged and a failing file is reported."""
+        monkeypatch.chdir(tmp_path)
+        first = tmp_path / "a.adoc"
+        second = tmp_path / "b.adoc"
+        missing = tmp_path / "missing.adoc"
+        first.write_text("one\ntwo\n")
+        second.write_text("one\n")
+        issues = [
+            Violation(first, "TaskStep", 1, 1, "msg", Severity.WARNING, "one"),
+            Violation(first, "TaskStep", 2, 1, "msg", Severity.WARNING, "two"),
+            Violation(second, "TaskStep", 1, 1, "msg", Severity.WARNING, "one"),
+            Violation(missing, "TaskStep", 1, 1, "msg", Severity.WARNING, "one"),
+        ]
+        rule = Mock()
+        rule.name = "TaskStep"
+        rule.create_comment_flag.side_effect = lambda v: f"// FLAG {v.line}"
+        
+        apply_flags(rule, issues, Mock(), [first, second, missing])
+        
+        assert first.read_text() == "// FLAG 1\none\n// FLAG 2\ntwo\n"
+        assert second.read_text() == "// FLAG 1\none\n"
+        captured = capsys.readouterr()
+        assert "Applied 3 TaskStep flags" in captured.out
+        assert "Error flagging" in captured.out
+
+
+    def test_flags_reuse_given_progress(self, tmp_path, monkeypatch):
+        """Test that a shared progress display is reused and left without tasks."""
+        monkeypatch.chdir(tmp_path)
+        target = tmp_path / "a.adoc"
+        target.write_text("one\n")
+        issues = [Violation(target, "TaskStep", 1, 1, "msg", Severity.WARNING, "one")]
+        rule = Mock()
+        rule.name = "TaskStep"
+        rule.create_comment_flag.return_value = "// FLAG"
+        progress = _new_progress()
+        
+        apply_flags(rule, issues, Mock(), [target], progress=progress)
+        apply_flags(rule, issues, Mock(), [target], progress=progress)
+        
+        assert target.read_text() == "// FLAG\n// FLAG\none\n"
+        assert progress.tasks == []
+    
+    def test_flags_skip_lines_outside_file(self, tmp_path, monkeypatch):
+        """Test that issues past the last line are ignored and content is kept."""
+        monkeypatch.chdir(tmp_path)
+        target = tmp_path / "a.adoc"
+        target.write_text("one\ntwo")
+        issues = [
+            Violation(target, "TaskStep", 2, 1, "msg", Severity.WARNING, "two"),
+            Violation(target, "TaskStep", 3, 1, "msg", Severity.WARNING, ""),
+        ]
+        rule = Mock()
+        rule.name = "TaskStep"
+        rule.create_comment_flag.side_effect = lambda v: f"// FLAG {v.line}"
+        
+        apply_flags(rule, issues, Mock(), [target])
+        
+        assert target.read_text() == "one\n// FLAG 2\ntwo"
+    
+    def test_flags_keep_crlf_line_endings(self, tmp_path, monkeypatch):
+        """Test that flags in a CRLF file end in CRLF, like the lines around them."""
+        monkeypatch.chdir(tmp_path)
+        target = tmp_path / "a.adoc"
+        target.write_bytes(b"one\r\ntwo\r\nthree\r\n")
+        issues = [
+            Violation(target, "TaskStep", 2, 1, "msg", Severity.WARNING, "two"),
+            Violation(target, "TaskStep", 2, 3, "msg", Severity.WARNING, "two"),
+            Violation(target, "TaskStep", 3, 1, "msg", Severity.WARNING, "three"),
+        ]
+        rule = Mock()
+        rule.name = "TaskStep"
+        rule.create_comment_flag.side_effect = lambda v: f"// F{v.line}"
+        
+        apply_flags(rule, issues, Mock(), [target])
+        
+        assert target.read_bytes() == b"one\r\n// F2\r\n// F2\r\ntwo\r\n// F3\r\nthree\r\n"
+    
+    def test_flags_near_the_top_leave_the_rest_intact(self, tmp_path, monkeypatch):
+        """Test that flags in the first lines keep the unsplit remainder as it was."""
+        monkeypatch.chdir(tmp_path)
+        target = tmp_path / "a.adoc"
+        body = "".join(f"line {i}\n" for i in range(1, 101))
+        target.write_text(body)
+        issues = [
+            Violation(target, "TaskStep", 1, 1, "msg", Severity.WARNING, "line 1"),
+            Violation(target, "TaskStep", 3, 1, "msg", Severity.WARNING, "line 3"),
+        ]
+        rule = Mock()
+        rule.name = "TaskStep"
+        rule.create_comment_flag.side_effect = lambda v: f"// FLAG {v.line}"
+        
+        apply_flags(rule, issues, Mock(), [target])
+        
+        expected = "// FLAG 1\nline 1\nline 2\n// FLAG 3\n" + body.split("\n", 2)[2]
+        assert target.read_text() == expected
+    
+    def test_flags_stack_on_the_same_line(self, tmp_path, monkeypatch):
+        """Test that several issues on one line keep their order and non-ASCII text survives."""
+        monkeypatch.chdir(tmp_path)
+        target = tmp_path / "a.adoc"
+        target.write_text("café\nthé\n", encoding="utf-8")
+        issues = [
+            Violation(target, "TaskStep", 2, 1, "first", Severity.WARNING, "thé"),
+            Violation(target, "TaskStep", 2, 3, "second", Severity.WARNING, "thé"),
+        ]
+        rule = Mock()
+        rule.name = "TaskStep"
+        rule.create_comment_flag.side_effect = lambda v: f"// ¶ {v.message}"
+        
+        apply_flags(rule, issues, Mock(), [target])
+        
+        assert target.read_text(encoding="utf-8") == "café\n// ¶ first\n// ¶ second\nthé\n"
 
 
 class TestGeneratePreparationReport:
@@ -277,6 +777,21 @@ class TestGeneratePreparationReport:
             # It's OK if it fails due to permissions/file system
             pass
     
+    def test_generate_preparation_report_contents(self, tmp_path):
+        """Test the sections written to the report file."""
+        session = SessionState()
+        session.journey_progress = {"repository_root": "/test/repo"}
+        session.applied_rules = ["EntityReference", "ContentType"]
+        
+        with patch("pathlib.Path.home", return_value=tmp_path):
+            report_path = generate_preparation_report(session)
+        
+        content = report_path.read_text(encoding="utf-8")
+        assert content.startswith("# Aditi Preparation Report\n\nGenerated: ")
+        assert "- Repository: /test/repo\n- Rules Applied: 2\n" in content
+        assert "## Rules Applied\n\n- EntityReference\n- ContentType\n" in content
+        assert content.endswith("5. Create a pull request with your changes\n")
+    
     def test_generate_preparation_report_error(self, capsys):
         """Test report generation error handling."""
         session = SessionState()
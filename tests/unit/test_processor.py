@@ -209,12 +209,53 @@ class TestRuleProcessor:
         output = processor._run_vale_on_files(files)
         
         assert output is not None
-        assert "test1.adoc" in output  # Verify the mock response is returned
+        assert "test1.adoc" in output  # Verify the decoded mock response is returned
         mock_vale_container.run_vale_raw.assert_called_once_with(
             ["--output=JSON", "test1.adoc", "test2.adoc"],
             Path.cwd()
         )
     
+    def test_run_vale_on_files_accepts_generator(self, processor, mock_vale_container):
+        """Test that file paths can be streamed from a generator."""
+        mock_vale_container.run_vale_raw.return_value = '{}'
+        
+        processor._run_vale_on_files(Path(f"test{i}.adoc") for i in range(3))
+        
+        mock_vale_container.run_vale_raw.assert_called_once_with(
+            ["--output=JSON", "test0.adoc", "test1.adoc", "test2.adoc"],
+            Path.cwd()
+        )
+    
+    def test_run_vale_on_files_shards_large_batches(self, processor, mock_vale_container):
+        """Test that large batches are split across Vale runs and merged."""
+        def run_vale_raw(args, project_root=None):
+            return json.dumps({arg: [] for arg in args if not arg.startswith("--")})
+        mock_vale_container.run_vale_raw.side_effect = run_vale_raw
+        files = [Path(f"doc{i:04d}.adoc") for i in range(1000)]
+        
+        with patch("aditi.processor.VALE_SHARD_WORKERS", 4):
+            output = processor._run_vale_on_files(files)
+        
+        assert mock_vale_container.run_vale_raw.call_count == 4
+        assert set(output) == {str(f) for f in files}
+    
+    def test_run_vale_on_files_reports_failed_shard(self, processor, mock_vale_container, capsys):
+        """Test that a shard without output is named and the batch is not used."""
+        def run_vale_raw(args, project_root=None):
+            if "doc0500.adoc" in args:
+                return ""
+            return json.dumps({arg: [] for arg in args if not arg.startswith("--")})
+        mock_vale_container.run_vale_raw.side_effect = run_vale_raw
+        files = [Path(f"doc{i:04d}.adoc") for i in range(1000)]
+        
+        with patch("aditi.processor.VALE_SHARD_WORKERS", 4):
+            output = processor._run_vale_on_files(files)
+        
+        assert output is None
+        captured = capsys.readouterr()
+        assert "shard 3/4" in captured.out
+        assert "doc0500.adoc to doc0749.adoc" in captured.out
+    
     def test_run_vale_on_files_error(self, processor, mock_vale_container):
         """Test handling Vale execution errors."""
         mock_vale_container.run_vale_raw.side_effect = Exception("Vale error")
@@ -303,4 +344,63 @@ class TestRuleProcessor:
         assert "Files processed: 2" in captured.out
         assert "Total issues: 3" in captured.out
         assert "Can be auto-fixed: 2" in captured.out
-        assert "67% of issues can be fixed automatically" in captured.out
\ No newline at end of file
+        assert "67% of issues can be fixed automatically" in captured.out
+    
+    def test_display_summary_exports_file_list(self, processor, tmp_path, monkeypatch):
+        """Test that the exported file list groups files under each rule."""
+        monkeypatch.chdir(tmp_path)
+        result = ProcessingResult(
+            violations_found=[
+                Violation(tmp_path / "b.adoc", "EntityReference", 1, 1, "msg", Severity.ERROR, "text"),
+                Violation(tmp_path / "a.adoc", "EntityReference", 2, 1, "msg", Severity.ERROR, "text"),
+            ],
+            fixes_applied=[],
+            fixes_skipped=[],
+            files_processed={tmp_path / "a.adoc", tmp_path / "b.adoc"},
+            files_modified=set(),
+            errors=[]
+        )
+        rule = Mock()
+        rule.name = "EntityReference"
+        rule.fix_type = FixType.FULLY_DETERMINISTIC
+        processor.rule_registry.get_all_rules.return_value = [rule]
+        processor.rule_registry.get_rule_for_violation.return_value = rule
+        export_path = tmp_path / "files.txt"
+        
+        processor.display_summary(result, export_files=export_path)
+        
+        lines = export_path.read_text().splitlines()
+        assert lines[0] == "# Aditi Check Results - Files with Issues"
+        assert lines[2:4] == ["# Total files: 2", "# Total issues: 2"]
+        assert lines[5:8] == ["## EntityReference (2 files)", "  - a.adoc", "  - b.adoc"]
+    
+    def test_display_summary_keeps_paths_outside_cwd(self, processor, tmp_path, monkeypatch, capsys):
+        """Test that files outside the working directory are listed by full path."""
+        work_dir = tmp_path / "work"
+        work_dir.mkdir()
+        monkeypatch.chdir(work_dir)
+        outside = tmp_path / "docs" / "a.adoc"
+        result = ProcessingResult(
+            violations_found=[
+                Violation(outside, "EntityReference", 1, 1, "msg", Severity.ERROR, "text"),
+                Violation(work_dir / "b.adoc", "EntityReference", 2, 1, "msg", Severity.ERROR, "text"),
+            ],
+            fixes_applied=[],
+            fixes_skipped=[],
+            files_processed={outside, work_dir / "b.adoc"},
+            files_modified=set(),
+            errors=[]
+        )
+        rule = Mock()
+        rule.name = "EntityReference"
+        rule.fix_type = FixType.FULLY_DETERMINISTIC
+        processor.rule_registry.get_all_rules.return_value = [rule]
+        processor.rule_registry.get_rule_for_violation.return_value = rule
+        export_path = tmp_path / "files.txt"
+        
+        processor.display_summary(result, show_all=True, export_files=export_path)
+        
+        assert f"  - {outside}" in export_path.read_text().splitlines()
+        assert "  - b.adoc" in export_path.read_text().splitlines()
+        captured = capsys.readouterr()
+        assert "a.adoc" in captured.out
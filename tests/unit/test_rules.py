@@ -315,6 +315,17 @@ class TestRuleRegistry:
         assert rule is not None
         assert isinstance(rule, EntityReferenceRule)
     
+    def test_by_name_tracks_registrations(self):
+        """Test that the by-name view reflects rules registered later."""
+        registry = RuleRegistry()
+        by_name = registry.by_name
+        assert "EntityReference" not in by_name
+        
+        registry.register(EntityReferenceRule)
+        assert isinstance(by_name["EntityReference"], EntityReferenceRule)
+        with pytest.raises(TypeError):
+            by_name["Other"] = EntityReferenceRule()
+    
     def test_get_rules_in_dependency_order(self):
         """Test getting rules sorted by dependencies."""
         registry = RuleRegistry()
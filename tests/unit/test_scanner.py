@@ -0,0 +1,71 @@
+"""Tests for the directory scanner."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from aditi.scanner import DirectoryScanner, count_adoc_files, iter_adoc_files, iter_adoc_paths
+
+
+class TestIterAdocFiles:
+    """Test the scandir-based .adoc walker."""
+
+    @pytest.fixture
+    def tree(self, tmp_path: Path) -> Path:
+        """Create a small documentation tree."""
+        (tmp_path / "modules" / "nested").mkdir(parents=True)
+        (tmp_path / ".hidden").mkdir()
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "index.adoc").write_text("= Index")
+        (tmp_path / "modules" / "con_a.adoc").write_text("= A")
+        (tmp_path / "modules" / "nested" / "proc_b.adoc").write_text("= B")
+        (tmp_path / "modules" / "image.png").write_bytes(b"")
+        (tmp_path / ".hidden" / "skip.adoc").write_text("= Hidden")
+        (tmp_path / "node_modules" / "skip.adoc").write_text("= Vendored")
+        return tmp_path
+
+    def test_finds_adoc_files_recursively(self, tree: Path):
+        """Test that .adoc files are found and pruned directories skipped."""
+        found = {p.relative_to(tree) for p in iter_adoc_files(tree)}
+        assert found == {
+            Path("index.adoc"),
+            Path("modules/con_a.adoc"),
+            Path("modules/nested/proc_b.adoc"),
+        }
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks not supported")
+    def test_symlink_handling(self, tree: Path):
+        """Test that symlinked files honor ignore_symlinks and directories are not followed."""
+        (tree / "link.adoc").symlink_to(tree / "index.adoc")
+        (tree / "linked_dir").symlink_to(tree / "modules")
+
+        ignored = {p.name for p in iter_adoc_files(tree, ignore_symlinks=True)}
+        followed = {p.name for p in iter_adoc_files(tree, ignore_symlinks=False)}
+
+        assert "link.adoc" not in ignored
+        assert "link.adoc" in followed
+        assert sorted(followed) == sorted({"index.adoc", "link.adoc", "con_a.adoc", "proc_b.adoc"})
+
+    def test_missing_root_yields_nothing(self, tmp_path: Path):
+        """Test that an unreadable or missing root is skipped quietly."""
+        assert list(iter_adoc_files(tmp_path / "missing")) == []
+
+    def test_iter_adoc_paths_yields_strings(self, tree: Path):
+        """Test that the string walk finds the same files as iter_adoc_files."""
+        paths = list(iter_adoc_paths(tree))
+        assert all(isinstance(p, str) for p in paths)
+        assert {Path(p) for p in paths} == set(iter_adoc_files(tree))
+
+    def test_count_adoc_files(self, tree: Path):
+        """Test that counting matches the walk and stops at the limit."""
+        assert count_adoc_files(tree) == 3
+        assert count_adoc_files(tree, limit=2) == 2
+        assert count_adoc_files(tree / "modules" / "nested") == 1
+
+    def test_iter_adoc_dirs_matches_scan(self, tree: Path):
+        """Test that the streaming directory scan yields what the full scan returns."""
+        scanner = DirectoryScanner()
+        streamed = dict(scanner.iter_adoc_dirs(tree))
+        assert streamed == {Path("."): 1, Path("modules"): 1, Path("modules/nested"): 1}
+        assert scanner.scan_for_adoc_files(tree) == streamed
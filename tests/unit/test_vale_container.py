@@ -0,0 +1,109 @@
+"""Unit tests for Vale container management."""
+
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from aditi import vale_container
+from aditi.vale_container import (
+    ValeContainer,
+    check_container_runtime,
+    get_shared_container,
+    release_shared_container,
+)
+
+
+class TestSharedContainer:
+    """Test the process-wide shared container manager."""
+
+    @pytest.fixture(autouse=True)
+    def reset_shared(self):
+        """Reset the shared container state around each test."""
+        with patch.object(vale_container, "_shared_container", None), \
+             patch.object(vale_container, "_shared_refs", 0), \
+             patch.object(ValeContainer, "_check_runtime_available"):
+            yield
+
+    def test_instance_is_reused(self):
+        """Test that later commands get the same manager."""
+        with patch.object(ValeContainer, "cleanup"):
+            first = get_shared_container()
+            release_shared_container()
+            second = get_shared_container()
+            release_shared_container()
+        assert first is second
+
+    def test_cleanup_waits_for_last_release(self):
+        """Test that containers are cleaned up only when the last user releases."""
+        with patch.object(ValeContainer, "cleanup") as mock_cleanup:
+            get_shared_container()
+            get_shared_container()
+            release_shared_container()
+            mock_cleanup.assert_not_called()
+            release_shared_container()
+            mock_cleanup.assert_called_once()
+
+    def test_unbalanced_release_is_ignored(self):
+        """Test that releasing without a reference does nothing."""
+        with patch.object(ValeContainer, "cleanup") as mock_cleanup:
+            release_shared_container()
+        mock_cleanup.assert_not_called()
+
+
+class TestEnsureImageExists:
+    """Test the Vale image presence check."""
+
+    @pytest.fixture(autouse=True)
+    def reset_verified(self):
+        """Start each test with no verified runtimes."""
+        with patch.object(ValeContainer, "_image_verified_runtimes", set()), \
+             patch.object(ValeContainer, "_check_runtime_available"):
+            yield
+
+    def test_image_checked_once_per_process(self):
+        """Test that separate instances share the verified-image state."""
+        with patch("aditi.vale_container.subprocess.run") as mock_run:
+            ValeContainer().ensure_image_exists()
+            ValeContainer().ensure_image_exists()
+        mock_run.assert_called_once()
+
+    def test_missing_image_is_pulled(self):
+        """Test that a missing image is pulled and then remembered."""
+        inspect_error = subprocess.CalledProcessError(1, "podman image inspect")
+        container = ValeContainer()
+        with patch("aditi.vale_container.subprocess.run", side_effect=inspect_error), \
+             patch.object(ValeContainer, "pull_image") as mock_pull:
+            container.ensure_image_exists()
+            container.ensure_image_exists()
+        mock_pull.assert_called_once()
+
+
+class TestCheckContainerRuntime:
+    """Test container runtime detection."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Reset the cached runtime around each test."""
+        check_container_runtime.cache_clear()
+        yield
+        check_container_runtime.cache_clear()
+
+    def test_falls_back_to_docker_and_caches(self):
+        """Test that docker is used without podman and the probe runs once."""
+        def run(cmd, **kwargs):
+            if cmd[0] == "podman":
+                raise FileNotFoundError(cmd[0])
+
+        with patch("aditi.vale_container.subprocess.run", side_effect=run) as mock_run:
+            assert check_container_runtime() == "docker"
+            assert check_container_runtime() == "docker"
+        assert mock_run.call_count == 2  # podman, then docker, on the first call only
+
+    def test_missing_runtime_is_not_cached(self):
+        """Test that a failed probe is retried on the next call."""
+        with patch("aditi.vale_container.subprocess.run", side_effect=FileNotFoundError):
+            with pytest.raises(RuntimeError):
+                check_container_runtime()
+        with patch("aditi.vale_container.subprocess.run"):
+            assert check_container_runtime() == "podman"
@@ -3,6 +3,7 @@
 import json
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
 from aditi.vale_parser import ValeParser, Violation, Severity
 
@@ -89,6 +90,16 @@ class TestValeParser:
         with pytest.raises(json.JSONDecodeError):
             parser.parse_json_output("invalid json {")
     
+    def test_parse_with_stdlib_json(self, sample_vale_output):
+        """Test that parsing gives the same result without the optional orjson decoder."""
+        parser = ValeParser()
+        expected = parser.parse_json_output(sample_vale_output)
+        
+        with patch("aditi.vale_parser._loads_json", json.loads):
+            assert parser.parse_json_output(sample_vale_output) == expected
+            with pytest.raises(json.JSONDecodeError):
+                parser.parse_json_output("invalid json {")
+    
     def test_parse_empty_output(self):
         """Test parsing empty Vale output."""
         parser = ValeParser()
@@ -122,6 +133,22 @@ class TestValeParser:
         assert len(grouped["ContentType"]) == 1
         assert len(grouped["TaskSection"]) == 1
     
+    def test_sample_by_rule(self):
+        """Test counting violations per rule while keeping only the first few."""
+        parser = ValeParser()
+        violations = [
+            Violation(Path(f"f{i}.adoc"), "EntityReference", i, 1, "msg", Severity.ERROR, "")
+            for i in range(5)
+        ] + [Violation(Path("g.adoc"), "ContentType", 1, 1, "msg", Severity.WARNING, "")]
+        
+        sampled = parser.sample_by_rule(violations, limit=2)
+        
+        assert list(sampled) == ["EntityReference", "ContentType"]
+        count, kept = sampled["EntityReference"]
+        assert count == 5
+        assert [v.line for v in kept] == [0, 1]
+        assert sampled["ContentType"] == (1, [violations[-1]])
+    
     def test_filter_by_severity(self, sample_vale_output):
         """Test filtering violations by severity."""
         parser = ValeParser()